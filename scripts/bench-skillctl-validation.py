@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Per-run schema validation overhead in skillctl, before and after validator caching.
+
+"uncached" repeats what every `skillctl run` used to do (jsonschema.validate on
+the contract, input and output schemas: meta-schema check plus validator
+construction each time). "new process" is a fresh ValidatorCache that only has
+the persisted checked-schema set, i.e. the first validation in a later
+process; "warm" reuses compiled validators within one process (any command
+that validates more than once).
+"""
+
+import argparse
+import importlib.util
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SKILL_DIR = ROOT / "skills" / "_template"
+
+
+def load_skillctl():
+    spec = importlib.util.spec_from_file_location("skillctl", ROOT / "scripts" / "skillctl.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["skillctl"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    skillctl = load_skillctl()
+    skillctl._require_deps()
+    jsonschema = skillctl.jsonschema
+
+    manifest = skillctl._load_yaml(SKILL_DIR / "skill.yaml")
+    contract = skillctl._load_contract_schema(ROOT / "skills")
+    input_schema = skillctl._load_json(SKILL_DIR / manifest["io"]["inputSchema"])
+    output_schema = skillctl._load_json(SKILL_DIR / manifest["io"]["outputSchema"])
+    instance = json.loads((SKILL_DIR / "fixtures" / "input.json").read_text(encoding="utf-8"))
+    output = json.loads((SKILL_DIR / "fixtures" / "output.expected.json").read_text(encoding="utf-8"))
+    pairs = ((manifest, contract), (instance, input_schema), (output, output_schema))
+
+    def uncached() -> None:
+        for obj, schema in pairs:
+            jsonschema.validate(instance=obj, schema=schema)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Path(tmp) / "validators.json"
+        seed = skillctl.ValidatorCache()
+        seed.attach(store)
+        for obj, schema in pairs:
+            seed.validate(obj, schema)
+        seed.save()
+
+        def new_process() -> None:
+            cache = skillctl.ValidatorCache()
+            cache.attach(store)
+            for obj, schema in pairs:
+                cache.validate(obj, schema)
+
+        warm_cache = skillctl.ValidatorCache()
+
+        def warm() -> None:
+            for obj, schema in pairs:
+                warm_cache.validate(obj, schema)
+
+        results = {
+            "uncached": measure(uncached, args.iterations),
+            "new process": measure(new_process, args.iterations),
+            "warm": measure(warm, args.iterations),
+        }
+
+    baseline = results["uncached"]
+    print(f"Schema validation per run (median of {args.iterations}, contract + input + output):")
+    for label, value in results.items():
+        print(f"  {label:<12} {value:8.3f} ms  ({baseline / value:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
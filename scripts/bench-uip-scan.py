@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Throughput of the UIP boundary scan: lexer-aware scan vs. raw regex vs. rg/grep.
+
+Generates a synthetic JS/TS/Python corpus (comments, strings, templates, regex
+literals, imports) and times, per pass over the whole corpus:
+
+  lexed   check-uip-boundaries' scanner with the JS/Python lexer (the real scan)
+  raw     the same compiled rules over the unlexed text (no masking)
+  rg/grep the markup tokens as one alternation, `rg -c` if installed, else
+          `grep -cE` (includes process start, as the shell checks ran them)
+"""
+
+import argparse
+import importlib.util
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+JS_SNIPPETS = (
+    'import {{ Thing{n} }} from "../lib/thing{n}";\n',
+    "// TODO: render <div> in the adapter, not here ({n})\n",
+    "/* block comment {n}\n * with className= and tailwind mentions\n */\n",
+    'const label{n} = "bg-red-{n} is just a string";\n',
+    "const t{n} = `value ${{a{n} + 1}} and <form> text`;\n",
+    "const r{n} = /<input[^>]*>/g.test(s{n}) ? a{n} / b{n} : 0;\n",
+    "export function f{n}(x) {{ return {{ id: x, next: x + {n} }}; }}\n",
+)
+PY_SNIPPETS = (
+    "from ..skills.s{n} import helper{n}\n",
+    "# comment with <div> and tailwind {n}\n",
+    'DOC{n} = """\n<select> inside a docstring {n}\n"""\n',
+    "value{n} = f\"{{x}}<button>{n}\" if y else r'<input'\n",
+    "def g{n}(a, b):\n    return a * {n} + b\n",
+)
+
+
+def load_boundaries():
+    spec = importlib.util.spec_from_file_location("check_uip_boundaries", ROOT / "scripts" / "check-uip-boundaries.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(ROOT / "scripts"))
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_corpus(base: Path, files: int, lines: int) -> list[Path]:
+    rng = random.Random(7)
+    paths = []
+    for index in range(files):
+        python = index % 3 == 0
+        snippets = PY_SNIPPETS if python else JS_SNIPPETS
+        path = base / "skills" / f"s{index % 40}" / f"m{index}.{'py' if python else 'tsx'}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(rng.choice(snippets).format(n=i) for i in range(lines)), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def measure(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=600)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    boundaries = load_boundaries()
+    from uip_scan import language_for
+
+    scanner = boundaries.SCANNER
+    roles = frozenset({"markup", "skill"})
+    tokens = [token for rule in boundaries.BOUNDARY_RULES if "markup" in rule.roles for token in rule.tokens]
+    alternation = "|".join(token if "\\" in token or "(" in token else token.replace(".", "\\.") for token in tokens)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(Path(tmp), args.files, args.lines)
+        texts = [(path.read_text(encoding="utf-8"), language_for(path)) for path in paths]
+        megabytes = sum(len(text.encode("utf-8")) for text, _ in texts) / 1e6
+
+        def lexed() -> None:
+            for text, language in texts:
+                scanner.scan_text(text, roles, language)
+
+        def raw() -> None:
+            for text, _ in texts:
+                scanner.scan_text(text, roles, None)
+
+        results = {"lexed": measure(lexed, args.iterations), "raw": measure(raw, args.iterations)}
+        tool = "rg" if shutil.which("rg") else "grep"
+        command = (
+            ["rg", "-c", "--no-messages", "-e", alternation, str(Path(tmp) / "skills")]
+            if tool == "rg"
+            else ["grep", "-rcE", alternation, str(Path(tmp) / "skills")]
+        )
+        results[tool] = measure(lambda: subprocess.run(command, capture_output=True), args.iterations)
+
+    print(f"Boundary scan over {args.files} files, {megabytes:.1f} MB (median of {args.iterations}):")
+    baseline = results[tool]
+    for label, seconds in results.items():
+        rate = megabytes / seconds
+        print(f"  {label:<6} {seconds * 1000:9.1f} ms  {rate:7.1f} MB/s  ({seconds / baseline:5.1f}x {tool})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+#!/usr/bin/env bash
+# Changed paths for the invariant and boundary checks, one per line, sorted.
+# CI (GITHUB_ACTIONS with GITHUB_BASE_REF): origin/<base>...HEAD.
+# Locally: staged, unstaged and untracked files.
+# Source this file for get_changed_files, or run it to print the list.
+
+get_changed_files() {
+  local staged unstaged untracked
+  if [[ -n "${GITHUB_ACTIONS:-}" && -n "${GITHUB_BASE_REF:-}" ]]; then
+    git fetch origin "${GITHUB_BASE_REF}" --depth=1 >/dev/null 2>&1 || true
+    git diff --name-only "origin/${GITHUB_BASE_REF}...HEAD" | sed '/^$/d' | sort -u
+    return
+  fi
+  staged=$(git diff --name-only --cached || true)
+  unstaged=$(git diff --name-only || true)
+  untracked=$(git ls-files --others --exclude-standard || true)
+  printf "%s\n" "$staged" "$unstaged" "$untracked" | sed '/^$/d' | sort -u
+}
+
+if [[ "${BASH_SOURCE[0]}" == "$0" ]]; then
+  set -euo pipefail
+  get_changed_files
+fi
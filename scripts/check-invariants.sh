@@ -7,18 +7,8 @@ if [[ "$profile" != "SAFE" && "$profile" != "FAST" ]]; then
   exit 1
 fi
 
-get_changed_files() {
-  local staged unstaged untracked
-  if [[ -n "${GITHUB_ACTIONS:-}" && -n "${GITHUB_BASE_REF:-}" ]]; then
-    git fetch origin "${GITHUB_BASE_REF}" --depth=1 >/dev/null 2>&1 || true
-    git diff --name-only "origin/${GITHUB_BASE_REF}...HEAD" | sed '/^$/d' | sort -u
-    return
-  fi
-  staged=$(git diff --name-only --cached || true)
-  unstaged=$(git diff --name-only || true)
-  untracked=$(git ls-files --others --exclude-standard || true)
-  printf "%s\n" "$staged" "$unstaged" "$untracked" | sed '/^$/d' | sort -u
-}
+# shellcheck source=changed-files.sh
+source "$(dirname -- "${BASH_SOURCE[0]}")/changed-files.sh"
 
 changed_files=$(get_changed_files)
 
@@ -1,20 +1,88 @@
 #!/usr/bin/env python3
+import argparse
+import functools
+import hashlib
 import json
+import os
 import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 import importlib.util
 
+from uip_scan import MultiTokenScanner, TokenRule, iter_source_files
 from uip_yaml import YamlError, load_yaml
 
 ROOT = Path(__file__).resolve().parent.parent
 MANIFEST_PATH = ROOT / "ui-contracts/renderers.yaml"
+VALIDATOR_PATH = ROOT / "skills/ui-intent-emit/impl/run.py"
+CACHE_PATH = ROOT / ".uip-cache" / "renderer-certification.json"
+CACHE_VERSION = 1
+# Changing the rule set or scanner must invalidate every cached certification.
+RULE_SOURCES = (Path(__file__).resolve(), Path(__file__).resolve().parent / "uip_scan.py")
 
 REQUIRED_EVENT_FIELDS = {"intentId", "uiSessionId", "idempotencyKey", "schemaVersion"}
 NONDETERMINISTIC_TOKENS = ("Math.random", "Date.now", "new Date(", "crypto.randomUUID")
 
-
-def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> None:
+ALL_ROLES = frozenset({"entrypoint", "adapter", "source"})
+RENDERER_RULES = (
+    TokenRule(
+        "UIP-BOUNDARY-VIOLATION",
+        "renderer.imports",
+        ("concepts/", "agents/", "skills/"),
+        "Remove domain/agent/skill imports from renderer code.",
+        ALL_ROLES,
+        context="import",
+    ),
+    TokenRule(
+        "UIP-BOUNDARY-VIOLATION",
+        "renderer.determinism",
+        NONDETERMINISTIC_TOKENS,
+        "Remove nondeterministic call ({token}).",
+        ALL_ROLES,
+        context="code",
+    ),
+    TokenRule(
+        "UIP-BOUNDARY-VIOLATION",
+        "renderer.styling",
+        ("tailwindTokens",),
+        "Use adapter token imports for styling.",
+        frozenset({"adapter"}),
+        required=True,
+        context="code",
+    ),
+    TokenRule(
+        "UIP-BOUNDARY-VIOLATION",
+        "renderer.styling",
+        ('className="', "className='"),
+        "Avoid inline className strings; use token references.",
+        frozenset({"adapter"}),
+        context="code",
+    ),
+    TokenRule(
+        "UIP-BOUNDARY-VIOLATION",
+        "renderer.input.validation",
+        ("assertValidUiIntent", "validateUiIntent"),
+        "Call assertValidUiIntent or validateUiIntent before rendering.",
+        frozenset({"entrypoint"}),
+        required=True,
+        context="code",
+    ),
+)
+SCANNER = MultiTokenScanner(RENDERER_RULES)
+
+
+class CertificationFailure(Exception):
+    pass
+
+
+def format_violation(
+    category: str,
+    file_path: Union[Path, str],
+    rule: str,
+    suggestion: str,
+    line: Optional[int] = None,
+) -> str:
     if isinstance(file_path, Path):
         try:
             display_path: Union[Path, str] = file_path.relative_to(ROOT)
@@ -22,15 +90,17 @@ def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str)
             display_path = file_path
     else:
         display_path = file_path
-    message = (
-        f"{category} | file: {display_path} | rule: {rule} | suggestion: {suggestion}"
-    )
-    print(message, file=sys.stderr)
-    raise SystemExit(1)
+    if line is not None:
+        display_path = f"{display_path}:{line}"
+    return f"{category} | file: {display_path} | rule: {rule} | suggestion: {suggestion}"
+
+
+def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> None:
+    raise CertificationFailure(format_violation(category, file_path, rule, suggestion))
 
 
 def load_intent_validator():
-    module_path = ROOT / "skills/ui-intent-emit/impl/run.py"
+    module_path = VALIDATOR_PATH
     spec = importlib.util.spec_from_file_location("ui_intent_run", module_path)
     if spec is None or spec.loader is None:
         fail(
@@ -79,7 +149,9 @@ def load_manifest() -> list[dict[str, Any]]:
     return renderers
 
 
+@functools.lru_cache(maxsize=None)
 def read_json(path: Path) -> Any:
+    # Fixtures are commonly shared across renderer targets; parse each once per run.
     try:
         return json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError:
@@ -125,148 +197,332 @@ def validate_event_fixture(path: Path, payload: Any) -> None:
         )
 
 
-def ensure_no_disallowed_imports(path: Path, text: str) -> None:
-    for token in ("concepts/", "agents/", "skills/"):
-        if token in text:
+def collect_scan_targets(entry_path: Path, adapter_path: Path, sources: list[str]) -> dict[Path, set[str]]:
+    targets: dict[Path, set[str]] = {}
+    targets.setdefault(entry_path.resolve(), set()).add("entrypoint")
+    targets.setdefault(adapter_path.resolve(), set()).add("adapter")
+    for source in sources:
+        source_path = ROOT / source
+        if not source_path.exists():
             fail(
-                "UIP-BOUNDARY-VIOLATION",
-                path,
-                "renderer.imports",
-                "Remove domain/agent/skill imports from renderer code.",
+                "UIP-STRUCTURAL-VIOLATION",
+                source_path,
+                "renderer.sources",
+                "Ensure every renderer source path exists.",
+            )
+        for path in iter_source_files(source_path):
+            targets.setdefault(path.resolve(), set()).add("source")
+    return targets
+
+
+def scan_renderer_sources(targets: dict[Path, set[str]]) -> list[str]:
+    messages: list[str] = []
+    for path in sorted(targets):
+        result = SCANNER.scan_file(path, targets[path])
+        for rule in result.missing:
+            messages.append(format_violation(rule.category, path, rule.rule, rule.suggestion))
+        for hit in result.hits:
+            suggestion = hit.rule.suggestion.format(token=hit.token)
+            messages.append(
+                format_violation(hit.rule.category, path, hit.rule.rule, suggestion, hit.line)
             )
+    return messages
 
 
-def ensure_determinism(path: Path, text: str) -> None:
-    for token in NONDETERMINISTIC_TOKENS:
-        if token in text:
-            fail(
-                "UIP-BOUNDARY-VIOLATION",
-                path,
-                "renderer.determinism",
-                f"Remove nondeterministic call ({token}).",
-            )
+class FileHasher:
+    """Content hashes memoized by (mtime, size) so unchanged inputs are not re-read."""
+
+    def __init__(self, memo: dict[str, list[Any]]) -> None:
+        self.memo = memo
+        self.used: dict[str, list[Any]] = {}
+
+    def digest(self, path: Path) -> str:
+        key = str(path)
+        st = path.stat()
+        signature = [st.st_mtime_ns, st.st_size]
+        cached = self.memo.get(key)
+        if cached is not None and cached[:2] == signature:
+            self.used[key] = cached
+            return cached[2]
+        value = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.memo[key] = self.used[key] = [*signature, value]
+        return value
 
 
-def ensure_tokenized_styling(path: Path, text: str) -> None:
-    if "tailwindTokens" not in text:
+def load_cache(enabled: bool) -> dict[str, Any]:
+    empty: dict[str, Any] = {"version": CACHE_VERSION, "files": {}, "results": {}}
+    if not enabled:
+        return empty
+    try:
+        data = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return empty
+    if not isinstance(data.get("files"), dict) or not isinstance(data.get("results"), dict):
+        return empty
+    return data
+
+
+def save_cache(hasher: FileHasher, results: dict[str, list[str]]) -> None:
+    payload = {"version": CACHE_VERSION, "files": hasher.used, "results": results}
+    tmp_name: Optional[str] = None
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".renderer-cert.", suffix=".tmp", dir=str(CACHE_PATH.parent))
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp_name, CACHE_PATH)
+    except OSError:
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def renderer_cache_key(
+    renderer: dict[str, Any],
+    targets: dict[Path, set[str]],
+    fixtures: list[Path],
+    shared_key: str,
+    hasher: FileHasher,
+) -> str:
+    material = {
+        "renderer": renderer,
+        "shared": shared_key,
+        "sources": [[str(path), sorted(targets[path]), hasher.digest(path)] for path in sorted(targets)],
+        "fixtures": [[str(path), hasher.digest(path)] for path in fixtures],
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def certify_fixtures(
+    validate_intent_fn: Any,
+    intent_fixture: str,
+    invalid_intent_fixture: str,
+    event_fixture: str,
+) -> None:
+    valid_intent = read_json(ROOT / intent_fixture)
+    intent_errors = validate_intent_fn(valid_intent)
+    if intent_errors:
         fail(
-            "UIP-BOUNDARY-VIOLATION",
-            path,
-            "renderer.styling",
-            "Use adapter token imports for styling.",
+            "UIP-SCHEMA-VIOLATION",
+            ROOT / intent_fixture,
+            "renderer.input.valid",
+            "Fix the valid UIIntent fixture to pass validation.",
         )
-    if 'className="' in text or "className='" in text:
+
+    invalid_payload = read_json(ROOT / invalid_intent_fixture)
+    invalid_intent = invalid_payload.get("intent") if isinstance(invalid_payload, dict) else None
+    if invalid_intent is None:
+        invalid_intent = invalid_payload
+    invalid_errors = validate_intent_fn(invalid_intent)
+    if not invalid_errors:
         fail(
-            "UIP-BOUNDARY-VIOLATION",
-            path,
-            "renderer.styling",
-            "Avoid inline className strings; use token references.",
+            "UIP-SCHEMA-VIOLATION",
+            ROOT / invalid_intent_fixture,
+            "renderer.input.invalid",
+            "Provide an invalid UIIntent fixture that fails validation.",
         )
-
-
-def ensure_validation_call(path: Path, text: str) -> None:
-    if "assertValidUiIntent" not in text and "validateUiIntent" not in text:
+    if not any(error.get("path") == "schemaVersion" for error in invalid_errors):
         fail(
-            "UIP-BOUNDARY-VIOLATION",
-            path,
-            "renderer.input.validation",
-            "Call assertValidUiIntent or validateUiIntent before rendering.",
+            "UIP-SCHEMA-VIOLATION",
+            ROOT / invalid_intent_fixture,
+            "renderer.input.schemaVersion",
+            "Ensure the invalid fixture triggers schemaVersion rejection.",
         )
 
+    event_payload = read_json(ROOT / event_fixture)
+    validate_event_fixture(ROOT / event_fixture, event_payload)
 
-def main() -> None:
-    intent_module = load_intent_validator()
-    validate_intent_fn = getattr(intent_module, "validate_intent")
-    renderers = load_manifest()
 
-    for renderer in renderers:
-        if not isinstance(renderer, dict):
+# Picklable unit of work for a pool process: scan targets as (path, roles) and the fixture paths.
+CertificationJob = tuple[list[tuple[str, list[str]]], tuple[str, str, str]]
+
+
+@functools.lru_cache(maxsize=None)
+def intent_validator() -> Any:
+    # Loaded once per process, and only when some renderer actually needs certifying.
+    return getattr(load_intent_validator(), "validate_intent")
+
+
+def run_certification(job: CertificationJob) -> list[str]:
+    """Scan one renderer's sources and check its fixtures. Runs in pool workers."""
+    sources, fixtures = job
+    messages = scan_renderer_sources({Path(path): set(roles) for path, roles in sources})
+    try:
+        certify_fixtures(intent_validator(), *fixtures)
+    except CertificationFailure as exc:
+        messages.append(str(exc))
+    return messages
+
+
+def plan_renderer(renderer: Any, shared_key: str, hasher: FileHasher) -> tuple[str, CertificationJob]:
+    """Check a manifest entry's structure; return its cache key and the work to certify it."""
+    if not isinstance(renderer, dict):
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            MANIFEST_PATH,
+            "renderer.manifest",
+            "Renderer entries must be mappings.",
+        )
+    entrypoint = renderer.get("entrypoint")
+    adapter = renderer.get("adapter")
+    intent_fixture = renderer.get("intentFixture")
+    invalid_intent_fixture = renderer.get("invalidIntentFixture")
+    event_fixture = renderer.get("eventFixture")
+
+    for key, value in [
+        ("entrypoint", entrypoint),
+        ("adapter", adapter),
+        ("intentFixture", intent_fixture),
+        ("invalidIntentFixture", invalid_intent_fixture),
+        ("eventFixture", event_fixture),
+    ]:
+        if not isinstance(value, str) or not value.strip():
             fail(
                 "UIP-STRUCTURAL-VIOLATION",
                 MANIFEST_PATH,
                 "renderer.manifest",
-                "Renderer entries must be mappings.",
+                f"Set {key} to a non-empty path string.",
             )
-        entrypoint = renderer.get("entrypoint")
-        adapter = renderer.get("adapter")
-        intent_fixture = renderer.get("intentFixture")
-        invalid_intent_fixture = renderer.get("invalidIntentFixture")
-        event_fixture = renderer.get("eventFixture")
-
-        for key, value in [
-            ("entrypoint", entrypoint),
-            ("adapter", adapter),
-            ("intentFixture", intent_fixture),
-            ("invalidIntentFixture", invalid_intent_fixture),
-            ("eventFixture", event_fixture),
-        ]:
-            if not isinstance(value, str) or not value.strip():
-                fail(
-                    "UIP-STRUCTURAL-VIOLATION",
-                    MANIFEST_PATH,
-                    "renderer.manifest",
-                    f"Set {key} to a non-empty path string.",
-                )
-
-        entry_path = ROOT / entrypoint
-        adapter_path = ROOT / adapter
-        if not entry_path.exists():
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                entry_path,
-                "renderer.entrypoint",
-                "Ensure the renderer entrypoint file exists.",
-            )
-        if not adapter_path.exists():
+
+    entry_path = ROOT / entrypoint
+    adapter_path = ROOT / adapter
+    if not entry_path.exists():
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            entry_path,
+            "renderer.entrypoint",
+            "Ensure the renderer entrypoint file exists.",
+        )
+    if not adapter_path.exists():
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            adapter_path,
+            "renderer.adapter",
+            "Ensure the renderer adapter file exists.",
+        )
+    fixtures = [ROOT / intent_fixture, ROOT / invalid_intent_fixture, ROOT / event_fixture]
+    for fixture in fixtures:
+        if not fixture.is_file():
             fail(
                 "UIP-STRUCTURAL-VIOLATION",
-                adapter_path,
-                "renderer.adapter",
-                "Ensure the renderer adapter file exists.",
+                fixture,
+                "renderer.fixture",
+                "Ensure every renderer fixture file exists.",
             )
 
-        entry_text = entry_path.read_text(encoding="utf-8")
-        adapter_text = adapter_path.read_text(encoding="utf-8")
+    sources = renderer.get("sources", [])
+    if not isinstance(sources, list) or not all(
+        isinstance(item, str) and item.strip() for item in sources
+    ):
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            MANIFEST_PATH,
+            "renderer.manifest",
+            "Set sources to a list of renderer file or directory paths.",
+        )
+    targets = collect_scan_targets(entry_path, adapter_path, sources)
 
-        ensure_validation_call(entry_path, entry_text)
-        ensure_no_disallowed_imports(entry_path, entry_text)
-        ensure_no_disallowed_imports(adapter_path, adapter_text)
-        ensure_determinism(entry_path, entry_text)
-        ensure_determinism(adapter_path, adapter_text)
-        ensure_tokenized_styling(adapter_path, adapter_text)
+    key = renderer_cache_key(renderer, targets, fixtures, shared_key, hasher)
+    sources_job = [(str(path), sorted(targets[path])) for path in sorted(targets)]
+    return key, (sources_job, (intent_fixture, invalid_intent_fixture, event_fixture))
 
-        valid_intent = read_json(ROOT / intent_fixture)
-        intent_errors = validate_intent_fn(valid_intent)
-        if intent_errors:
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                ROOT / intent_fixture,
-                "renderer.input.valid",
-                "Fix the valid UIIntent fixture to pass validation.",
-            )
 
-        invalid_payload = read_json(ROOT / invalid_intent_fixture)
-        invalid_intent = invalid_payload.get("intent") if isinstance(invalid_payload, dict) else None
-        if invalid_intent is None:
-            invalid_intent = invalid_payload
-        invalid_errors = validate_intent_fn(invalid_intent)
-        if not invalid_errors:
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                ROOT / invalid_intent_fixture,
-                "renderer.input.invalid",
-                "Provide an invalid UIIntent fixture that fails validation.",
-            )
-        if not any(error.get("path") == "schemaVersion" for error in invalid_errors):
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                ROOT / invalid_intent_fixture,
-                "renderer.input.schemaVersion",
-                "Ensure the invalid fixture triggers schemaVersion rejection.",
-            )
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Certify renderers listed in ui-contracts/renderers.yaml."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(32, os.cpu_count() or 1),
+        help="Processes certifying uncached renderers (default: CPU count, max 32).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-certify every renderer and do not persist results.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Report how many renderers were certified vs. served from the cache.",
+    )
+    return parser.parse_args()
+
 
-        event_payload = read_json(ROOT / event_fixture)
-        validate_event_fixture(ROOT / event_fixture, event_payload)
+def certify(args: argparse.Namespace) -> int:
+    renderers = load_manifest()
+    if not VALIDATOR_PATH.is_file():
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            VALIDATOR_PATH,
+            "renderer.intent.validator",
+            "Ensure the UI intent validator is present and importable.",
+        )
+
+    cache = load_cache(not args.no_cache)
+    hasher = FileHasher(cache["files"])
+    shared_key = "|".join(hasher.digest(path) for path in (VALIDATOR_PATH, *RULE_SOURCES))
+
+    outcomes: list[tuple[Optional[str], list[str]]] = []
+    pending: list[tuple[int, CertificationJob]] = []
+    served = 0
+    for renderer in renderers:
+        try:
+            key, job = plan_renderer(renderer, shared_key, hasher)
+        except CertificationFailure as exc:
+            outcomes.append((None, [str(exc)]))
+            continue
+        cached = cache["results"].get(key)
+        if cached is None:
+            pending.append((len(outcomes), job))
+        else:
+            served += 1
+        outcomes.append((key, cached or []))
+
+    if pending:
+        intent_validator()
+        jobs = max(1, min(args.jobs, len(pending)))
+        if jobs > 1:
+            # Scanning is pure-Python CPU work, so renderers are spread over processes, not threads.
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                certified = list(pool.map(run_certification, [job for _, job in pending]))
+        else:
+            certified = [run_certification(job) for _, job in pending]
+        for (index, _), messages in zip(pending, certified):
+            outcomes[index] = (outcomes[index][0], messages)
+
+    results: dict[str, list[str]] = {}
+    failed = False
+    for key, messages in outcomes:
+        for message in messages:
+            print(message, file=sys.stderr)
+        failed = failed or bool(messages)
+        if key is not None:
+            results[key] = messages
+
+    if args.stats:
+        print(
+            f"renderer certification: {len(renderers)} renderers, {len(pending)} certified, "
+            f"{served} from cache",
+            file=sys.stderr,
+        )
+    if not args.no_cache:
+        save_cache(hasher, results)
+    return 1 if failed else 0
+
+
+def main() -> None:
+    args = parse_args()
+    try:
+        raise SystemExit(certify(args))
+    except CertificationFailure as exc:
+        print(exc, file=sys.stderr)
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
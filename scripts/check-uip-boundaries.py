@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from uip_scan import MultiTokenScanner, PRUNED_DIRS, TokenRule, iter_source_files, language_for
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_PATH = ROOT / ".uip-cache" / "boundary-scan.json"
+CACHE_VERSION = 2
+# Results are content-addressed, so other branches' entries stay useful; the
+# least recently used beyond this many are dropped.
+CACHE_MAX_RESULTS = 20000
+# Changing the rule table or scanner must invalidate every cached result.
+RULE_SOURCES = (Path(__file__).resolve(), Path(__file__).resolve().parent / "uip_scan.py")
+
+CATEGORY = "UIP-BOUNDARY-VIOLATION"
+MARKUP_SUFFIXES = (".ts", ".tsx", ".js", ".jsx")
+IMPORT_SUFFIXES = (".ts", ".tsx", ".js", ".jsx", ".py")
+
+# Repo-relative globs; "**" spans directories, "*" stays within one.
+SCAN_EXCLUDES = (
+    "concepts/**/adapter/**",
+    "ui-adapters/**",
+    "renderer/**",
+    "renderers/**",
+    "ui-patterns/**",
+)
+BOUNDARY_EXCLUDES: tuple[str, ...] = ()
+
+
+class Scope:
+    """Which files a role covers: top-level directories, suffixes and excluded globs."""
+
+    def __init__(self, dirs: Iterable[str], suffixes: tuple[str, ...], excludes: Iterable[str]) -> None:
+        self.dirs = tuple(dirs)
+        self.suffixes = suffixes
+        self.excludes = tuple(glob_regex(pattern) for pattern in excludes)
+
+    def covers(self, rel: str) -> bool:
+        if rel.split("/", 1)[0] not in self.dirs or not rel.endswith(self.suffixes):
+            return False
+        return not any(pattern.match(rel) for pattern in self.excludes)
+
+
+def glob_regex(pattern: str) -> re.Pattern[str]:
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+SCOPES = {
+    "markup": Scope(("concepts", "skills", "agents"), MARKUP_SUFFIXES, SCAN_EXCLUDES),
+    "agent": Scope(("agents",), IMPORT_SUFFIXES, BOUNDARY_EXCLUDES),
+    "skill": Scope(("skills",), IMPORT_SUFFIXES, BOUNDARY_EXCLUDES),
+    "renderer": Scope(("renderer", "renderers"), IMPORT_SUFFIXES, BOUNDARY_EXCLUDES),
+}
+
+MARKUP_SUGGESTION = "Move UI markup/styling into ui-adapters/ or renderer/ allowlisted paths."
+ADAPTER_IMPORTS = r"ui-adapters/|renderer/|renderers/|ui-patterns/"
+
+
+def markup_rule(label: str, tokens: tuple[str, ...], context: str = "code", regex: bool = False) -> TokenRule:
+    return TokenRule(
+        CATEGORY,
+        f"UIP violation: UI markup or styling detected outside adapter layer ({label})",
+        tokens,
+        MARKUP_SUGGESTION,
+        frozenset({"markup"}),
+        context=context,
+        regex=regex,
+    )
+
+
+BOUNDARY_RULES = (
+    markup_rule("HTML/JSX <div", ("<div",)),
+    markup_rule("HTML/JSX <button", ("<button",)),
+    markup_rule("HTML/JSX <form", ("<form",)),
+    markup_rule("HTML/JSX <input", ("<input",)),
+    markup_rule("HTML/JSX <select", ("<select",)),
+    markup_rule("className usage", ("className=",)),
+    markup_rule(
+        "Tailwind class patterns",
+        (r"\b(?:bg|text|flex|grid|px|py|mx|my|mt|mb|ml|mr|pt|pb|pl|pr|w|h)-[a-z0-9-]+",),
+        context="text",
+        regex=True,
+    ),
+    markup_rule("Tailwind keyword", ("tailwind",), context="text"),
+    TokenRule(
+        CATEGORY,
+        "UIP violation: agent importing adapter layer",
+        (ADAPTER_IMPORTS,),
+        "Remove adapter/renderer imports from agents and emit UI intent instead.",
+        frozenset({"agent"}),
+        context="import",
+        regex=True,
+    ),
+    TokenRule(
+        CATEGORY,
+        "UIP violation: skill importing adapter layer",
+        (ADAPTER_IMPORTS,),
+        "Remove adapter/renderer imports from skills and emit UI intent instead.",
+        frozenset({"skill"}),
+        context="import",
+        regex=True,
+    ),
+    TokenRule(
+        CATEGORY,
+        "UIP violation: skill importing React",
+        (r"^react$",),
+        "Remove React imports from skills; keep rendering in adapter layers.",
+        frozenset({"skill"}),
+        context="import",
+        regex=True,
+    ),
+    TokenRule(
+        CATEGORY,
+        "UIP violation: skill importing Tailwind",
+        (r"^(?:tailwind|tailwindcss)$",),
+        "Remove Tailwind imports from skills; keep styling in adapter layers.",
+        frozenset({"skill"}),
+        context="import",
+        regex=True,
+    ),
+    TokenRule(
+        CATEGORY,
+        "UIP violation: renderer importing domain layer",
+        (r"concepts/|agents/|skills/",),
+        "Remove concept/agent/skill imports from renderers and consume intent artifacts only.",
+        frozenset({"renderer"}),
+        context="import",
+        regex=True,
+    ),
+)
+SCANNER = MultiTokenScanner(BOUNDARY_RULES)
+
+
+def roles_for(rel: str) -> frozenset[str]:
+    return frozenset(role for role, scope in SCOPES.items() if scope.covers(rel))
+
+
+def _walk_order(rel: str) -> list[tuple[int, str]]:
+    # os.walk order: a directory's own files before its subdirectories, each sorted.
+    *dirs, name = rel.split("/")
+    return [(1, part) for part in dirs] + [(0, name)]
+
+
+def git_listed_files(root: Path, top_dirs: list[str]) -> Optional[list[str]]:
+    """Tracked and untracked, non-ignored files under ``top_dirs``; None outside a git worktree."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", *top_dirs],
+            cwd=root,
+            capture_output=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    listed = {rel for rel in result.stdout.decode("utf-8", "surrogateescape").split("\0") if rel}
+    return sorted(listed, key=_walk_order)
+
+
+def iter_targets(root: Path) -> Iterator[tuple[str, frozenset[str]]]:
+    """Yield every scoped file once with its roles.
+
+    Inside a git worktree the candidates come from ``git ls-files``, so
+    .gitignore'd files are skipped as the former ``rg --files`` scans did;
+    otherwise each scoped top-level directory is walked once.
+    """
+    top_dirs = sorted({name for scope in SCOPES.values() for name in scope.dirs})
+    listed = git_listed_files(root, top_dirs)
+    if listed is not None:
+        yield from iter_listed_targets(root, listed)
+        return
+    suffixes = tuple(sorted({suffix for scope in SCOPES.values() for suffix in scope.suffixes}))
+    for name in top_dirs:
+        base = root / name
+        if not base.is_dir():
+            continue
+        for path in iter_source_files(base, suffixes, PRUNED_DIRS):
+            rel = path.relative_to(root).as_posix()
+            roles = roles_for(rel)
+            if roles:
+                yield rel, roles
+
+
+def changed_files(root: Path) -> list[str]:
+    """Changed paths from scripts/changed-files.sh, the detection check-invariants.sh uses."""
+    script = Path(__file__).resolve().parent / "changed-files.sh"
+    try:
+        result = subprocess.run(["bash", str(script)], cwd=root, capture_output=True, text=True)
+    except OSError:
+        return []
+    if result.returncode != 0:
+        return []
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def iter_listed_targets(root: Path, paths: Iterable[str]) -> Iterator[tuple[str, frozenset[str]]]:
+    for rel in paths:
+        if any(part in PRUNED_DIRS for part in rel.split("/")[:-1]):
+            continue
+        roles = roles_for(rel)
+        if roles and (root / rel).is_file():
+            yield rel, roles
+
+
+def rules_hash() -> str:
+    digest = hashlib.sha256(str(CACHE_VERSION).encode("utf-8"))
+    for source in RULE_SOURCES:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+class ScanCache:
+    """Content-addressed scan results plus a path index that avoids re-hashing.
+
+    ``results`` maps (sha256, language, roles) to the hits of one lex, so a
+    file's results survive branch switches and renames; ``paths`` maps a path
+    to its last (mtime_ns, size, sha256) and only saves reading unchanged files.
+    """
+
+    def __init__(self, paths: Optional[dict[str, Any]] = None, results: Optional[dict[str, Any]] = None) -> None:
+        self.paths: dict[str, Any] = paths or {}
+        self.results: dict[str, Any] = results or {}
+        self.scanned: set[str] = set()
+        self.lexed = 0
+        self.reused = 0
+
+    def forget_unscanned(self) -> None:
+        """After a full scan, drop index entries of files that no longer exist (results stay)."""
+        self.paths = {rel: entry for rel, entry in self.paths.items() if rel in self.scanned}
+
+
+def load_cache(path: Path, rules: str) -> ScanCache:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ScanCache()
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION or data.get("rules") != rules:
+        return ScanCache()
+    paths, results = data.get("paths"), data.get("results")
+    if not isinstance(paths, dict) or not isinstance(results, dict):
+        return ScanCache()
+    return ScanCache(paths, results)
+
+
+def save_cache(path: Path, rules: str, cache: ScanCache) -> None:
+    results = dict(list(cache.results.items())[-CACHE_MAX_RESULTS:])
+    payload = {"version": CACHE_VERSION, "rules": rules, "paths": cache.paths, "results": results}
+    tmp_name: Optional[str] = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".boundary-scan.", suffix=".tmp", dir=str(path.parent))
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except OSError:
+        # The cache is an accelerator only; a read-only checkout still scans.
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def format_violation(rel: str, line: int, rule: TokenRule) -> str:
+    return f"{rule.category} | file: {rel}:{line} | rule: {rule.rule} | suggestion: {rule.suggestion}"
+
+
+RULES_BY_NAME = {rule.rule: rule for rule in BOUNDARY_RULES}
+
+
+def scan_text(rel: str, text: str, roles: frozenset[str]) -> list[tuple[int, str]]:
+    """(line, rule name) per hit; one per rule and line, as repeated tokens add nothing."""
+    result = SCANNER.scan_text(text, roles, language_for(Path(rel)))
+    hits: list[tuple[int, str]] = []
+    for hit in result.hits:
+        if (hit.line, hit.rule.rule) not in hits:
+            hits.append((hit.line, hit.rule.rule))
+    return hits
+
+
+def scan_cached(root: Path, rel: str, roles: frozenset[str], cache: ScanCache) -> list[str]:
+    """Violation messages for ``rel``, lexing only content not seen before under these roles.
+
+    An unchanged (mtime, size) reuses the indexed hash without reading; a
+    changed file is re-hashed and looked up by content before it is lexed.
+    """
+    path = root / rel
+    st = path.stat()
+    known = cache.paths.get(rel)
+    data: Optional[bytes] = None
+    if isinstance(known, list) and len(known) == 3 and known[:2] == [st.st_mtime_ns, st.st_size]:
+        digest = known[2]
+    else:
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+    key = f"{digest}|{language_for(Path(rel))}|{','.join(sorted(roles))}"
+    hits = cache.results.pop(key, None)
+    if hits is None:
+        if data is None:
+            data = path.read_bytes()
+        hits = scan_text(rel, data.decode("utf-8", errors="replace"), roles)
+        cache.lexed += 1
+    else:
+        cache.reused += 1
+    # Re-inserting keeps results in least-recently-used order for save_cache.
+    cache.results[key] = hits
+    cache.paths[rel] = [st.st_mtime_ns, st.st_size, digest]
+    cache.scanned.add(rel)
+    return [format_violation(rel, line, RULES_BY_NAME[rule]) for line, rule in hits]
+
+
+def check(root: Path, targets: Iterable[tuple[str, frozenset[str]]], cache: Optional[ScanCache] = None) -> list[str]:
+    cache = cache if cache is not None else ScanCache()
+    violations: list[str] = []
+    for rel, roles in targets:
+        try:
+            violations.extend(scan_cached(root, rel, roles, cache))
+        except OSError as exc:
+            violations.append(f"{CATEGORY} | file: {rel} | rule: unreadable source | suggestion: {exc.strerror}")
+    return violations
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Scan concepts/skills/agents/renderers once for every UIP markup and import boundary rule."
+    )
+    parser.add_argument("--root", type=Path, default=ROOT, help="Repository root (default: this checkout).")
+    parser.add_argument(
+        "--changed",
+        action="store_true",
+        help="Only scan files changed against the base ref / index / worktree (as check-invariants.sh).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache.")
+    parser.add_argument("--cache", type=Path, default=None, help=f"Cache file (default: {CACHE_PATH.relative_to(ROOT)}).")
+    parser.add_argument("--stats", action="store_true", help="Report scanned, lexed and cached file counts on stderr.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    root = args.root.resolve()
+    cache_path = args.cache or (root / CACHE_PATH.relative_to(ROOT))
+    rules = rules_hash()
+    cache = ScanCache() if args.no_cache else load_cache(cache_path, rules)
+    targets = iter_listed_targets(root, changed_files(root)) if args.changed else iter_targets(root)
+    violations = check(root, targets, cache)
+    if not args.no_cache:
+        # A changed-only scan cannot tell deleted files from untouched ones.
+        if not args.changed:
+            cache.forget_unscanned()
+        save_cache(cache_path, rules, cache)
+    for message in violations:
+        print(message, file=sys.stderr)
+    if args.stats:
+        print(
+            f"boundary scan: {len(cache.scanned)} files, {cache.lexed} lexed, {cache.reused} from cache",
+            file=sys.stderr,
+        )
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
+import argparse
+import hashlib
 import json
-import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 
+from uip_discovery import ROOT, DiscoveryIndex, first_invalid_json, load_index
 from uip_yaml import YamlError, load_yaml
 
-ROOT = Path(__file__).resolve().parent.parent
-DISCOVERY_SCRIPT = ROOT / "scripts/discover-uip-artifacts.py"
-
 UI_EVENT_TYPES = {
     "form.submitted",
     "action.clicked",
@@ -18,6 +17,13 @@ UI_EVENT_TYPES = {
     "table.rowSelected",
 }
 
+# Index fact namespaces; the sync namespace is salted with the known types so a
+# schema change revalidates every manifest instead of trusting cached matches.
+EVENT_TYPE_FACT = "event.type"
+SYNC_MATCH_FACT = "sync.match:" + hashlib.sha256(
+    ",".join(sorted(UI_EVENT_TYPES)).encode("utf-8")
+).hexdigest()[:12]
+
 
 def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> None:
     if isinstance(file_path, Path):
@@ -34,68 +40,63 @@ def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str)
     raise SystemExit(1)
 
 
-def run_event_discovery() -> dict[str, Path]:
-    result = subprocess.run(
-        [sys.executable, str(DISCOVERY_SCRIPT)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout).strip()
-        if message:
-            print(message, file=sys.stderr)
-        raise SystemExit(result.returncode)
-
-    event_types: dict[str, Path] = {}
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        try:
-            artifact = json.loads(line)
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                DISCOVERY_SCRIPT,
-                "discovery.output",
-                "Ensure discovery emits JSON lines with path/type.",
-            )
-        if artifact.get("type") != "event":
-            continue
-        path = Path(artifact["path"])
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                path,
-                "valid-json",
-                "Fix JSON syntax so the event artifact can be parsed.",
-            )
-        event_type = payload.get("type")
-        if not isinstance(event_type, str) or not event_type.strip():
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                path,
-                "event.type",
-                "Set type to a non-empty UIEvent type string.",
-            )
-        event_types.setdefault(event_type, path)
-    return event_types
+def read_event_type(path: Path) -> str:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            path,
+            "valid-json",
+            "Fix JSON syntax so the event artifact can be parsed.",
+        )
+    event_type = payload.get("type") if isinstance(payload, dict) else None
+    if not isinstance(event_type, str) or not event_type.strip():
+        fail(
+            "UIP-SCHEMA-VIOLATION",
+            path,
+            "event.type",
+            "Set type to a non-empty UIEvent type string.",
+        )
+    return event_type
+
+
+def read_sync_match(path: Path) -> list[str]:
+    try:
+        manifest = load_yaml(path)
+    except YamlError as exc:
+        fail(
+            "UIP-SCHEMA-VIOLATION",
+            path,
+            "sync.yaml",
+            f"Fix YAML syntax: {exc}",
+        )
+    return sorted(validate_sync_manifest(path, manifest))
+
 
+def validate_artifacts(index: DiscoveryIndex) -> None:
+    # The JSON check discover-uip-artifacts.py applies, so an invalid intent
+    # still fails this check without spawning the discovery script.
+    invalid = first_invalid_json(index)
+    if invalid is not None:
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            invalid,
+            "valid-json",
+            "Fix JSON syntax so the artifact can be parsed.",
+        )
 
-def discover_sync_manifests() -> list[Path]:
-    paths: set[Path] = set()
-    paths.update(ROOT.rglob("*.sync.yaml"))
-    for folder in [
-        ROOT / "synchronizations",
-        ROOT / "synchronizations" / "templates",
-        ROOT / "synchronizations" / "examples",
-    ]:
-        if not folder.exists():
-            continue
-        paths.update(folder.glob("*.yaml"))
-        paths.update(folder.glob("*.yml"))
-    return sorted(paths)
+
+def open_index(sync_roots: Optional[list[str]] = None) -> DiscoveryIndex:
+    try:
+        return load_index(sync_roots)
+    except ValueError as exc:
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            "--sync-root",
+            "sync.roots",
+            f"{exc}. Use repo-relative synchronization directories.",
+        )
 
 
 def ensure_mapping(
@@ -256,41 +257,144 @@ def validate_sync_manifest(path: Path, data: Any) -> set[str]:
     return event_types
 
 
+def build_coverage(index: DiscoveryIndex, max_syncs_per_type: int = 1) -> dict[str, Any]:
+    events_by_type: dict[str, list[str]] = {}
+    sync_matches: dict[str, list[str]] = {}
+    # One pass over the index; facts are only re-read for artifacts whose stat moved.
+    for rel, kind in index.artifacts(("event", "sync")):
+        if kind == "event":
+            event_type = index.facts(rel, EVENT_TYPE_FACT, read_event_type)
+            events_by_type.setdefault(event_type, []).append(rel)
+        else:
+            sync_matches[rel] = index.facts(rel, SYNC_MATCH_FACT, read_sync_match)
+
+    syncs_by_type: dict[str, list[str]] = {}
+    for rel, match in sync_matches.items():
+        for event_type in match:
+            syncs_by_type.setdefault(event_type, []).append(rel)
+
+    types: dict[str, dict[str, Any]] = {}
+    for event_type in sorted(set(events_by_type) | set(syncs_by_type)):
+        event_paths = events_by_type.get(event_type, [])
+        syncs = sorted(syncs_by_type.get(event_type, []))
+        if not event_paths:
+            status = "unobserved"
+        elif not syncs:
+            status = "uncovered"
+        elif len(syncs) > max_syncs_per_type:
+            status = "over-covered"
+        else:
+            status = "covered"
+        types[event_type] = {
+            "events": len(event_paths),
+            "firstEvent": event_paths[0] if event_paths else None,
+            "syncs": syncs,
+            "status": status,
+        }
+
+    syncs_report: dict[str, dict[str, Any]] = {}
+    for rel in sorted(sync_matches):
+        match = sync_matches[rel]
+        observed = sum(len(events_by_type.get(event_type, [])) for event_type in match)
+        syncs_report[rel] = {"match": match, "events": observed, "unused": observed == 0}
+
+    return {
+        "types": types,
+        "syncs": syncs_report,
+        "summary": {
+            "events": sum(len(paths) for paths in events_by_type.values()),
+            "syncs": len(sync_matches),
+            # Discovery order, so the first gap reported is the first uncovered event found.
+            "uncovered": [t for t in events_by_type if types[t]["status"] == "uncovered"],
+            "overCovered": sorted(t for t, row in types.items() if row["status"] == "over-covered"),
+            "unusedSyncs": sorted(rel for rel, row in syncs_report.items() if row["unused"]),
+        },
+    }
+
+
+def print_coverage(coverage: dict[str, Any]) -> None:
+    summary = coverage["summary"]
+    print("UIEvent x Synchronization Coverage")
+    print(f"{summary['events']} event(s); {summary['syncs']} synchronization manifest(s).")
+    if coverage["types"]:
+        width = max(len(event_type) for event_type in coverage["types"])
+        for event_type, row in coverage["types"].items():
+            syncs = ", ".join(row["syncs"]) or "-"
+            print(f"- {event_type:<{width}}  events={row['events']:<5} {row['status']:<12} {syncs}")
+    if coverage["syncs"]:
+        print("Synchronizations:")
+        for rel, row in coverage["syncs"].items():
+            flag = "  [matches no observed UIEvent]" if row["unused"] else ""
+            print(f"- {rel}: events={row['events']} match={','.join(row['match'])}{flag}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Ensure every discovered UIEvent type is routed by a Synchronization."
+    )
+    parser.add_argument(
+        "--sync-root",
+        action="append",
+        default=None,
+        help=(
+            "Repo-relative directory whose *.yaml/*.yml files are Synchronization manifests "
+            "(repeatable; default: $UIP_SYNC_ROOTS or synchronizations/, "
+            "synchronizations/templates/, synchronizations/examples/). "
+            "*.sync.yaml files are discovered anywhere."
+        ),
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Print the full event-type x synchronization coverage matrix instead of stopping at the first gap.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="With --report, emit the coverage matrix as JSON.",
+    )
+    parser.add_argument(
+        "--max-syncs-per-type",
+        type=int,
+        default=1,
+        help="Flag UIEvent types routed by more than this many manifests as over-covered (default: 1).",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
-    event_types = run_event_discovery()
-    sync_paths = discover_sync_manifests()
-    if not sync_paths:
-        if event_types:
-            first_event = next(iter(event_types.values()))
-            fail(
-                "UIP-BOUNDARY-VIOLATION",
-                first_event,
-                "UIP violation: UIEvent type has no synchronization",
-                "Add a Synchronization manifest that routes this UIEvent.",
-            )
-        return
+    args = parse_args()
+    index = open_index(args.sync_root)
+    validate_artifacts(index)
+    coverage = build_coverage(index, args.max_syncs_per_type)
+    index.save()
 
-    sync_event_types: set[str] = set()
-    for path in sync_paths:
-        try:
-            manifest = load_yaml(path)
-        except YamlError as exc:
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                path,
-                "sync.yaml",
-                f"Fix YAML syntax: {exc}",
-            )
-        sync_event_types.update(validate_sync_manifest(path, manifest))
+    if args.report:
+        if args.json:
+            sys.stdout.write(json.dumps(coverage, indent=2, sort_keys=True) + "\n")
+        else:
+            print_coverage(coverage)
+        if coverage["summary"]["uncovered"]:
+            raise SystemExit(1)
+        return
 
-    for event_type, path in event_types.items():
-        if event_type not in sync_event_types:
-            fail(
-                "UIP-BOUNDARY-VIOLATION",
-                path,
-                f"UIP violation: UIEvent type '{event_type}' has no synchronization",
-                "Add a Synchronization trigger for this UIEvent type.",
-            )
+    uncovered = coverage["summary"]["uncovered"]
+    if not uncovered:
+        return
+    first = coverage["types"][uncovered[0]]
+    if not coverage["syncs"]:
+        fail(
+            "UIP-BOUNDARY-VIOLATION",
+            index.path(first["firstEvent"]),
+            "UIP violation: UIEvent type has no synchronization",
+            "Add a Synchronization manifest that routes this UIEvent.",
+        )
+    fail(
+        "UIP-BOUNDARY-VIOLATION",
+        index.path(first["firstEvent"]),
+        f"UIP violation: UIEvent type '{uncovered[0]}' has no synchronization",
+        "Add a Synchronization trigger for this UIEvent type.",
+    )
 
 
 if __name__ == "__main__":
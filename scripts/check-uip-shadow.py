@@ -1,17 +1,32 @@
 #!/usr/bin/env python3
+import argparse
+import difflib
+import importlib.util
 import json
-import subprocess
+import math
+import os
+import random
+import re
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from statistics import NormalDist
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
 
-ROOT = Path(__file__).resolve().parent.parent
-DISCOVERY_SCRIPT = ROOT / "scripts/discover-uip-artifacts.py"
+from uip_discovery import ROOT, load_index
+
+T = TypeVar("T")
 
 INTENT_SCHEMA_VERSION = "0.2.0"
 EVENT_SCHEMA_VERSION = "0.2.0"
 
+# Current (enforced) versions, mirroring check-uip-schemas.py.
+CURRENT_EVENT_SCHEMA_VERSIONS = {"1.0.0"}
+INTENT_VALIDATOR_PATH = ROOT / "skills/ui-intent-emit/impl/run.py"
+
 INTENT_TYPES = {
     "page.create",
     "form.create",
@@ -50,115 +65,499 @@ def is_iso8601(value: object) -> bool:
         return False
 
 
-def run_discovery() -> list[dict[str, str]]:
-    result = subprocess.run(
-        [sys.executable, str(DISCOVERY_SCRIPT)],
-        capture_output=True,
-        text=True,
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    intent_versions: Optional[frozenset[str]]
+    event_versions: frozenset[str]
+    intent_types: frozenset[str]
+    require_components: bool
+
+
+@dataclass
+class Outcome:
+    path: Path
+    kind: str
+    current: list[tuple[str, str]] = field(default_factory=list)
+    shadow: list[tuple[str, str]] = field(default_factory=list)
+    rewrite: Optional[str] = None
+    original: Optional[str] = None
+    signature: Optional[tuple[int, int]] = None
+
+
+SHADOW = Profile(
+    name="UIP-0.2",
+    intent_versions=frozenset({INTENT_SCHEMA_VERSION}),
+    event_versions=frozenset({EVENT_SCHEMA_VERSION}),
+    intent_types=frozenset(INTENT_TYPES),
+    require_components=True,
+)
+
+
+def load_current_profile() -> Profile:
+    # The enforced intent version and types live in the ui-intent-emit skill;
+    # without it, the current profile only requires a non-empty version.
+    intent_versions: Optional[frozenset[str]] = None
+    intent_types = frozenset(INTENT_TYPES)
+    if INTENT_VALIDATOR_PATH.exists():
+        spec = importlib.util.spec_from_file_location("ui_intent_run", INTENT_VALIDATOR_PATH)
+        if spec is not None and spec.loader is not None:
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            if hasattr(module, "SCHEMA_VERSION"):
+                intent_versions = frozenset({getattr(module, "SCHEMA_VERSION")})
+            if hasattr(module, "ALLOWED_TYPES"):
+                intent_types = frozenset(getattr(module, "ALLOWED_TYPES"))
+    return Profile(
+        name="current",
+        intent_versions=intent_versions,
+        event_versions=frozenset(CURRENT_EVENT_SCHEMA_VERSIONS),
+        intent_types=intent_types,
+        require_components=False,
     )
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout).strip()
-        print("UIP-0.2 Shadow Validation Results")
-        if message:
-            print(f"Shadow validation skipped: {message}")
-        else:
-            print("Shadow validation skipped: discovery failed.")
-        return []
 
-    artifacts: list[dict[str, str]] = []
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        try:
-            artifacts.append(json.loads(line))
-        except json.JSONDecodeError:
+
+def discover_artifacts() -> Iterator[tuple[Path, str]]:
+    index = load_index()
+    index.save()
+    for rel, kind in index.artifacts(("intent", "event")):
+        yield index.path(rel), kind
+
+
+def reservoir_sample(stream: Iterable[T], size: int, rng: random.Random) -> tuple[list[T], int]:
+    """Uniform sample of ``size`` items from a stream of unknown length (Algorithm R)."""
+    sample: list[T] = []
+    seen = 0
+    for item in stream:
+        seen += 1
+        if len(sample) < size:
+            sample.append(item)
             continue
-    return artifacts
+        slot = rng.randrange(seen)
+        if slot < size:
+            sample[slot] = item
+    return sample, seen
+
+
+def bernoulli_sample(stream: Iterable[T], fraction: float, rng: random.Random) -> tuple[list[T], int]:
+    sample: list[T] = []
+    seen = 0
+    for item in stream:
+        seen += 1
+        if rng.random() < fraction:
+            sample.append(item)
+    return sample, seen
+
+
+def wilson_interval(failures: int, sampled: int, population: int, z: float) -> tuple[float, float]:
+    """Wilson score interval for a failure rate, narrowed by the finite-population correction."""
+    if sampled == 0:
+        return 0.0, 1.0
+    if population > 1:
+        z *= math.sqrt(max(0.0, (population - sampled) / (population - 1)))
+    rate = failures / sampled
+    denom = 1 + z * z / sampled
+    centre = (rate + z * z / (2 * sampled)) / denom
+    half = z * math.sqrt(rate * (1 - rate) / sampled + z * z / (4 * sampled * sampled)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
 
 
-def validate_intent(data: dict[str, Any]) -> list[str]:
-    errors: list[str] = []
-    if data.get("schemaVersion") != INTENT_SCHEMA_VERSION:
-        errors.append("schemaVersion must be 0.2.0")
+def validate_intent(data: dict[str, Any], profile: Profile = SHADOW) -> list[tuple[str, str]]:
+    errors: list[tuple[str, str]] = []
+    version = data.get("schemaVersion")
+    if profile.intent_versions is None:
+        if not is_non_empty_string(version):
+            errors.append(("intent.schemaVersion", "schemaVersion must be a non-empty string"))
+    elif version not in profile.intent_versions:
+        expected = ", ".join(sorted(profile.intent_versions))
+        errors.append(("intent.schemaVersion", f"schemaVersion must be {expected}"))
     if not is_non_empty_string(data.get("id")):
-        errors.append("id must be a non-empty string")
+        errors.append(("intent.id", "id must be a non-empty string"))
     intent_type = data.get("type")
-    if not is_non_empty_string(intent_type) or intent_type not in INTENT_TYPES:
-        errors.append("type must be a supported intent type")
+    if not is_non_empty_string(intent_type) or intent_type not in profile.intent_types:
+        errors.append(("intent.type", "type must be a supported intent type"))
     purpose = data.get("purpose")
     if not is_object(purpose) or not is_non_empty_string(purpose.get("summary")):
-        errors.append("purpose.summary must be a non-empty string")
+        errors.append(("intent.purpose.summary", "purpose.summary must be a non-empty string"))
     if "payload" not in data or not is_object(data.get("payload")):
-        errors.append("payload must be an object")
-    components = data.get("components")
-    if not is_object(components):
-        errors.append("components must be an object")
+        errors.append(("intent.payload", "payload must be an object"))
+    if profile.require_components and not is_object(data.get("components")):
+        errors.append(("intent.components", "components must be an object"))
     return errors
 
 
-def validate_event(data: dict[str, Any]) -> list[str]:
-    errors: list[str] = []
-    if data.get("schemaVersion") != EVENT_SCHEMA_VERSION:
-        errors.append("schemaVersion must be 0.2.0")
+def validate_event(data: dict[str, Any], profile: Profile = SHADOW) -> list[tuple[str, str]]:
+    errors: list[tuple[str, str]] = []
+    if data.get("schemaVersion") not in profile.event_versions:
+        expected = ", ".join(sorted(profile.event_versions))
+        errors.append(("event.schemaVersion", f"schemaVersion must be {expected}"))
     if not is_non_empty_string(data.get("id")):
-        errors.append("id must be a non-empty string")
+        errors.append(("event.id", "id must be a non-empty string"))
     if not is_iso8601(data.get("ts")):
-        errors.append("ts must be ISO-8601")
+        errors.append(("event.ts", "ts must be ISO-8601"))
     if not is_non_empty_string(data.get("intentId")):
-        errors.append("intentId must be a non-empty string")
+        errors.append(("event.intentId", "intentId must be a non-empty string"))
     event_type = data.get("type")
     if not is_non_empty_string(event_type) or event_type not in EVENT_TYPES:
-        errors.append("type must be a supported event type")
+        errors.append(("event.type", "type must be a supported event type"))
     if not is_non_empty_string(data.get("uiSessionId")):
-        errors.append("uiSessionId must be a non-empty string")
+        errors.append(("event.uiSessionId", "uiSessionId must be a non-empty string"))
     if not is_non_empty_string(data.get("idempotencyKey")):
-        errors.append("idempotencyKey must be a non-empty string")
+        errors.append(("event.idempotencyKey", "idempotencyKey must be a non-empty string"))
     if "payload" not in data or not is_object(data.get("payload")):
-        errors.append("payload must be an object")
+        errors.append(("event.payload", "payload must be an object"))
     return errors
 
 
-def main() -> None:
-    artifacts = run_discovery()
-    failures: list[tuple[Path, list[str]]] = []
+def _set_intent_version(data: dict[str, Any]) -> bool:
+    data["schemaVersion"] = INTENT_SCHEMA_VERSION
+    return True
 
-    for artifact in artifacts:
-        path = Path(artifact.get("path", ""))
-        if not path.exists():
-            continue
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            failures.append((path, ["invalid JSON"]))
-            continue
-        if not isinstance(payload, dict):
-            failures.append((path, ["artifact must be a JSON object"]))
-            continue
-        if artifact.get("type") == "intent":
-            errors = validate_intent(payload)
-        elif artifact.get("type") == "event":
-            errors = validate_event(payload)
+
+def _set_event_version(data: dict[str, Any]) -> bool:
+    data["schemaVersion"] = EVENT_SCHEMA_VERSION
+    return True
+
+
+def _add_components(data: dict[str, Any]) -> bool:
+    # Only a missing block is safe to synthesize; a malformed one needs a human.
+    if "components" in data:
+        return False
+    data["components"] = {}
+    return True
+
+
+# Mechanical UIP-0.2 rewrites, keyed by the shadow rule they resolve.
+FIXERS: dict[str, Callable[[dict[str, Any]], bool]] = {
+    "intent.schemaVersion": _set_intent_version,
+    "intent.components": _add_components,
+    "event.schemaVersion": _set_event_version,
+}
+
+
+SCHEMA_VERSION_RE = re.compile(r'("schemaVersion"\s*:\s*)"(?:[^"\\]|\\.)*"')
+
+
+def render_json(original: str, data: Any) -> str:
+    # Keep the artifact's own layout: indented files stay indented, one-liners stay one line.
+    lines = original.lstrip().splitlines()
+    indent: Optional[int] = None
+    if len(lines) > 1 and lines[0].strip() == "{":
+        indent = (len(lines[1]) - len(lines[1].lstrip(" "))) or 2
+    rendered = json.dumps(data, indent=indent, ensure_ascii=False)
+    if original.endswith("\n"):
+        rendered += "\n"
+    return rendered
+
+
+def patch_json(original: str, before: dict[str, Any], after: dict[str, Any]) -> str:
+    """Apply a fixer's edits as text patches so the rewrite diff stays minimal.
+
+    Falls back to a full re-render when the patched text does not parse back
+    to exactly ``after``.
+    """
+    text = original
+    if before.get("schemaVersion") != after.get("schemaVersion"):
+        value = json.dumps(after["schemaVersion"])
+        if "schemaVersion" in before:
+            text = SCHEMA_VERSION_RE.sub(lambda m: m.group(1) + value, text, count=1)
+    added = [key for key in after if key not in before]
+    if added:
+        head = text[: text.rfind("}")].rstrip()
+        lines = head.splitlines()
+        colon = ": " if '": ' in original else ":"
+        items = [
+            f"{json.dumps(key, ensure_ascii=False)}{colon}{json.dumps(after[key], ensure_ascii=False)}"
+            for key in added
+        ]
+        if len(lines) > 1:
+            pad = " " * ((len(lines[1]) - len(lines[1].lstrip(" "))) or 2)
+            items = [f"\n{pad}{item}" for item in items]
+            sep = ","
         else:
-            errors = ["unknown artifact type"]
-        if errors:
-            failures.append((path, errors))
+            sep = ", " if colon == ": " else ","
+        insertion = sep.join(items)
+        if before:
+            insertion = sep + insertion
+        text = head + insertion + text[len(head):]
+    try:
+        if json.loads(text) == after:
+            return text
+    except json.JSONDecodeError:
+        pass
+    return render_json(original, after)
+
+
+def plan_rewrite(kind: str, text: str, data: dict[str, Any], shadow: list[tuple[str, str]]) -> Optional[str]:
+    rules = {rule for rule, _ in shadow}
+    if not rules or not rules <= FIXERS.keys():
+        return None
+    migrated = json.loads(text)
+    for rule in sorted(rules):
+        if not FIXERS[rule](migrated):
+            return None
+    validate = validate_intent if kind == "intent" else validate_event
+    if validate(migrated, SHADOW):
+        return None
+    return patch_json(text, data, migrated)
+
+
+def evaluate(path: Path, kind: str, current: Profile, want_rewrite: bool) -> Outcome:
+    outcome = Outcome(path=path, kind=kind)
+    try:
+        st = path.stat()
+        text = path.read_text(encoding="utf-8")
+    except OSError as exc:
+        outcome.current = outcome.shadow = [("artifact.read", f"unreadable: {exc.strerror}")]
+        return outcome
+    outcome.signature = (st.st_mtime_ns, st.st_size)
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError:
+        outcome.current = outcome.shadow = [("valid-json", "invalid JSON")]
+        return outcome
+    if not isinstance(payload, dict):
+        outcome.current = outcome.shadow = [("artifact.root", "artifact must be a JSON object")]
+        return outcome
+    if kind == "intent":
+        outcome.current = validate_intent(payload, current)
+        outcome.shadow = validate_intent(payload, SHADOW)
+    elif kind == "event":
+        outcome.current = validate_event(payload, current)
+        outcome.shadow = validate_event(payload, SHADOW)
+    else:
+        outcome.current = outcome.shadow = [("artifact.type", "unknown artifact type")]
+        return outcome
+    if want_rewrite and outcome.shadow:
+        outcome.original = text
+        outcome.rewrite = plan_rewrite(kind, text, payload, outcome.shadow)
+    return outcome
+
 
+def display(path: Path) -> str:
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def apply_rewrite(outcome: Outcome) -> Optional[str]:
+    path = outcome.path
+    # Each file fails on its own: an artifact removed or locked after planning
+    # must not abort the writes still queued in the pool.
+    try:
+        st = path.stat()
+    except OSError as exc:
+        return f"unreadable: {exc.strerror}"
+    if outcome.signature != (st.st_mtime_ns, st.st_size):
+        return "changed since planning; rerun to re-plan"
+    try:
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    except OSError as exc:
+        return f"write failed: {exc.strerror}"
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(outcome.rewrite or "")
+        os.chmod(tmp_name, st.st_mode & 0o7777)
+        os.replace(tmp_name, path)
+    except OSError as exc:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        return f"write failed: {exc.strerror}"
+    return None
+
+
+def print_report(outcomes: list[Outcome]) -> None:
     print("UIP-0.2 Shadow Validation Results")
-    if not artifacts:
+    if not outcomes:
         print("No artifacts discovered.")
         return
+
+    both_pass = sum(1 for o in outcomes if not o.current and not o.shadow)
+    regress = sum(1 for o in outcomes if not o.current and o.shadow)
+    both_fail = sum(1 for o in outcomes if o.current and o.shadow)
+    fixed = sum(1 for o in outcomes if o.current and not o.shadow)
+    print(
+        f"{len(outcomes)} artifact(s): {both_pass} pass both, {regress} regress under UIP-0.2, "
+        f"{both_fail} fail both, {fixed} fail only the current schema."
+    )
+
+    failures = [o for o in outcomes if o.shadow]
     if not failures:
         print("All artifacts pass UIP-0.2 shadow validation.")
         return
 
+    by_rule: dict[str, int] = {}
+    for outcome in failures:
+        for rule in {rule for rule, _ in outcome.shadow}:
+            by_rule[rule] = by_rule.get(rule, 0) + 1
+    print("Failures by rule:")
+    for rule, count in sorted(by_rule.items(), key=lambda item: (-item[1], item[0])):
+        marker = " (auto-migratable)" if rule in FIXERS else ""
+        print(f"- {rule}: {count}{marker}")
+
     print(f"{len(failures)} artifact(s) would fail under UIP-0.2.")
-    for path, errors in failures:
-        try:
-            display = path.relative_to(ROOT)
-        except ValueError:
-            display = path
-        reason = "; ".join(errors)
-        print(f"- {display}: {reason}")
+    for outcome in failures:
+        reason = "; ".join(message for _, message in outcome.shadow)
+        print(f"- {display(outcome.path)}: {reason}")
+
+
+def print_diff(outcomes: list[Outcome]) -> None:
+    for outcome in outcomes:
+        if outcome.rewrite is None or outcome.original is None:
+            continue
+        name = display(outcome.path)
+        for line in difflib.unified_diff(
+            outcome.original.splitlines(keepends=True),
+            outcome.rewrite.splitlines(keepends=True),
+            fromfile=f"a/{name}",
+            tofile=f"b/{name}",
+        ):
+            sys.stdout.write(line)
+            if not line.endswith("\n"):
+                sys.stdout.write("\n\\ No newline at end of file\n")
+
+
+def print_estimates(outcomes: list[Outcome], population: int, seed: int, confidence: float) -> None:
+    sampled = len(outcomes)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    label = f"{confidence:.0%} CI"
+
+    def estimate(failures: int) -> str:
+        low, high = wilson_interval(failures, sampled, population, z)
+        rate = failures / sampled if sampled else 0.0
+        return (
+            f"{failures}/{sampled} sampled, {rate:.1%} ({label} {low:.1%}-{high:.1%}), "
+            f"~{round(rate * population)} of {population}"
+        )
+
+    print("UIP-0.2 Shadow Validation Results (sampled)")
+    print(f"Sampled {sampled} of {population} artifact(s) (seed {seed}).")
+    if not sampled:
+        return
+    print(f"- would fail under UIP-0.2: {estimate(sum(1 for o in outcomes if o.shadow))}")
+    print(f"- regress under UIP-0.2: {estimate(sum(1 for o in outcomes if o.shadow and not o.current))}")
+
+    by_rule: dict[str, int] = {}
+    for outcome in outcomes:
+        for rule in {rule for rule, _ in outcome.shadow}:
+            by_rule[rule] = by_rule.get(rule, 0) + 1
+    if by_rule:
+        print("Estimated failure rate by rule:")
+    for rule, count in sorted(by_rule.items(), key=lambda item: (-item[1], item[0])):
+        print(f"- {rule}: {estimate(count)}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare discovered UIP artifacts against the current and UIP-0.2 schemas."
+    )
+    parser.add_argument(
+        "--migrate",
+        action="store_true",
+        help="Print a unified diff of the mechanical UIP-0.2 rewrites instead of the report.",
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="With --migrate, write the rewrites in place (atomic per file).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(32, (os.cpu_count() or 1) * 4),
+        help="Artifacts validated/rewritten concurrently.",
+    )
+    sampling = parser.add_mutually_exclusive_group()
+    sampling.add_argument(
+        "--sample",
+        type=int,
+        metavar="N",
+        help="Validate a uniform random sample of N artifacts and estimate corpus-wide failure rates.",
+    )
+    sampling.add_argument(
+        "--fraction",
+        type=float,
+        metavar="P",
+        help="Validate each artifact with probability P (0 < P <= 1) and estimate failure rates.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Sampling seed (default: 0).")
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level for sampled estimates (default: 0.95).",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.apply and not args.migrate:
+        print("--apply requires --migrate", file=sys.stderr)
+        raise SystemExit(2)
+    sampled = args.sample is not None or args.fraction is not None
+    if sampled and args.migrate:
+        print("--sample/--fraction cannot be combined with --migrate", file=sys.stderr)
+        raise SystemExit(2)
+    if args.sample is not None and args.sample < 1:
+        print("--sample must be at least 1", file=sys.stderr)
+        raise SystemExit(2)
+    if args.fraction is not None and not 0 < args.fraction <= 1:
+        print("--fraction must be in (0, 1]", file=sys.stderr)
+        raise SystemExit(2)
+    if not 0 < args.confidence < 1:
+        print("--confidence must be in (0, 1)", file=sys.stderr)
+        raise SystemExit(2)
+
+    current = load_current_profile()
+    population = 0
+    if args.sample is not None:
+        artifacts, population = reservoir_sample(discover_artifacts(), args.sample, random.Random(args.seed))
+    elif args.fraction is not None:
+        artifacts, population = bernoulli_sample(discover_artifacts(), args.fraction, random.Random(args.seed))
+    else:
+        artifacts = list(discover_artifacts())
+    # Validate in discovery order so output is stable for a given seed.
+    artifacts.sort(key=lambda item: item[0])
+    jobs = max(1, args.jobs)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        outcomes = list(
+            pool.map(lambda item: evaluate(item[0], item[1], current, args.migrate), artifacts)
+        )
+
+    if sampled:
+        print_estimates(outcomes, population, args.seed, args.confidence)
+        return
+    if not args.migrate:
+        print_report(outcomes)
+        return
+
+    planned = [o for o in outcomes if o.rewrite is not None]
+    manual = [o for o in outcomes if o.shadow and o.rewrite is None]
+    if not args.apply:
+        print_diff(planned)
+        print(
+            f"{len(planned)} artifact(s) can be migrated automatically; "
+            f"{len(manual)} need manual edits.",
+            file=sys.stderr,
+        )
+        return
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        errors = list(pool.map(apply_rewrite, planned))
+    failed = 0
+    for outcome, error in zip(planned, errors):
+        if error is not None:
+            failed += 1
+            print(f"- {display(outcome.path)}: {error}", file=sys.stderr)
+    print(f"Migrated {len(planned) - failed} artifact(s) to UIP-0.2; {len(manual)} need manual edits.")
+    for outcome in manual:
+        reason = "; ".join(message for _, message in outcome.shadow)
+        print(f"- {display(outcome.path)}: {reason}")
+    if failed:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
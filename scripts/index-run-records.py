@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""Incremental SQLite index over run records (runs/**/*.jsonl) and queries against it.
+
+`index` ingests only bytes appended since the last pass: each file's byte
+offset, inode and a hash of its already-indexed head are tracked, so an
+unchanged file costs one stat() and a rewritten or truncated one is re-read
+from the start. A trailing line without a newline is left for the next pass
+(create-run-record.py may still be writing it). Lines that are not run records
+(e.g. reasoning.jsonl events) are skipped.
+
+The query commands (`runs`, `fix-loops`, `sql`) refresh the index first unless
+--no-refresh is given. The database lives in .uip-cache/runs-index.sqlite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+DB_PATH = ROOT / ".uip-cache" / "runs-index.sqlite"
+# Bump when the tables below change; an older database is rebuilt from scratch.
+SCHEMA_VERSION = 1
+# Bytes of an already-indexed prefix hashed to notice files rewritten in place.
+HEAD_BYTES = 4096
+
+SCHEMA = """
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    head_hash TEXT NOT NULL
+);
+CREATE TABLE runs (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    offset INTEGER NOT NULL,
+    run_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    ts_utc REAL,
+    concept_id TEXT,
+    skill_id TEXT,
+    spec_id TEXT,
+    outcome TEXT,
+    fix_loop_count INTEGER,
+    execution_profile TEXT,
+    fast_mode_scope TEXT,
+    UNIQUE (file_id, offset)
+);
+CREATE TABLE files_touched (
+    run INTEGER NOT NULL REFERENCES runs(id),
+    path TEXT NOT NULL
+);
+CREATE TABLE commands_executed (
+    run INTEGER NOT NULL REFERENCES runs(id),
+    position INTEGER NOT NULL,
+    command TEXT NOT NULL
+);
+CREATE TABLE synchronizations_used (
+    run INTEGER NOT NULL REFERENCES runs(id),
+    synchronization TEXT NOT NULL
+);
+CREATE INDEX runs_run_id ON runs (run_id);
+CREATE INDEX runs_ts ON runs (ts_utc);
+CREATE INDEX runs_concept ON runs (concept_id, ts_utc);
+CREATE INDEX runs_skill ON runs (skill_id, ts_utc);
+CREATE INDEX runs_spec ON runs (spec_id, ts_utc);
+CREATE INDEX runs_outcome ON runs (outcome, ts_utc);
+CREATE INDEX files_touched_path ON files_touched (path, run);
+CREATE INDEX files_touched_run ON files_touched (run);
+CREATE INDEX commands_executed_command ON commands_executed (command, run);
+CREATE INDEX commands_executed_run ON commands_executed (run);
+CREATE INDEX synchronizations_used_name ON synchronizations_used (synchronization, run);
+CREATE INDEX synchronizations_used_run ON synchronizations_used (run);
+"""
+
+RUN_COLUMNS = (
+    "run_id",
+    "timestamp",
+    "concept_id",
+    "skill_id",
+    "spec_id",
+    "outcome",
+    "fix_loop_count",
+    "execution_profile",
+    "fast_mode_scope",
+)
+GROUP_COLUMNS = {"skill": "skill_id", "concept": "concept_id", "spec": "spec_id", "profile": "execution_profile"}
+
+
+def _eprint(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """Epoch seconds for an ISO timestamp or date; naive values are taken as UTC."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        with conn:
+            for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                conn.execute(f'DROP TABLE "{name}"')
+            conn.executescript(SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def _head_hash(handle: Any, length: int) -> str:
+    handle.seek(0)
+    return hashlib.sha256(handle.read(min(length, HEAD_BYTES))).hexdigest()
+
+
+def _forget_runs(conn: sqlite3.Connection, file_id: int) -> None:
+    selected = "SELECT id FROM runs WHERE file_id = ?"
+    for table in ("files_touched", "commands_executed", "synchronizations_used"):
+        conn.execute(f"DELETE FROM {table} WHERE run IN ({selected})", (file_id,))
+    conn.execute("DELETE FROM runs WHERE file_id = ?", (file_id,))
+
+
+def _string_items(value: Any) -> list[str]:
+    return [item for item in value if isinstance(item, str)] if isinstance(value, list) else []
+
+
+def _ingest_lines(conn: sqlite3.Connection, file_id: int, base: int, chunk: bytes, rel: str) -> tuple[int, int]:
+    """Insert the run records in chunk (complete lines starting at byte base); returns (indexed, skipped)."""
+    # Row ids are assigned here so every table is filled with one executemany.
+    next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM runs").fetchone()[0]
+    skipped = 0
+    runs: list[tuple[Any, ...]] = []
+    touched: list[tuple[int, str]] = []
+    commands: list[tuple[int, int, str]] = []
+    syncs: list[tuple[int, str]] = []
+    offset = base
+    for line in chunk.splitlines(keepends=True):
+        start, offset = offset, offset + len(line)
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            _eprint(f"{rel}@{start}: not valid JSON, skipped")
+            skipped += 1
+            continue
+        if not isinstance(record, dict) or not isinstance(record.get("run_id"), str) or "event_type" in record:
+            skipped += 1
+            continue
+        run = next_id + len(runs)
+        values = [record.get(column) for column in RUN_COLUMNS]
+        values[RUN_COLUMNS.index("timestamp")] = str(record.get("timestamp", ""))
+        runs.append((run, file_id, start, parse_timestamp(record.get("timestamp")), *values))
+        touched.extend((run, path) for path in _string_items(record.get("files_touched")))
+        commands.extend((run, i, cmd) for i, cmd in enumerate(_string_items(record.get("commands_executed"))))
+        syncs.extend((run, name) for name in _string_items(record.get("synchronizations_used")))
+    conn.executemany(
+        f"INSERT INTO runs (id, file_id, offset, ts_utc, {', '.join(RUN_COLUMNS)}) "
+        f"VALUES (?, ?, ?, ?, {', '.join('?' for _ in RUN_COLUMNS)})",
+        runs,
+    )
+    conn.executemany("INSERT INTO files_touched (run, path) VALUES (?, ?)", touched)
+    conn.executemany("INSERT INTO commands_executed (run, position, command) VALUES (?, ?, ?)", commands)
+    conn.executemany("INSERT INTO synchronizations_used (run, synchronization) VALUES (?, ?)", syncs)
+    return len(runs), skipped
+
+
+def refresh(conn: sqlite3.Connection, root: Path) -> dict[str, int]:
+    """Bring the index up to date with runs/**/*.jsonl; returns counters for the pass."""
+    runs_dir = root / "runs"
+    stats = {"files": 0, "read": 0, "indexed": 0, "skipped": 0, "reset": 0, "removed": 0}
+    rows = conn.execute("SELECT id, path, inode, offset, head_hash FROM files").fetchall()
+    known = {path: (file_id, inode, offset, head) for file_id, path, inode, offset, head in rows}
+    seen: set[str] = set()
+    with conn:
+        for path in sorted(runs_dir.rglob("*.jsonl")) if runs_dir.is_dir() else []:
+            rel = path.relative_to(root).as_posix()
+            seen.add(rel)
+            stats["files"] += 1
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            file_id, inode, offset, head = known.get(rel, (None, st.st_ino, 0, ""))
+            if file_id is not None and inode == st.st_ino and st.st_size == offset:
+                continue
+            with path.open("rb") as handle:
+                if file_id is None:
+                    file_id = conn.execute(
+                        "INSERT INTO files (path, inode, offset, head_hash) VALUES (?, ?, 0, ?)",
+                        (rel, st.st_ino, _head_hash(handle, 0)),
+                    ).lastrowid
+                elif inode != st.st_ino or st.st_size < offset or _head_hash(handle, offset) != head:
+                    # Replaced, truncated or rewritten: what was indexed no longer matches the file.
+                    _forget_runs(conn, file_id)
+                    offset = 0
+                    stats["reset"] += 1
+                handle.seek(offset)
+                data = handle.read()
+                complete = data[: data.rfind(b"\n") + 1]
+                indexed, skipped = _ingest_lines(conn, file_id, offset, complete, rel)
+                offset += len(complete)
+                conn.execute(
+                    "UPDATE files SET inode = ?, offset = ?, head_hash = ? WHERE id = ?",
+                    (st.st_ino, offset, _head_hash(handle, offset), file_id),
+                )
+            stats["read"] += 1
+            stats["indexed"] += indexed
+            stats["skipped"] += skipped
+        for rel in known.keys() - seen:
+            file_id = known[rel][0]
+            _forget_runs(conn, file_id)
+            conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+            stats["removed"] += 1
+    return stats
+
+
+def _print_rows(columns: list[str], rows: Iterable[tuple[Any, ...]], as_json: bool) -> None:
+    if as_json:
+        for row in rows:
+            print(json.dumps(dict(zip(columns, row)), separators=(",", ":"), ensure_ascii=False))
+        return
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join("" if value is None else str(value) for value in row))
+
+
+def query_runs(conn: sqlite3.Connection, args: argparse.Namespace) -> tuple[list[str], list[tuple[Any, ...]]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    for column in ("run_id", "concept_id", "skill_id", "spec_id", "outcome"):
+        value = getattr(args, column)
+        if value is not None:
+            clauses.append(f"r.{column} = ?")
+            params.append(value)
+    for flag, op in (("since", ">="), ("until", "<")):
+        value = getattr(args, flag)
+        if value is not None:
+            ts = parse_timestamp(value)
+            if ts is None:
+                raise ValueError(f"--{flag}: not an ISO date or timestamp: {value}")
+            clauses.append(f"r.ts_utc {op} ?")
+            params.append(ts)
+    if args.touched is not None:
+        clauses.append("r.id IN (SELECT run FROM files_touched WHERE path = ?)")
+        params.append(args.touched)
+    if args.command is not None:
+        clauses.append("r.id IN (SELECT run FROM commands_executed WHERE command = ?)")
+        params.append(args.command)
+    if args.synchronization is not None:
+        clauses.append("r.id IN (SELECT run FROM synchronizations_used WHERE synchronization = ?)")
+        params.append(args.synchronization)
+    columns = list(RUN_COLUMNS) + ["source"]
+    sql = (
+        f"SELECT {', '.join('r.' + column for column in RUN_COLUMNS)}, f.path || '@' || r.offset "
+        "FROM runs r JOIN files f ON f.id = r.file_id"
+        + (f" WHERE {' AND '.join(clauses)}" if clauses else "")
+        + " ORDER BY r.ts_utc DESC, r.id DESC LIMIT ?"
+    )
+    return columns, conn.execute(sql, (*params, args.limit)).fetchall()
+
+
+def query_fix_loops(conn: sqlite3.Connection, args: argparse.Namespace) -> tuple[list[str], list[tuple[Any, ...]]]:
+    column = GROUP_COLUMNS[args.by]
+    rows = conn.execute(
+        f"SELECT {column}, COUNT(*), SUM(outcome = 'fail'), SUM(fix_loop_count), "
+        "ROUND(AVG(fix_loop_count), 2), MAX(fix_loop_count) "
+        f"FROM runs GROUP BY {column} ORDER BY SUM(fix_loop_count) DESC, COUNT(*) DESC, {column}"
+    ).fetchall()
+    return [column, "runs", "failed", "fix_loops", "avg", "max"], rows
+
+
+def query_sql(db_path: Path, statement: str) -> tuple[list[str], list[tuple[Any, ...]]]:
+    # Read-only connection: ad-hoc queries cannot modify the index.
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(statement)
+        return [column[0] for column in cursor.description or ()], cursor.fetchall()
+    finally:
+        conn.close()
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Index run records (runs/**/*.jsonl) into SQLite and query them.")
+    parser.add_argument("--root", type=Path, default=ROOT, help="Repository root (default: this checkout).")
+    parser.add_argument("--db", type=Path, default=None, help=f"Index database (default: {DB_PATH.relative_to(ROOT)}).")
+    parser.add_argument("--no-refresh", action="store_true", help="Query the index as is, without ingesting new lines.")
+    sub = parser.add_subparsers(dest="command_name", required=True)
+
+    index = sub.add_parser("index", help="Ingest new run-record lines.")
+    index.add_argument("--rebuild", action="store_true", help="Drop the index and re-read every file.")
+
+    runs = sub.add_parser("runs", help="List run records, newest first.")
+    runs.add_argument("--run-id", dest="run_id")
+    runs.add_argument("--concept", dest="concept_id")
+    runs.add_argument("--skill", dest="skill_id")
+    runs.add_argument("--spec", dest="spec_id")
+    runs.add_argument("--outcome", choices=("pass", "fail"))
+    runs.add_argument("--touched", metavar="PATH", help="Only runs whose files_touched include PATH.")
+    runs.add_argument("--command", metavar="CMD", help="Only runs whose commands_executed include CMD.")
+    runs.add_argument("--synchronization", metavar="NAME", help="Only runs that used synchronization NAME.")
+    runs.add_argument("--since", help="ISO date/timestamp (inclusive; naive values are UTC).")
+    runs.add_argument("--until", help="ISO date/timestamp (exclusive).")
+    runs.add_argument("--limit", type=int, default=100)
+    runs.add_argument("--json", action="store_true", help="One JSON object per line.")
+
+    fix_loops = sub.add_parser("fix-loops", help="Fix-loop counts and failures per group.")
+    fix_loops.add_argument("--by", choices=sorted(GROUP_COLUMNS), default="skill")
+    fix_loops.add_argument("--json", action="store_true", help="One JSON object per line.")
+
+    sql = sub.add_parser("sql", help="Run a read-only SQL statement against the index.")
+    sql.add_argument("statement")
+    sql.add_argument("--json", action="store_true", help="One JSON object per line.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    root = args.root.resolve()
+    db_path = (args.db or (root / DB_PATH.relative_to(ROOT))).resolve()
+    if args.command_name == "index" and args.rebuild and db_path.exists():
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+    started = time.perf_counter()
+    try:
+        conn = connect(db_path)
+        try:
+            stats = refresh(conn, root) if args.command_name == "index" or not args.no_refresh else None
+            if args.command_name == "index":
+                elapsed = (time.perf_counter() - started) * 1000
+                total = conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+                print(
+                    f"Indexed {stats['indexed']} new records from {stats['read']} of {stats['files']} files "
+                    f"({stats['skipped']} skipped, {stats['reset']} re-read, {stats['removed']} removed); "
+                    f"{total} runs in index, {elapsed:.1f} ms."
+                )
+                return 0
+            if args.command_name == "runs":
+                columns, rows = query_runs(conn, args)
+            elif args.command_name == "fix-loops":
+                columns, rows = query_fix_loops(conn, args)
+        finally:
+            conn.close()
+        if args.command_name == "sql":
+            columns, rows = query_sql(db_path, args.statement)
+    except (sqlite3.Error, ValueError, OSError) as exc:
+        _eprint(f"ERROR: {exc}")
+        return 1
+    try:
+        _print_rows(columns, rows, args.json)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader (head, grep -q) has what it wanted; skip the flush at exit that would fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
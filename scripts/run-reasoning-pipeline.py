@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""Execute the Reasoning Skills pipeline (skills/reasoning/pipeline.yaml) against a task context.
+
+Every pipeline entry is evaluated by the check registered under its skill_name
+(built-ins below; extra or overriding checks via --checks FILE defining a
+CHECKS mapping of skill_name to a callable(manifest, context) that returns a
+StepResult or a {guarantees, violations, abort_reason} mapping). The run stops
+at the first step that returns an abort_reason. One reasoning record per
+evaluated step is written as JSONL in the runs/<date>/reasoning.jsonl format;
+per-step timings go to stderr as a reasoning_pipeline_report line.
+
+Step results are memoized in .uip-cache/reasoning.json per (step, spec_id,
+concept_id, input hash); edits to this script, a --checks file or a step
+manifest invalidate them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_PATH = ROOT / ".uip-cache" / "reasoning.json"
+CACHE_VERSION = 1
+# Oldest entries are dropped beyond this; a context rarely repeats after that.
+CACHE_MAX_ENTRIES = 512
+
+
+def _load_validator() -> Any:
+    # Manifest parsing and validation stay in validate-reasoning-skills.py.
+    path = Path(__file__).resolve().parent / "validate-reasoning-skills.py"
+    spec = importlib.util.spec_from_file_location("validate_reasoning_skills", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+validator = _load_validator()
+
+
+class PipelineError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ReasoningContext:
+    """The task context as the checks see it, with spec and concept references resolved."""
+
+    raw: dict[str, Any]
+    approved_spec_ids: tuple[str, ...]
+    active_spec: Optional[str]
+    active_concepts: tuple[str, ...]
+    concept_registry: tuple[str, ...]
+    spec_id: Optional[str]
+    concept_id: Optional[str]
+
+    def normalized(self) -> dict[str, Any]:
+        return {"context": self.raw, "concept_registry": list(self.concept_registry)}
+
+
+@dataclass
+class StepResult:
+    guarantees: list[str] = field(default_factory=list)
+    violations: list[str] = field(default_factory=list)
+    abort_reason: Optional[str] = None
+
+    def to_json(self) -> dict[str, Any]:
+        return {"guarantees": self.guarantees, "violations": self.violations, "abort_reason": self.abort_reason}
+
+    @classmethod
+    def from_json(cls, data: Any) -> Optional["StepResult"]:
+        if not isinstance(data, dict):
+            return None
+        return cls(list(data.get("guarantees") or []), list(data.get("violations") or []), data.get("abort_reason"))
+
+
+Check = Callable[[dict[str, Any], ReasoningContext], StepResult]
+CHECKS: dict[str, Check] = {}
+
+
+def check(name: str) -> Callable[[Check], Check]:
+    def register(fn: Check) -> Check:
+        CHECKS[name] = fn
+        return fn
+
+    return register
+
+
+def _failure(manifest: dict[str, Any], index: int) -> str:
+    # Abort reasons quote the manifest's failure_conditions so the manifest stays the source of truth.
+    conditions = manifest["failure_conditions"]
+    return conditions[min(index, len(conditions) - 1)]
+
+
+def _passed(manifest: dict[str, Any], violations: Optional[list[str]] = None) -> StepResult:
+    return StepResult(list(manifest["guarantees"]), violations or [])
+
+
+@check("bind_spec_id")
+def check_bind_spec_id(manifest: dict[str, Any], ctx: ReasoningContext) -> StepResult:
+    if not ctx.approved_spec_ids:
+        return StepResult(abort_reason=_failure(manifest, 0))
+    if ctx.active_spec is not None and ctx.active_spec not in ctx.approved_spec_ids:
+        violation = f"active_spec '{ctx.active_spec}' is not an approved spec ID"
+        return StepResult(violations=[violation], abort_reason=_failure(manifest, 1))
+    if ctx.active_spec is None and len(ctx.approved_spec_ids) > 1:
+        violations = [f"approved spec ID '{spec}' is unbound" for spec in ctx.approved_spec_ids]
+        return StepResult(violations=violations, abort_reason=_failure(manifest, 1))
+    return _passed(manifest)
+
+
+@check("enforce_single_concept")
+def check_enforce_single_concept(manifest: dict[str, Any], ctx: ReasoningContext) -> StepResult:
+    if not ctx.active_concepts:
+        return StepResult(abort_reason=_failure(manifest, 0))
+    if len(ctx.active_concepts) > 1:
+        violations = [f"concept '{concept}' is also active" for concept in ctx.active_concepts[1:]]
+        return StepResult(violations=violations, abort_reason=_failure(manifest, 1))
+    if ctx.active_concepts[0] not in ctx.concept_registry:
+        violation = f"concept '{ctx.active_concepts[0]}' is not in the concept registry"
+        return StepResult(violations=[violation], abort_reason=_failure(manifest, 0))
+    return _passed(manifest)
+
+
+def _iter_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_strings(item)
+
+
+def _owning_concept(reference: str, concepts: tuple[str, ...]) -> Optional[str]:
+    ref = reference.strip().replace("\\", "/").removeprefix("./")
+    for concept in concepts:
+        if ref == f"concepts/{concept}" or ref.startswith((f"concepts/{concept}/", f"specs/{concept}.")):
+            return concept
+        if ref.startswith((f"{concept}:", f"{concept}.")):
+            return concept
+    return None
+
+
+@check("forbid_cross_concept_reasoning")
+def check_forbid_cross_concept_reasoning(manifest: dict[str, Any], ctx: ReasoningContext) -> StepResult:
+    if ctx.concept_id is None:
+        return StepResult(violations=["no single active Concept to scope against"], abort_reason=_failure(manifest, 0))
+    others = tuple(concept for concept in ctx.concept_registry if concept != ctx.concept_id)
+    violations: list[str] = []
+    for reference in _iter_strings(ctx.raw.get("task_context")):
+        owner = _owning_concept(reference, others)
+        message = f"'{reference}' belongs to concept '{owner}'"
+        if owner is not None and message not in violations:
+            violations.append(message)
+    if violations:
+        return StepResult(violations=violations, abort_reason=_failure(manifest, 0))
+    return _passed(manifest)
+
+
+def _string_list(value: Any) -> list[str]:
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    out: list[str] = []
+    for item in value:
+        if isinstance(item, str) and item.strip() and item.strip() not in out:
+            out.append(item.strip())
+    return out
+
+
+def concept_id_for(reference: str) -> str:
+    """Concept id from an id, concepts/<id>, or concepts/<id>/manifest.yaml reference."""
+    parts = [part for part in reference.replace("\\", "/").split("/") if part not in {"", "."}]
+    if len(parts) >= 2 and parts[0] == "concepts":
+        return parts[1]
+    if parts and parts[-1] == "manifest.yaml" and len(parts) >= 2:
+        return parts[-2]
+    return parts[-1] if parts else reference
+
+
+def build_context(root: Path, raw: Any) -> ReasoningContext:
+    if not isinstance(raw, dict):
+        raise PipelineError("task context must be a JSON object")
+    approved = _string_list(raw.get("approved_spec_ids"))
+    active_spec = raw.get("active_spec") if isinstance(raw.get("active_spec"), str) else None
+    active = list(dict.fromkeys(concept_id_for(ref) for ref in _string_list(raw.get("active_concept_manifest"))))
+    if "concept_registry" in raw:
+        registry = list(dict.fromkeys(concept_id_for(ref) for ref in _string_list(raw.get("concept_registry"))))
+    else:
+        registry = sorted(path.parent.name for path in (root / "concepts").glob("*/manifest.yaml"))
+    spec_id = active_spec or (approved[0] if len(approved) == 1 else None)
+    return ReasoningContext(
+        raw=raw,
+        approved_spec_ids=tuple(approved),
+        active_spec=active_spec,
+        active_concepts=tuple(active),
+        concept_registry=tuple(registry),
+        spec_id=spec_id,
+        concept_id=active[0] if len(active) == 1 else None,
+    )
+
+
+def load_steps(root: Path) -> list[dict[str, Any]]:
+    reasoning_dir = root / "skills" / "reasoning"
+    pipeline_path = reasoning_dir / "pipeline.yaml"
+    try:
+        pipeline = validator._load_yaml(pipeline_path)
+    except (OSError, validator.ValidationError) as exc:
+        raise PipelineError(f"{pipeline_path}: {exc}") from None
+    names = pipeline.get("reasoning") if isinstance(pipeline, dict) else None
+    manifest_names = {path.stem for path in reasoning_dir.glob("*.yaml")}
+    errors, _ = validator._validate_pipeline(pipeline_path, pipeline, manifest_names, False)
+    steps: list[dict[str, Any]] = []
+    for name in names if not errors else []:
+        path = reasoning_dir / f"{name}.yaml"
+        try:
+            manifest = validator._load_yaml(path)
+        except validator.ValidationError as exc:
+            errors.append(f"{path.name}: {exc}")
+            continue
+        errors.extend(validator._validate_manifest(path, manifest))
+        if name not in CHECKS:
+            errors.append(f"{path.name}: no check registered for '{name}'")
+        steps.append(manifest)
+    if errors:
+        raise PipelineError("; ".join(errors))
+    return steps
+
+
+def load_check_files(paths: list[Path]) -> None:
+    for path in paths:
+        spec = importlib.util.spec_from_file_location(f"reasoning_checks_{path.stem}", path)
+        if spec is None or spec.loader is None:
+            raise PipelineError(f"cannot load checks from {path}")
+        module = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(module)
+        except Exception as exc:
+            raise PipelineError(f"{path}: {type(exc).__name__}: {exc}") from None
+        extra = getattr(module, "CHECKS", None)
+        if not isinstance(extra, dict) or not all(callable(fn) for fn in extra.values()):
+            raise PipelineError(f"{path}: must define CHECKS as a mapping of skill_name to callable")
+        CHECKS.update(extra)
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def rules_hash(check_files: list[Path]) -> str:
+    digest = hashlib.sha256(str(CACHE_VERSION).encode("utf-8"))
+    for source in (Path(__file__).resolve(), *check_files):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def step_key(rules: str, manifest: dict[str, Any], ctx: ReasoningContext, input_hash: str) -> str:
+    return hashlib.sha256(_canonical([rules, manifest, ctx.spec_id, ctx.concept_id, input_hash])).hexdigest()
+
+
+def load_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(path: Path, entries: dict[str, Any]) -> None:
+    keep = dict(list(entries.items())[-CACHE_MAX_ENTRIES:])
+    payload = {"version": CACHE_VERSION, "entries": keep}
+    tmp_name: Optional[str] = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".reasoning.", suffix=".tmp", dir=str(path.parent))
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except OSError:
+        # The cache is an accelerator only; a read-only checkout still runs the checks.
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def run_pipeline(
+    steps: list[dict[str, Any]],
+    ctx: ReasoningContext,
+    cache: Optional[dict[str, Any]],
+    rules: str,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Evaluate steps in order until one aborts; returns (reasoning records, timing rows)."""
+    input_hash = hashlib.sha256(_canonical(ctx.normalized())).hexdigest()
+    records: list[dict[str, Any]] = []
+    timings: list[dict[str, Any]] = []
+    for order, manifest in enumerate(steps, start=1):
+        name = manifest["skill_name"]
+        started = time.perf_counter()
+        key = step_key(rules, manifest, ctx, input_hash)
+        result = StepResult.from_json(cache.get(key)) if cache is not None else None
+        hit = result is not None
+        if result is None:
+            result = CHECKS[name](manifest, ctx)
+            if not isinstance(result, StepResult):
+                # --checks files need not import this script: a plain mapping works too.
+                result = StepResult.from_json(result) or StepResult(abort_reason=f"check '{name}' returned no result")
+            if cache is not None:
+                cache.pop(key, None)
+                cache[key] = result.to_json()
+        records.append(
+            {
+                "event_type": "reasoning",
+                "skill_name": name,
+                "order": order,
+                "spec_id": ctx.spec_id,
+                "concept_id": ctx.concept_id,
+                **result.to_json(),
+            }
+        )
+        status = "abort" if result.abort_reason else ("violations" if result.violations else "pass")
+        timings.append(
+            {
+                "skill_name": name,
+                "order": order,
+                "status": status,
+                "cache": "hit" if hit else ("miss" if cache is not None else "off"),
+                "durationMs": round((time.perf_counter() - started) * 1000, 3),
+            }
+        )
+        if result.abort_reason:
+            break
+    return records, timings
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Execute the Reasoning Skills pipeline against a task context.")
+    parser.add_argument("--root", type=Path, default=ROOT, help="Repository root (default: this checkout).")
+    parser.add_argument("--input", default="-", help="Task context JSON file, or - for stdin (default).")
+    parser.add_argument("--output", type=Path, default=None, help="Append reasoning JSONL here instead of stdout.")
+    parser.add_argument(
+        "--checks",
+        type=Path,
+        action="append",
+        default=[],
+        help="Python file defining CHECKS = {skill_name: callable}; repeatable, later files win.",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the step cache.")
+    parser.add_argument(
+        "--cache", type=Path, default=None, help=f"Cache file (default: {CACHE_PATH.relative_to(ROOT)})."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    root = args.root.resolve()
+    cache_path = args.cache or (root / CACHE_PATH.relative_to(ROOT))
+    started = time.perf_counter()
+    try:
+        check_files = [path.resolve() for path in args.checks]
+        load_check_files(check_files)
+        steps = load_steps(root)
+        text = sys.stdin.read() if args.input == "-" else Path(args.input).read_text(encoding="utf-8")
+        ctx = build_context(root, json.loads(text))
+    except (OSError, ValueError, PipelineError) as exc:
+        print(f"reasoning pipeline: {exc}", file=sys.stderr)
+        return 2
+
+    rules = rules_hash(check_files)
+    cache = None if args.no_cache else load_cache(cache_path)
+    records, timings = run_pipeline(steps, ctx, cache, rules)
+    if cache is not None:
+        save_cache(cache_path, cache)
+
+    lines = "".join(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n" for record in records)
+    if args.output is None:
+        sys.stdout.write(lines)
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with args.output.open("a", encoding="utf-8") as handle:
+            handle.write(lines)
+
+    aborted = records[-1] if records and records[-1]["abort_reason"] else None
+    report = {
+        "event": "reasoning_pipeline_report",
+        "spec_id": ctx.spec_id,
+        "concept_id": ctx.concept_id,
+        "steps": timings,
+        "abortedAt": aborted["skill_name"] if aborted else None,
+        "durationMs": round((time.perf_counter() - started) * 1000, 3),
+    }
+    print(json.dumps(report, sort_keys=True, separators=(",", ":")), file=sys.stderr)
+    return 1 if aborted else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
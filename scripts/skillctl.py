@@ -3,22 +3,34 @@
 from __future__ import annotations
 
 import argparse
+import base64
+import codecs
+import hashlib
+import io
 import json
+import math
 import os
+import queue
 import re
-import shutil
+import select
+import selectors
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-import uuid
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator
 
-try:
-    import jsonschema  # type: ignore
-except Exception:  # pragma: no cover
-    jsonschema = None  # type: ignore
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# Imported on first use by _require_deps(): read-only commands (list, describe,
+# stats, fully cached validate) never pay for jsonschema and its dependencies.
+jsonschema: Any = None
 
 
 class SkillctlError(Exception):
@@ -38,9 +50,16 @@ def _eprint(message: str) -> None:
 
 
 def _require_deps() -> None:
+    global jsonschema
+    if jsonschema is not None:
+        return
     missing = []
-    if jsonschema is None:
+    try:
+        import jsonschema as module  # type: ignore
+    except Exception:  # pragma: no cover
+        module = None
         missing.append("jsonschema")
+    jsonschema = module
     if missing:
         _eprint(f"Missing dependencies: {', '.join(missing)}")
         _eprint("Set up a dedicated venv, e.g.:")
@@ -65,18 +84,6 @@ def _skills_root(repo_root: Path) -> Path:
     return skills_dir
 
 
-def _iter_skill_dirs(skills_dir: Path) -> list[Path]:
-    out: list[Path] = []
-    for entry in sorted(skills_dir.iterdir(), key=lambda p: p.name):
-        if not entry.is_dir():
-            continue
-        if entry.name.startswith("_"):
-            continue
-        if (entry / "skill.yaml").exists():
-            out.append(entry)
-    return out
-
-
 def _strip_yaml_comment(line: str) -> str:
     in_single = False
     in_double = False
@@ -234,10 +241,98 @@ def _json_pointer(err: Any) -> str:
     return "/" + "/".join(parts)
 
 
+VALIDATORS_VERSION = 1
+
+
+class ValidatorCache:
+    """Compiled jsonschema validators keyed by schema content hash.
+
+    Validators are reused for the life of the process. The hashes of schemas
+    that already passed the meta-schema check are also persisted (per
+    jsonschema version), so later processes skip ``check_schema``, which
+    dominates the cost of ``jsonschema.validate`` for small instances.
+    """
+
+    def __init__(self) -> None:
+        self._validators: dict[str, Any] = {}
+        self._checked: set[str] = set()
+        self._path: Path | None = None
+        self._loaded = False
+        self._dirty = False
+
+    @staticmethod
+    def _library_version() -> str:
+        try:
+            from importlib.metadata import version
+
+            return version("jsonschema")
+        except Exception:
+            return "unknown"
+
+    def attach(self, path: Path) -> None:
+        # The store is read on first use, so commands that never validate skip it.
+        self._path = path
+        self._loaded = False
+
+    def _load(self) -> None:
+        self._loaded = True
+        if self._path is None:
+            return
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != VALIDATORS_VERSION:
+            return
+        if data.get("jsonschema") != self._library_version():
+            return
+        checked = data.get("checked")
+        if isinstance(checked, list):
+            self._checked.update(item for item in checked if isinstance(item, str))
+
+    def validator(self, schema: Any) -> Any:
+        _require_deps()
+        if not self._loaded:
+            self._load()
+        key = hashlib.sha256(_canonical_json(schema).encode("utf-8")).hexdigest()
+        cached = self._validators.get(key)
+        if cached is not None:
+            return cached
+        validator_cls = jsonschema.validators.validator_for(schema)
+        if key not in self._checked:
+            validator_cls.check_schema(schema)
+            self._checked.add(key)
+            self._dirty = True
+        cached = validator_cls(schema)
+        self._validators[key] = cached
+        return cached
+
+    def validate(self, instance: Any, schema: Any) -> None:
+        validator = self.validator(schema)
+        # Same error selection as jsonschema.validate().
+        error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def save(self) -> None:
+        if self._path is None or not self._dirty:
+            return
+        _write_json_atomic(
+            self._path,
+            {
+                "version": VALIDATORS_VERSION,
+                "jsonschema": self._library_version(),
+                "checked": sorted(self._checked),
+            },
+        )
+        self._dirty = False
+
+
+VALIDATORS = ValidatorCache()
+
+
 def _validate_manifest(manifest: dict[str, Any], schema: dict[str, Any]) -> None:
-    _require_deps()
-    validator_cls = jsonschema.validators.validator_for(schema)
-    validator = validator_cls(schema)
+    validator = VALIDATORS.validator(schema)
     errors = sorted(validator.iter_errors(manifest), key=lambda e: (list(e.path), e.message))
     if errors:
         lines = ["Manifest validation failed:"]
@@ -270,12 +365,184 @@ def _resolve_skill_dir(repo_root: Path, target: str, allow_template: bool = True
             raise SkillctlError("Template/internal skills cannot be targeted without explicit allowance")
         return skill_dir
 
-    skills_dir = _skills_root(repo_root)
-    for skill_dir in _iter_skill_dirs(skills_dir):
-        manifest = _load_yaml(skill_dir / "skill.yaml")
-        if manifest.get("id") == target:
-            return skill_dir
-    raise SkillctlError(f"Unknown skill id: {target}")
+    ref = _load_registry(repo_root).get(target)
+    if ref is None:
+        raise SkillctlError(f"Unknown skill id: {target}")
+    return ref.path
+
+
+REGISTRY_VERSION = 2
+# Manifest fields a SkillRef needs; entries missing any are not resolvable.
+_REGISTRY_FIELDS = ("id", "version", "name")
+CACHE_DIR_ENV = "SKILLCTL_CACHE_DIR"
+
+
+def _cache_dir(repo_root: Path) -> Path:
+    override = os.environ.get(CACHE_DIR_ENV)
+    return Path(override) if override else repo_root / ".skillctl-cache"
+
+
+# Set by --no-cache: persistent caches are neither read nor written.
+_PERSIST_CACHES = True
+
+
+def _write_json_atomic(path: Path, payload: Any) -> None:
+    tmp_name: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp_name, path)
+    except OSError:
+        # Caches are accelerators only; a read-only checkout still works.
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+class SkillRegistry:
+    """Persistent id -> skill index under the skillctl cache directory.
+
+    The skills/ listing is reused while the directory mtime is unchanged, and
+    a skill's entry while its skill.yaml (mtime, size) is unchanged, so a warm
+    lookup costs one stat per skill and never parses YAML. A manifest missing
+    id, version or name stays indexed (so validate --all still reports it)
+    but is neither listed nor resolvable by id.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.skills_dir = _skills_root(repo_root)
+        self.path = _cache_dir(repo_root) / "registry.json" if _PERSIST_CACHES else None
+        self._listing: dict[str, Any] = {}
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._by_id: dict[str, str] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != REGISTRY_VERSION:
+            return
+        if data.get("skillsDir") != str(self.skills_dir):
+            return
+        listing = data.get("listing")
+        entries = data.get("entries")
+        if isinstance(listing, dict) and isinstance(entries, dict):
+            self._listing = listing
+            self._entries = entries
+
+    def refresh(self) -> "SkillRegistry":
+        mtime_ns = self.skills_dir.stat().st_mtime_ns
+        if self._listing.get("mtime_ns") != mtime_ns:
+            names = [
+                entry.name
+                for entry in sorted(self.skills_dir.iterdir(), key=lambda p: p.name)
+                if entry.is_dir() and not entry.name.startswith("_")
+            ]
+            self._listing = {"mtime_ns": mtime_ns, "dirs": names}
+            self._dirty = True
+
+        entries: dict[str, dict[str, Any]] = {}
+        for name in self._listing["dirs"]:
+            manifest_path = self.skills_dir / name / "skill.yaml"
+            try:
+                st = manifest_path.stat()
+            except OSError:
+                continue
+            signature = [st.st_mtime_ns, st.st_size]
+            previous = self._entries.get(name)
+            if previous is not None and previous.get("sig") == signature:
+                entries[name] = previous
+                continue
+            raw = manifest_path.read_bytes()
+            manifest = _load_yaml(manifest_path)
+            entry: dict[str, Any] = {"sig": signature, "manifestHash": hashlib.sha256(raw).hexdigest()}
+            for key in _REGISTRY_FIELDS:
+                value = manifest.get(key)
+                entry[key] = None if value is None else str(value)
+            entries[name] = entry
+            self._dirty = True
+        if entries.keys() != self._entries.keys():
+            self._dirty = True
+        by_id: dict[str, str] = {}
+        for name, entry in entries.items():
+            if self._missing(entry):
+                continue
+            # First directory (sorted) wins, matching the previous linear scan.
+            by_id.setdefault(entry["id"], name)
+        # Swap whole dicts so a served lookup never sees a half-built index.
+        self._entries, self._by_id = entries, by_id
+        return self
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        _write_json_atomic(
+            self.path,
+            {
+                "version": REGISTRY_VERSION,
+                "skillsDir": str(self.skills_dir),
+                "listing": self._listing,
+                "entries": self._entries,
+            },
+        )
+        self._dirty = False
+
+    def _ref(self, name: str) -> SkillRef:
+        entry = self._entries[name]
+        return SkillRef(id=entry["id"], version=entry["version"], name=entry["name"], path=self.skills_dir / name)
+
+    @staticmethod
+    def _missing(entry: dict[str, Any]) -> list[str]:
+        return [key for key in _REGISTRY_FIELDS if entry.get(key) is None]
+
+    def refs(self) -> list[SkillRef]:
+        return [self._ref(name) for name, entry in self._entries.items() if not self._missing(entry)]
+
+    def skill_dirs(self) -> list[Path]:
+        """Every indexed skill directory, including ones whose manifest is incomplete."""
+        return [self.skills_dir / name for name in self._entries]
+
+    def incomplete(self) -> list[tuple[Path, list[str]]]:
+        return [
+            (self.skills_dir / name, missing)
+            for name, entry in self._entries.items()
+            if (missing := self._missing(entry))
+        ]
+
+    def get(self, skill_id: str) -> SkillRef | None:
+        name = self._by_id.get(skill_id)
+        return self._ref(name) if name is not None else None
+
+    def manifest_hash(self, skill_dir: Path) -> str | None:
+        entry = self._entries.get(skill_dir.name)
+        if entry is None or skill_dir.parent != self.skills_dir:
+            return None
+        return entry["manifestHash"]
+
+
+# Held by `skillctl serve`: one warm registry, revalidated by stat on each lookup
+# instead of being reloaded from registry.json per request.
+_SHARED_REGISTRY: SkillRegistry | None = None
+_SHARED_REGISTRY_LOCK = threading.Lock()
+
+
+def _load_registry(repo_root: Path) -> SkillRegistry:
+    shared = _SHARED_REGISTRY
+    if shared is not None and shared.repo_root == repo_root:
+        with _SHARED_REGISTRY_LOCK:
+            shared.refresh()
+            shared.save()
+        return shared
+    registry = SkillRegistry(repo_root).refresh()
+    registry.save()
+    return registry
 
 
 def _skill_ref_from_manifest(skill_dir: Path, manifest: dict[str, Any]) -> SkillRef:
@@ -291,12 +558,70 @@ def _canonical_json(obj: Any) -> str:
     return json.dumps(obj, separators=(",", ":"), sort_keys=True) + "\n"
 
 
+def _iter_json_members(obj: Any, depth: int) -> Iterator[str]:
+    if depth and isinstance(obj, dict) and obj:
+        sep = "{"
+        for key in sorted(obj):
+            yield sep + json.dumps(key) + ":"
+            yield from _iter_json_members(obj[key], depth - 1)
+            sep = ","
+        yield "}"
+    elif depth and isinstance(obj, list) and obj:
+        sep = "["
+        for item in obj:
+            yield sep
+            yield from _iter_json_members(item, depth - 1)
+            sep = ","
+        yield "]"
+    else:
+        yield json.dumps(obj, separators=(",", ":"), sort_keys=True)
+
+
+def _iter_canonical_json(obj: Any) -> Iterator[str]:
+    """Yield ``_canonical_json(obj)`` in pieces, one container member at a time.
+
+    The top two levels of objects and arrays are split per member; below that
+    each member is encoded whole by the C encoder, which a fully iterative
+    ``JSONEncoder.iterencode`` would give up.
+    """
+    yield from _iter_json_members(obj, 2)
+    yield "\n"
+
+
+def _emit_output(obj: Any, output: str | None, tee: bool) -> None:
+    """Stream a validated output to ``output`` (atomically) and/or stdout.
+
+    The canonical encoding goes straight to every destination piece by piece,
+    so no second full-size copy of the output is built.
+    """
+    sinks: list[BinaryIO] = [sys.stdout.buffer] if output is None or tee else []
+    if output is None:
+        for piece in _iter_canonical_json(obj):
+            sys.stdout.buffer.write(piece.encode("utf-8"))
+        return
+    path = Path(output).resolve()
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            for piece in _iter_canonical_json(obj):
+                data = piece.encode("utf-8")
+                handle.write(data)
+                for sink in sinks:
+                    sink.write(data)
+        # A failed or interrupted write never leaves a partial file.
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
 def cmd_list(repo_root: Path, args: argparse.Namespace) -> int:
-    skills_dir = _skills_root(repo_root)
-    skills = []
-    for skill_dir in _iter_skill_dirs(skills_dir):
-        manifest = _load_yaml(skill_dir / "skill.yaml")
-        skills.append(_skill_ref_from_manifest(skill_dir, manifest))
+    registry = _load_registry(repo_root)
+    for skill_dir, missing in registry.incomplete():
+        fields = ", ".join(missing)
+        _eprint(f"Skipping {skill_dir.relative_to(repo_root)}: skill.yaml is missing {fields}")
+    skills = registry.refs()
 
     if args.json:
         payload = [
@@ -331,25 +656,112 @@ def _validate_skill_dir(repo_root: Path, skill_dir: Path, args: argparse.Namespa
 
     input_schema_rel = manifest["io"]["inputSchema"]
     output_schema_rel = manifest["io"]["outputSchema"]
-    _load_json(_safe_join(skill_dir, input_schema_rel))
-    _load_json(_safe_join(skill_dir, output_schema_rel))
+    for rel in (input_schema_rel, output_schema_rel):
+        schema = _load_json(_safe_join(skill_dir, rel))
+        try:
+            VALIDATORS.validator(schema)
+        except jsonschema.exceptions.SchemaError as e:
+            raise SkillctlError(f"Invalid JSON Schema at {rel}: {e.message}") from e
+
+
+VALIDATE_CACHE_VERSION = 2
+# I/O schemas may live anywhere in the skill directory, fixtures included.
+_VALIDATE_TREE_SKIP = frozenset({"__pycache__", "node_modules"})
+
+
+def _validate_target(repo_root: Path, target: str, allow_template: bool) -> str | None:
+    """Validate one target; returns the failure message or None. Runs in pool workers."""
+    try:
+        skill_dir = _resolve_skill_dir(repo_root, target, allow_template=allow_template)
+        _validate_skill_dir(repo_root, skill_dir, None)
+    except Exception as e:
+        return f"{target}: {e}"
+    return None
+
+
+def _validation_key(repo_root: Path, target: str, allow_template: bool, base: str) -> str | None:
+    """Hash of everything a validation result depends on, or None if it cannot be computed.
+
+    Built from raw bytes only (the manifest and a hash of the skill tree, which
+    holds its I/O schemas), so a warm run never parses YAML in the parent.
+    """
+    try:
+        skill_dir = _resolve_skill_dir(repo_root, target, allow_template=allow_template)
+        manifest_raw = (skill_dir / "skill.yaml").read_bytes()
+        digest = hashlib.sha256(base.encode("utf-8"))
+        digest.update(str(skill_dir).encode("utf-8") + b"\0" + str(allow_template).encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(manifest_raw).digest())
+        digest.update(_tree_hash(skill_dir, _VALIDATE_TREE_SKIP).encode("utf-8"))
+    except (OSError, SkillctlError):
+        return None
+    return digest.hexdigest()
 
 
 def cmd_validate(repo_root: Path, args: argparse.Namespace) -> int:
     targets = []
     if args.all:
-        targets = [str(p.relative_to(repo_root)) for p in _iter_skill_dirs(_skills_root(repo_root))]
+        targets = [str(path.relative_to(repo_root)) for path in _load_registry(repo_root).skill_dirs()]
     else:
         targets = args.targets
 
-    failures: list[str] = []
-    for target in targets:
+    # Results are reused while the manifest, the skill tree (I/O schemas
+    # included), the contract schema, jsonschema and skillctl are unchanged.
+    cache_path = _cache_dir(repo_root) / "validate.json" if _PERSIST_CACHES else None
+    cached: dict[str, Any] = {}
+    base = ""
+    if cache_path is not None:
+        contract_path = _skills_root(repo_root) / "_schema" / "skill.schema.json"
         try:
-            skill_dir = _resolve_skill_dir(repo_root, target, allow_template=args.allow_template)
-            _validate_skill_dir(repo_root, skill_dir, args)
-        except Exception as e:
-            failures.append(f"{target}: {e}")
+            base = _canonical_json(
+                [
+                    VALIDATE_CACHE_VERSION,
+                    ValidatorCache._library_version(),
+                    hashlib.sha256(contract_path.read_bytes()).hexdigest(),
+                    hashlib.sha256(Path(__file__).read_bytes()).hexdigest(),
+                ]
+            )
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            if isinstance(data, dict) and isinstance(data.get("entries"), dict):
+                cached = data["entries"]
+        except (OSError, ValueError):
+            pass
 
+    results: dict[str, str | None] = {}
+    keys: dict[str, str | None] = {}
+    todo: list[str] = []
+    for target in targets:
+        key = _validation_key(repo_root, target, args.allow_template, base) if cache_path is not None else None
+        keys[target] = key
+        entry = cached.get(key) if key is not None else None
+        if isinstance(entry, dict) and "failure" in entry:
+            results[target] = entry["failure"]
+        else:
+            todo.append(target)
+
+    jobs = max(1, min(args.jobs, len(todo)))
+    if jobs > 1:
+        # Imported here: multiprocessing is a large share of skillctl's startup cost.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            outcomes = pool.map(
+                _validate_target, [repo_root] * len(todo), todo, [args.allow_template] * len(todo)
+            )
+            results.update(zip(todo, outcomes))
+    else:
+        for target in todo:
+            results[target] = _validate_target(repo_root, target, args.allow_template)
+
+    if cache_path is not None and todo:
+        # Drop superseded results for re-validated targets so the cache stays small.
+        entries = {k: v for k, v in cached.items() if not (isinstance(v, dict) and v.get("target") in todo)}
+        for target in todo:
+            key = keys[target]
+            if key is not None:
+                entries[key] = {"target": target, "failure": results[target]}
+        _write_json_atomic(cache_path, {"version": VALIDATE_CACHE_VERSION, "entries": entries})
+
+    failures = [results[target] for target in targets if results[target] is not None]
     if failures:
         _eprint("Validation failed:")
         for f in failures:
@@ -359,16 +771,995 @@ def cmd_validate(repo_root: Path, args: argparse.Namespace) -> int:
     return 0
 
 
-def cmd_run(repo_root: Path, args: argparse.Namespace) -> int:
-    skill_dir = _resolve_skill_dir(repo_root, args.target, allow_template=args.allow_template)
+@dataclass(frozen=True)
+class PreparedSkill:
+    ref: SkillRef
+    manifest: dict[str, Any]
+    input_schema: Any
+    output_schema: Any
+    command: list[str]
+    cwd: Path
+    timeout_ms: int
+    mode: str = "oneshot"
+    max_requests: int = 1000
+    health_check: bool = True
+    startup_timeout_ms: int = 60000
+    max_output_bytes: int = 16 * 1024 * 1024
+    preload: tuple[str, ...] = ()
+
+
+@dataclass
+class SkillResult:
+    status: str
+    output: Any = None
+    stderr: bytes = b""
+    exit_code: int | None = None
+    error: str | None = None
+    duration_ms: int = 0
+    timed_out: bool = False
+    executed: bool = False
+    cache: str | None = None
+    peak_bytes: int = 0
+    resources: dict[str, int] | None = None
+
+
+def _prepare_skill(
+    repo_root: Path,
+    target: str,
+    allow_template: bool,
+    timeout_ms: int | None,
+    max_output_bytes: int | None = None,
+) -> PreparedSkill:
+    skill_dir = _resolve_skill_dir(repo_root, target, allow_template=allow_template)
     skills_dir = _skills_root(repo_root)
     contract_schema = _load_contract_schema(skills_dir)
     manifest = _load_yaml(skill_dir / "skill.yaml")
     _validate_manifest(manifest, contract_schema)
-    skill_ref = _skill_ref_from_manifest(skill_dir, manifest)
+    runtime = manifest["runtime"]
+    mode = runtime.get("mode", "oneshot")
+    worker = runtime.get("worker", {})
+    zygote = runtime.get("zygote", {})
+    startup = zygote if mode == "zygote" else worker
+    resolved_timeout_ms = int(timeout_ms) if timeout_ms is not None else int(runtime.get("timeoutMs", 60000))
+    return PreparedSkill(
+        ref=_skill_ref_from_manifest(skill_dir, manifest),
+        manifest=manifest,
+        input_schema=_load_json(_safe_join(skill_dir, manifest["io"]["inputSchema"])),
+        output_schema=_load_json(_safe_join(skill_dir, manifest["io"]["outputSchema"])),
+        command=runtime["command"],
+        cwd=_safe_join(skill_dir, runtime.get("cwd", ".")),
+        timeout_ms=resolved_timeout_ms,
+        mode=mode,
+        max_requests=int(worker.get("maxRequests", 1000)),
+        health_check=bool(worker.get("healthCheck", True)),
+        startup_timeout_ms=int(startup.get("startupTimeoutMs", resolved_timeout_ms)),
+        max_output_bytes=int(
+            max_output_bytes
+            if max_output_bytes is not None
+            else runtime.get("maxOutputBytes", PreparedSkill.max_output_bytes)
+        ),
+        preload=tuple(zygote.get("preload", ())),
+    )
+
+
+class WorkerError(SkillctlError):
+    pass
+
+
+class SkillWorker:
+    """A long-lived skill process speaking the skillctl NDJSON worker protocol.
+
+    Each request is one line on stdin, ``{"id": n, "input": {...}}`` (or
+    ``{"id": n, "ping": true}`` for a health check), answered by one line on
+    stdout: ``{"id": n, "output": {...}}``, ``{"id": n, "error": "..."}`` or
+    ``{"id": n, "pong": true}``. The process is replaced after
+    ``maxRequests`` requests, and killed on a timeout or protocol error.
+    """
+
+    def __init__(self, prepared: PreparedSkill) -> None:
+        self.prepared = prepared
+        self.requests = 0
+        self.last_reply_bytes = 0
+        self._next_id = 0
+        self._buffer = b""
+        self._stderr = bytearray()
+        self._stderr_lock = threading.Lock()
+        self.proc = subprocess.Popen(
+            prepared.command,
+            cwd=str(prepared.cwd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env={**os.environ},
+        )
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+        if prepared.health_check:
+            try:
+                reply = self._call({"ping": True}, prepared.startup_timeout_ms)
+            except BaseException:
+                self.kill()
+                raise
+            if reply.get("pong") is not True:
+                self.kill()
+                raise WorkerError("Skill worker failed its health check")
+
+    def _drain_stderr(self) -> None:
+        assert self.proc.stderr is not None
+        fd = self.proc.stderr.fileno()
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return
+            with self._stderr_lock:
+                self._stderr.extend(chunk)
+
+    def take_stderr(self) -> bytes:
+        with self._stderr_lock:
+            data = bytes(self._stderr)
+            self._stderr.clear()
+        return data
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def _read_line(self, deadline: float) -> bytes:
+        assert self.proc.stdout is not None
+        fd = self.proc.stdout.fileno()
+        while b"\n" not in self._buffer:
+            if len(self._buffer) > self.prepared.max_output_bytes:
+                raise WorkerError(f"Skill worker reply exceeded maxOutputBytes ({self.prepared.max_output_bytes})")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                self.proc.wait()
+                raise WorkerError(f"Skill worker exited with code {self.proc.returncode}")
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        if len(line) > self.prepared.max_output_bytes:
+            raise WorkerError(f"Skill worker reply exceeded maxOutputBytes ({self.prepared.max_output_bytes})")
+        self.last_reply_bytes = len(line)
+        return line
+
+    def _call(self, message: dict[str, Any], timeout_ms: int) -> dict[str, Any]:
+        self._next_id += 1
+        request_id = self._next_id
+        assert self.proc.stdin is not None
+        try:
+            self.proc.stdin.write(_canonical_json({"id": request_id, **message}).encode("utf-8"))
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise WorkerError(f"Skill worker is not accepting requests: {e}") from e
+        line = self._read_line(time.monotonic() + timeout_ms / 1000.0)
+        try:
+            reply = json.loads(line.decode("utf-8"))
+        except Exception as e:
+            raise WorkerError(f"Skill worker reply is not valid JSON: {e}") from e
+        if not isinstance(reply, dict) or reply.get("id") != request_id:
+            raise WorkerError("Skill worker reply does not match the request id")
+        return reply
+
+    def request(self, input_obj: Any) -> SkillResult:
+        started = time.monotonic()
+        result = SkillResult(status="error", executed=True)
+        try:
+            reply = self._call({"input": input_obj}, self.prepared.timeout_ms)
+            self.requests += 1
+            if "error" in reply:
+                raise SkillctlError(f"Skill worker error: {reply['error']}")
+            if "output" not in reply:
+                raise WorkerError("Skill worker reply has neither output nor error")
+            result.peak_bytes = self.last_reply_bytes
+            VALIDATORS.validate(reply["output"], self.prepared.output_schema)
+            result.output = reply["output"]
+            result.status = "success"
+        except TimeoutError:
+            self.kill()
+            result.error = f"Skill worker timed out after {self.prepared.timeout_ms} ms"
+            result.timed_out = True
+        except WorkerError as e:
+            self.kill()
+            result.error = str(e)
+            result.exit_code = self.proc.returncode
+        except Exception as e:
+            result.error = str(e)
+        result.stderr = self.take_stderr()
+        result.duration_ms = int((time.monotonic() - started) * 1000)
+        return result
+
+    def close(self) -> None:
+        if not self.alive():
+            return
+        try:
+            assert self.proc.stdin is not None
+            self.proc.stdin.close()
+            self.proc.wait(timeout=1.0)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self) -> None:
+        if self.alive():
+            self.proc.kill()
+        self.proc.wait()
+
+
+class WorkerPool:
+    """Up to ``size`` workers, spawned lazily and leased one request at a time."""
+
+    def __init__(self, prepared: PreparedSkill, size: int) -> None:
+        self.prepared = prepared
+        self._idle: queue.LifoQueue[SkillWorker] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max(1, size))
+        self._all: list[SkillWorker] = []
+        self._lock = threading.Lock()
+
+    def _spawn(self) -> SkillWorker:
+        worker = SkillWorker(self.prepared)
+        with self._lock:
+            self._all.append(worker)
+        return worker
+
+    def execute(self, input_obj: Any) -> SkillResult:
+        with self._slots:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                worker = None
+            try:
+                if worker is None or not worker.alive():
+                    worker = self._spawn()
+            except TimeoutError:
+                return SkillResult(
+                    status="error",
+                    error=f"Skill worker did not answer its health check within {self.prepared.startup_timeout_ms} ms",
+                    timed_out=True,
+                )
+            except SkillctlError as e:
+                return SkillResult(status="error", error=str(e))
+            result = worker.request(input_obj)
+            if worker.alive() and worker.requests >= self.prepared.max_requests:
+                worker.close()
+            if worker.alive():
+                self._idle.put(worker)
+            return result
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._all = self._all, []
+        for worker in workers:
+            worker.close()
+            # Stderr written after the worker's last reply (e.g. on shutdown).
+            worker._stderr_thread.join(timeout=1.0)
+            _write_skill_stderr(worker.take_stderr())
+
+
+# Runs inside the skill's interpreter (runtime.mode: zygote). Pre-imports the
+# configured modules, then forks once per request: the child takes the three
+# pipe ends sent along with the request as stdin/stdout/stderr and runs the
+# skill as `python script.py` / `python -m module` would. Exit statuses and
+# rusage of reaped children are reported back on the control socket. Datagram
+# sockets never signal EOF, so each side watches the zygote's stdin/stdout
+# pipes to notice the other going away.
+_ZYGOTE_BOOTSTRAP = """
+import json, os, runpy, select, signal, socket, sys, traceback
+
+config = json.loads(sys.argv[1])
+ctl = socket.socket(fileno=config["fd"])
+sys.path[0] = os.path.dirname(os.path.abspath(config["script"])) if config["script"] else os.getcwd()
+for name in config["preload"]:
+    __import__(name)
+
+wake_r, wake_w = os.pipe()
+os.set_blocking(wake_r, False)
+os.set_blocking(wake_w, False)
+signal.set_wakeup_fd(wake_w)
+signal.signal(signal.SIGCHLD, lambda *_: None)
+
+
+def send(message):
+    ctl.send(json.dumps(message).encode("utf-8"))
+
+
+def child(fds):
+    code = 1
+    try:
+        ctl.close()
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        os.close(wake_r)
+        os.close(wake_w)
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+        sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", errors="backslashreplace", closefd=False, buffering=1)
+        sys.argv = list(config["argv"])
+        try:
+            if config["module"]:
+                runpy.run_module(config["module"], run_name="__main__", alter_sys=True)
+            else:
+                runpy.run_path(config["script"], run_name="__main__")
+            code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except BaseException:
+            traceback.print_exc()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        os._exit(code)
+
+
+send({"ready": True})
+while True:
+    ready, _, _ = select.select([ctl, wake_r, 0], [], [])
+    if 0 in ready and not os.read(0, 512):
+        break
+    if wake_r in ready:
+        while True:
+            try:
+                if not os.read(wake_r, 512):
+                    break
+            except BlockingIOError:
+                break
+    if ctl in ready:
+        message, fds, _, _ = socket.recv_fds(ctl, 65536, 3)
+        if not message:
+            break
+        request = json.loads(message)
+        pid = os.fork()
+        if pid == 0:
+            child(fds)
+        for fd in fds:
+            os.close(fd)
+        send({"id": request["id"], "pid": pid})
+    while True:
+        try:
+            pid, status, ru = os.wait4(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if not pid:
+            break
+        send({
+            "pid": pid,
+            "status": status,
+            "rusage": [ru.ru_utime, ru.ru_stime, ru.ru_maxrss, ru.ru_inblock, ru.ru_oublock],
+        })
+"""
+
+
+class ZygoteChild:
+    """A skill process forked by a Zygote, with the Popen surface _communicate_bounded needs."""
+
+    def __init__(self, zygote: Zygote, pid: int, stdin: int, stdout: int, stderr: int) -> None:
+        self.zygote = zygote
+        self.pid = pid
+        self.args = zygote.prepared.command
+        self.returncode: int | None = None
+        self.stdin = os.fdopen(stdin, "wb", buffering=0)
+        self.stdout = os.fdopen(stdout, "rb", buffering=0)
+        self.stderr = os.fdopen(stderr, "rb", buffering=0)
+
+    def kill(self) -> None:
+        if self.returncode is None and not self.zygote.exited(self.pid):
+            try:
+                os.kill(self.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    def wait(self, timeout: float | None = None, usage: dict[str, int] | None = None) -> int:
+        if self.returncode is None:
+            status, ru = self.zygote.wait_exit(self.pid, timeout)
+            self.returncode = os.waitstatus_to_exitcode(status)
+            if usage is not None:
+                usage.update(_rusage_fields(ru))
+        return self.returncode
+
+
+class Zygote:
+    """Fork server for `runtime.type: python` skills with `runtime.mode: zygote`.
+
+    One interpreter per skill imports ``runtime.zygote.preload`` once; every
+    invocation is a fresh fork of it, so requests share no state but skip
+    interpreter startup and those imports. cwd, environment, timeouts, stdio
+    and exit codes behave as for a oneshot ``python script.py`` run. Has the
+    same execute/close surface as WorkerPool.
+    """
+
+    def __init__(self, prepared: PreparedSkill) -> None:
+        command = prepared.command
+        if len(command) >= 3 and command[1] == "-m":
+            self._script, self._module, self._argv = None, command[2], [command[2], *command[3:]]
+        elif len(command) >= 2 and not command[1].startswith("-"):
+            self._script, self._module, self._argv = command[1], None, command[1:]
+        else:
+            raise SkillctlError(
+                "runtime.mode: zygote needs runtime.command [python, script.py, ...] or [python, -m, module, ...]"
+            )
+        self.prepared = prepared
+        self._lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._ctl: Any = None
+        self._seq = 0
+        self._replies: dict[int, dict[str, Any]] = {}
+        self._exits: dict[int, tuple[int, Any]] = {}
+        self._reader: threading.Thread | None = None
+        self._dead = True
+
+    def _start(self) -> None:
+        import socket
+
+        ctl, remote = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        config = {
+            "fd": remote.fileno(),
+            "script": self._script,
+            "module": self._module,
+            "argv": self._argv,
+            "preload": list(self.prepared.preload),
+        }
+        try:
+            self._proc = subprocess.Popen(
+                [self.prepared.command[0], "-c", _ZYGOTE_BOOTSTRAP, json.dumps(config)],
+                cwd=str(self.prepared.cwd),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                env={**os.environ},
+                pass_fds=(remote.fileno(),),
+            )
+        except OSError as e:
+            ctl.close()
+            raise SkillctlError(f"Failed to start skill zygote: {e}") from e
+        finally:
+            remote.close()
+        assert self._proc.stdout is not None
+        ready, _, _ = select.select([ctl, self._proc.stdout], [], [], self.prepared.startup_timeout_ms / 1000.0)
+        if ctl not in ready:
+            ctl.close()
+            self._proc.kill()
+            code = self._proc.wait()
+            raise SkillctlError(f"Skill zygote failed to start (exit code {code})")
+        ctl.recv(65536)
+        self._ctl = ctl
+        self._dead = False
+        self._reader = threading.Thread(target=self._read_loop, args=(ctl, self._proc.stdout), daemon=True)
+        self._reader.start()
+
+    def _read_loop(self, ctl: Any, liveness: Any) -> None:
+        while True:
+            ready, _, _ = select.select([ctl, liveness], [], [])
+            # The zygote never writes to stdout: readable means it exited.
+            raw = ctl.recv(65536) if ctl in ready else b""
+            with self._cond:
+                if not raw:
+                    self._dead = True
+                    self._cond.notify_all()
+                    return
+                message = json.loads(raw)
+                if "status" in message:
+                    utime, stime, maxrss, inblock, oublock = message["rusage"]
+                    ru = argparse.Namespace(
+                        ru_utime=utime, ru_stime=stime, ru_maxrss=maxrss, ru_inblock=inblock, ru_oublock=oublock
+                    )
+                    self._exits[message["pid"]] = (message["status"], ru)
+                else:
+                    self._replies[message["id"]] = message
+                self._cond.notify_all()
+
+    def spawn(self) -> ZygoteChild:
+        import socket
+
+        with self._lock:
+            if self._dead:
+                if self._proc is not None:
+                    self._close_proc()
+                self._start()
+            self._seq += 1
+            request_id = self._seq
+            stdin_r, stdin_w = os.pipe()
+            stdout_r, stdout_w = os.pipe()
+            stderr_r, stderr_w = os.pipe()
+            try:
+                message = json.dumps({"id": request_id}).encode("utf-8")
+                socket.send_fds(self._ctl, [message], [stdin_r, stdout_w, stderr_w])
+            except OSError as e:
+                for fd in (stdin_r, stdin_w, stdout_r, stdout_w, stderr_r, stderr_w):
+                    os.close(fd)
+                raise SkillctlError(f"Skill zygote is not accepting requests: {e}") from e
+            finally:
+                # Only the forked child holds these ends now.
+                for fd in (stdin_r, stdout_w, stderr_w):
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+        deadline = time.monotonic() + self.prepared.startup_timeout_ms / 1000.0
+        with self._cond:
+            while request_id not in self._replies and not self._dead:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            reply = self._replies.pop(request_id, None)
+        if reply is None:
+            for fd in (stdin_w, stdout_r, stderr_r):
+                os.close(fd)
+            raise SkillctlError("Skill zygote did not fork the request")
+        return ZygoteChild(self, reply["pid"], stdin_w, stdout_r, stderr_r)
+
+    def exited(self, pid: int) -> bool:
+        with self._cond:
+            return pid in self._exits
+
+    def wait_exit(self, pid: int, timeout: float | None) -> tuple[int, Any]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while pid not in self._exits:
+                if self._dead:
+                    raise SkillctlError("Skill zygote exited before reporting the skill's exit status")
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise subprocess.TimeoutExpired(self.prepared.command, timeout or 0)
+                self._cond.wait(remaining)
+            return self._exits.pop(pid)
+
+    def execute(self, input_obj: Any) -> SkillResult:
+        return _execute_skill(self.prepared, input_obj, zygote=self)
+
+    def _close_proc(self) -> None:
+        assert self._proc is not None and self._proc.stdin is not None and self._proc.stdout is not None
+        # EOF on its stdin stops the zygote; skills it already forked run to completion.
+        self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        if self._reader is not None:
+            self._reader.join(timeout=1.0)
+            self._reader = None
+        self._proc.stdout.close()
+        if self._ctl is not None:
+            self._ctl.close()
+            self._ctl = None
+        self._proc = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is not None:
+                self._close_proc()
+            self._dead = True
+
+
+# Set by `skillctl serve`: worker pools outlive a single request there, keyed by
+# skill directory and a hash of the manifest they were started from.
+_SHARED_WORKERS: dict[Path, tuple[str, WorkerPool | Zygote]] | None = None
+_SHARED_WORKERS_SIZE = 1
+_SHARED_WORKERS_LOCK = threading.Lock()
+
+
+def _worker_pool(prepared: PreparedSkill, size: int) -> tuple[WorkerPool | Zygote | None, bool]:
+    """Pool for a worker- or zygote-mode skill and whether the caller owns (and must close) it."""
+    if prepared.mode == "oneshot":
+        return None, False
+    if _SHARED_WORKERS is None:
+        return (Zygote(prepared) if prepared.mode == "zygote" else WorkerPool(prepared, size)), True
+    key = hashlib.sha256(_canonical_json(prepared.manifest).encode("utf-8")).hexdigest()
+    stale = None
+    with _SHARED_WORKERS_LOCK:
+        entry = _SHARED_WORKERS.get(prepared.ref.path)
+        if entry is not None and entry[0] == key:
+            return entry[1], False
+        if entry is not None:
+            stale = entry[1]
+        pool = Zygote(prepared) if prepared.mode == "zygote" else WorkerPool(prepared, _SHARED_WORKERS_SIZE)
+        _SHARED_WORKERS[prepared.ref.path] = (key, pool)
+    if stale is not None:
+        stale.close()
+    return pool, False
+
+
+class OutputError(SkillctlError):
+    def __init__(self, message: str, peak_bytes: int) -> None:
+        super().__init__(message)
+        self.peak_bytes = peak_bytes
+
+
+def _rusage_fields(ru: Any) -> dict[str, int]:
+    # ru_maxrss is KiB on Linux and bytes on macOS; block counts are as reported by the kernel.
+    rss_scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "cpuUserMs": int(ru.ru_utime * 1000),
+        "cpuSysMs": int(ru.ru_stime * 1000),
+        "maxRssBytes": int(ru.ru_maxrss) * rss_scale,
+        "blockIn": int(ru.ru_inblock),
+        "blockOut": int(ru.ru_oublock),
+    }
+
+
+def _reap(
+    proc: subprocess.Popen[bytes] | ZygoteChild, usage: dict[str, int] | None, timeout: float | None = None
+) -> None:
+    """Wait for ``proc`` with os.wait4 so its resource usage can be recorded into ``usage``."""
+    if isinstance(proc, ZygoteChild):
+        # Reaped by the zygote, which forwards the status and rusage.
+        proc.wait(timeout, usage)
+        return
+    if proc.returncode is not None or not hasattr(os, "wait4"):
+        proc.wait(timeout)
+        return
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 0.0005
+    while True:
+        pid, status, ru = os.wait4(proc.pid, 0 if deadline is None else os.WNOHANG)
+        if pid:
+            break
+        if time.monotonic() >= deadline:
+            raise subprocess.TimeoutExpired(proc.args, timeout or 0)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if usage is not None:
+        usage.update(_rusage_fields(ru))
+
+
+@dataclass
+class _Captured:
+    text: str
+    stderr: bytes
+    returncode: int
+    peak_bytes: int
+
+
+def _communicate_bounded(
+    command: list[str],
+    cwd: Path,
+    input_bytes: bytes,
+    timeout_s: float,
+    max_output_bytes: int,
+    usage: dict[str, int] | None = None,
+    zygote: Zygote | None = None,
+) -> _Captured:
+    """Run ``command`` feeding ``input_bytes``, decoding stdout as it streams in.
+
+    stdout is decoded incrementally (invalid UTF-8 fails as soon as it
+    arrives) and may not exceed ``max_output_bytes``; stderr beyond that
+    budget is dropped. ``peak_bytes`` is the most stdout + stderr held at once.
+    The decoded stdout is kept whole rather than parsed as it streams: the
+    output schema is checked against the complete document before any of it
+    may reach ``--output`` or stdout, and the stdlib has no incremental JSON
+    parser, so holding it once under the byte cap is the floor.
+    The child's rusage is written into ``usage`` however it ends. With a
+    ``zygote`` the process is forked from it instead of started from scratch.
+    """
+    proc: subprocess.Popen[bytes] | ZygoteChild
+    if zygote is not None:
+        proc = zygote.spawn()
+    else:
+        proc = subprocess.Popen(
+            command,
+            cwd=str(cwd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env={**os.environ},
+        )
+    assert proc.stdin is not None and proc.stdout is not None and proc.stderr is not None
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts: list[str] = []
+    stdout_bytes = 0
+    stderr = bytearray()
+    stderr_dropped = False
+    pending = memoryview(input_bytes)
+    deadline = time.monotonic() + timeout_s
+
+    selector = selectors.DefaultSelector()
+    try:
+        if pending:
+            os.set_blocking(proc.stdin.fileno(), False)
+            selector.register(proc.stdin, selectors.EVENT_WRITE)
+        else:
+            proc.stdin.close()
+        selector.register(proc.stdout, selectors.EVENT_READ)
+        selector.register(proc.stderr, selectors.EVENT_READ)
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                _reap(proc, usage)
+                raise subprocess.TimeoutExpired(command, timeout_s, stderr=bytes(stderr))
+            for key, _ in selector.select(remaining):
+                if key.fileobj is proc.stdin:
+                    try:
+                        written = os.write(proc.stdin.fileno(), pending[:65536])
+                    except BrokenPipeError:
+                        written = len(pending)
+                    pending = pending[written:]
+                    if not pending:
+                        selector.unregister(proc.stdin)
+                        proc.stdin.close()
+                    continue
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    continue
+                if key.fileobj is proc.stdout:
+                    stdout_bytes += len(chunk)
+                    if stdout_bytes > max_output_bytes:
+                        proc.kill()
+                        _reap(proc, usage)
+                        raise OutputError(
+                            f"Skill stdout exceeded maxOutputBytes ({max_output_bytes})",
+                            stdout_bytes + len(stderr),
+                        )
+                    try:
+                        parts.append(decoder.decode(chunk))
+                    except UnicodeDecodeError as e:
+                        proc.kill()
+                        _reap(proc, usage)
+                        raise OutputError(f"Skill stdout is not valid JSON: {e}", stdout_bytes + len(stderr)) from e
+                elif len(stderr) < max_output_bytes:
+                    stderr.extend(chunk[: max_output_bytes - len(stderr)])
+                else:
+                    stderr_dropped = True
+        try:
+            parts.append(decoder.decode(b"", final=True))
+        except UnicodeDecodeError as e:
+            raise OutputError(f"Skill stdout is not valid JSON: {e}", stdout_bytes + len(stderr)) from e
+        _reap(proc, usage, max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired as e:
+        proc.kill()
+        _reap(proc, usage)
+        raise subprocess.TimeoutExpired(command, timeout_s, stderr=bytes(stderr)) from e
+    finally:
+        selector.close()
+        for stream in (proc.stdin, proc.stdout, proc.stderr):
+            if not stream.closed:
+                stream.close()
+    if stderr_dropped:
+        stderr.extend(b"\n[skillctl: stderr truncated at maxOutputBytes]\n")
+    return _Captured("".join(parts), bytes(stderr), proc.returncode, stdout_bytes + len(stderr))
+
+
+def _execute_skill(
+    prepared: PreparedSkill,
+    input_obj: Any,
+    workers: WorkerPool | Zygote | None = None,
+    zygote: Zygote | None = None,
+) -> SkillResult:
+    """Run the skill once on an already-validated input and validate its output."""
+    if workers is not None:
+        return workers.execute(input_obj)
+    started = time.monotonic()
+    result = SkillResult(status="error", executed=True, resources={})
+    try:
+        captured = _communicate_bounded(
+            prepared.command,
+            prepared.cwd,
+            _canonical_json(input_obj).encode("utf-8"),
+            prepared.timeout_ms / 1000.0,
+            prepared.max_output_bytes,
+            result.resources,
+            zygote,
+        )
+        result.stderr = captured.stderr
+        result.exit_code = captured.returncode
+        result.peak_bytes = captured.peak_bytes
+        if captured.returncode != 0:
+            raise SkillctlError(f"Skill exited with code {captured.returncode}")
+
+        try:
+            output_obj = json.loads(captured.text)
+        except Exception as e:
+            raise SkillctlError(f"Skill stdout is not valid JSON: {e}") from e
+        # Only the parsed document is needed from here on.
+        captured.text = ""
+
+        VALIDATORS.validate(output_obj, prepared.output_schema)
+        result.output = output_obj
+        result.status = "success"
+    except subprocess.TimeoutExpired as e:
+        result.stderr = e.stderr or b""
+        result.error = str(e)
+        result.timed_out = True
+    except OutputError as e:
+        result.error = str(e)
+        result.peak_bytes = e.peak_bytes
+    except Exception as e:
+        result.error = str(e)
+    result.duration_ms = int((time.monotonic() - started) * 1000)
+    if not result.resources:
+        result.resources = None
+    return result
+
+
+MEMO_MAX_BYTES_ENV = "SKILLCTL_MEMO_MAX_BYTES"
+MEMO_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Not part of what a skill computes with, so not part of its memo key.
+_TREE_HASH_SKIP = frozenset({"fixtures", "tests", "__pycache__", "node_modules"})
+
+
+def _is_memoizable(manifest: dict[str, Any]) -> bool:
+    determinism = manifest.get("determinism", {})
+    if any(determinism.get(key) != "forbidden" for key in ("network", "time", "randomness")):
+        return False
+    # Declared file or env reads are inputs the memo key cannot see.
+    access = manifest.get("security", {}).get("access", {})
+    return not access.get("filesystem", {}).get("read") and not access.get("env", {}).get("read")
+
+
+def _tree_hash(skill_dir: Path, skip: frozenset[str] = _TREE_HASH_SKIP) -> str:
+    digest = hashlib.sha256()
+    for current, dirnames, filenames in os.walk(skill_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in skip and not d.startswith("."))
+        for name in sorted(filenames):
+            if name.startswith("."):
+                continue
+            path = Path(current) / name
+            digest.update(path.relative_to(skill_dir).as_posix().encode("utf-8") + b"\0")
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+class OutputMemo:
+    """Size-bounded on-disk LRU of validated outputs for fully deterministic skills.
+
+    Keys cover the skill id, version, manifest hash, a hash of the skill tree
+    (impl and schemas) and the canonical input, so editing any of them misses.
+    Entries are files whose mtime is bumped on every hit; when the store
+    exceeds its budget the least recently used entries are evicted.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._bases: dict[Path, str] = {}
+        self._total: int | None = None
+        self._lock = threading.Lock()
+
+    def key(self, prepared: PreparedSkill, input_obj: Any) -> str | None:
+        if not _is_memoizable(prepared.manifest):
+            return None
+        skill_dir = prepared.ref.path
+        with self._lock:
+            base = self._bases.get(skill_dir)
+        if base is None:
+            manifest_hash = hashlib.sha256((skill_dir / "skill.yaml").read_bytes()).hexdigest()
+            base = _canonical_json([prepared.ref.id, prepared.ref.version, manifest_hash, _tree_hash(skill_dir)])
+            with self._lock:
+                self._bases[skill_dir] = base
+        return hashlib.sha256((base + _canonical_json(input_obj)).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            output = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return output
+
+    def _entries(self) -> list[tuple[int, int, Path]]:
+        out: list[tuple[int, int, Path]] = []
+        try:
+            shards = list(os.scandir(self.root))
+        except OSError:
+            return out
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                out.append((st.st_mtime_ns, st.st_size, Path(entry.path)))
+        return out
+
+    def put(self, key: str, output: Any) -> None:
+        path = self._path(key)
+        # Account by on-disk size: a concurrent miss on the same key replaces
+        # the entry rather than adding a second one.
+        previous = _file_size(path)
+        _write_json_atomic(path, output)
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._entries())
+            else:
+                self._total += _file_size(path) - previous
+            if self._total <= self.max_bytes:
+                return
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            # Evict down to 90% so a full store does not rescan on every write.
+            for _, size, path in entries:
+                if total <= self.max_bytes * 0.9:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    continue
+            self._total = total
+
+
+def _open_memo(repo_root: Path) -> OutputMemo | None:
+    if not _PERSIST_CACHES:
+        return None
+    raw = os.environ.get(MEMO_MAX_BYTES_ENV)
+    max_bytes = int(raw) if raw and raw.isdigit() else MEMO_DEFAULT_MAX_BYTES
+    if max_bytes <= 0:
+        return None
+    return OutputMemo(_cache_dir(repo_root) / "memo", max_bytes)
+
+
+def _execute_memoized(
+    prepared: PreparedSkill, input_obj: Any, workers: WorkerPool | Zygote | None, memo: OutputMemo | None
+) -> SkillResult:
+    key = memo.key(prepared, input_obj) if memo is not None else None
+    if key is None:
+        return _execute_skill(prepared, input_obj, workers)
+    started = time.monotonic()
+    cached = memo.get(key)
+    if cached is not None:
+        return SkillResult(
+            status="success",
+            output=cached,
+            duration_ms=int((time.monotonic() - started) * 1000),
+            cache="hit",
+        )
+    result = _execute_skill(prepared, input_obj, workers)
+    result.cache = "miss"
+    if result.status == "success":
+        memo.put(key, result.output)
+    return result
+
+
+def _write_skill_stderr(stderr: bytes) -> None:
+    if stderr:
+        sys.stderr.buffer.write(stderr)
+        if not stderr.endswith(b"\n"):
+            sys.stderr.buffer.write(b"\n")
+
+
+def _report_skill(repo_root: Path, ref: SkillRef) -> dict[str, str]:
+    return {"id": ref.id, "version": ref.version, "path": str(ref.path.relative_to(repo_root))}
 
-    input_schema = _load_json(_safe_join(skill_dir, manifest["io"]["inputSchema"]))
-    output_schema = _load_json(_safe_join(skill_dir, manifest["io"]["outputSchema"]))
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def cmd_run(repo_root: Path, args: argparse.Namespace) -> int:
+    prepared = _prepare_skill(repo_root, args.target, args.allow_template, args.timeout_ms, args.max_output_bytes)
 
     raw_input = Path(args.input).read_bytes() if args.input else sys.stdin.buffer.read()
     try:
@@ -377,74 +1768,1068 @@ def cmd_run(repo_root: Path, args: argparse.Namespace) -> int:
         raise SkillctlError(f"Input is not valid UTF-8 JSON: {e}") from e
 
     _require_deps()
-    jsonschema.validate(instance=input_obj, schema=input_schema)
+    VALIDATORS.validate(input_obj, prepared.input_schema)
+
+    workers, owned = _worker_pool(prepared, 1)
+    try:
+        result = _execute_memoized(prepared, input_obj, workers, _open_memo(repo_root))
+    finally:
+        if owned:
+            workers.close()
+    if result.status == "success":
+        try:
+            _emit_output(result.output, args.output, args.tee)
+        except Exception as e:
+            result.error = str(e)
+    _write_skill_stderr(result.stderr)
+
+    report = {
+        "event": "skill_run_report",
+        "skill": _report_skill(repo_root, prepared.ref),
+        "status": result.status,
+        "durationMs": result.duration_ms,
+        "exitCode": result.exit_code,
+    }
+    if prepared.mode != "oneshot":
+        report["runtimeMode"] = prepared.mode
+    if result.cache is not None:
+        report["cache"] = result.cache
+    if result.executed:
+        report["peakBytes"] = result.peak_bytes
+    if result.resources:
+        report["resources"] = result.resources
+    if result.error:
+        report["error"] = result.error
+    sys.stderr.write(_canonical_json(report))
+
+    return 0 if result.status == "success" else 1
+
+
+def _percentile(sorted_values: list[int], q: float) -> int | None:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _latency_summary(durations: list[int]) -> dict[str, int | None]:
+    # Same percentile set as `skillctl stats` (_Histogram.summary).
+    ordered = sorted(durations)
+    return {
+        "p50": _percentile(ordered, 50),
+        "p95": _percentile(ordered, 95),
+        "p99": _percentile(ordered, 99),
+        "max": ordered[-1] if ordered else None,
+    }
+
+
+def _iter_jsonl(stream: Any) -> Iterator[tuple[int, Any, str | None]]:
+    """Yield (line number, parsed object, error) for each non-blank JSONL line."""
+    for line_no, raw in enumerate(stream, start=1):
+        if not raw.strip():
+            continue
+        try:
+            yield line_no, json.loads(raw.decode("utf-8")), None
+        except Exception as e:
+            yield line_no, None, f"Input is not valid UTF-8 JSON: {e}"
+
+
+def _run_batch_item(
+    prepared: PreparedSkill,
+    input_obj: Any,
+    parse_error: str | None,
+    workers: WorkerPool | Zygote | None,
+    memo: OutputMemo | None,
+) -> SkillResult:
+    if parse_error is not None:
+        return SkillResult(status="error", error=parse_error)
+    try:
+        VALIDATORS.validate(input_obj, prepared.input_schema)
+    except jsonschema.exceptions.ValidationError as e:
+        return SkillResult(status="error", error=f"Input failed schema validation: {e.message}")
+    return _execute_memoized(prepared, input_obj, workers, memo)
 
-    runtime = manifest["runtime"]
-    command = runtime["command"]
-    timeout_ms = int(args.timeout_ms) if args.timeout_ms is not None else int(runtime.get("timeoutMs", 60000))
-    runtime_cwd_rel = runtime.get("cwd", ".")
-    cwd = _safe_join(skill_dir, runtime_cwd_rel)
 
+def cmd_run_batch(repo_root: Path, args: argparse.Namespace) -> int:
+    from concurrent.futures import ThreadPoolExecutor
+
+    prepared = _prepare_skill(repo_root, args.target, args.allow_template, args.timeout_ms, args.max_output_bytes)
+    _require_deps()
+    jobs = max(1, args.jobs)
+    # Compile once up front so workers share the cached validators.
+    VALIDATORS.validator(prepared.input_schema)
+    VALIDATORS.validator(prepared.output_schema)
+
+    workers, owned = _worker_pool(prepared, jobs)
+    memo = _open_memo(repo_root)
+    source = open(args.input, "rb") if args.input != "-" else sys.stdin.buffer
+    sink = open(args.output, "wb") if args.output else sys.stdout.buffer
     started = time.monotonic()
-    proc = None
-    stdout = b""
-    stderr = b""
-    exit_code: int | None = None
-    status = "error"
-    error_message: str | None = None
+    items: list[dict[str, Any]] = []
+    durations: list[int] = []
+    pending: deque[tuple[int, Future[SkillResult]]] = deque()
+
+    def emit(line_no: int, result: SkillResult) -> None:
+        # Outputs stay aligned with input lines: failed items write null.
+        sink.write(_canonical_json(result.output if result.status == "success" else None).encode("utf-8"))
+        _write_skill_stderr(result.stderr)
+        status = "timeout" if result.timed_out else result.status
+        item: dict[str, Any] = {
+            "line": line_no,
+            "status": status,
+            "durationMs": result.duration_ms,
+            "exitCode": result.exit_code,
+        }
+        if result.cache is not None:
+            item["cache"] = result.cache
+        if result.executed:
+            item["peakBytes"] = result.peak_bytes
+        if result.resources:
+            item["resources"] = result.resources
+        if result.error:
+            item["error"] = result.error
+        items.append(item)
+        if result.executed or result.cache == "hit":
+            # Latency covers items that were served (by the skill or the memo).
+            durations.append(result.duration_ms)
 
     try:
-        proc = subprocess.run(
-            command,
-            cwd=str(cwd),
-            input=_canonical_json(input_obj).encode("utf-8"),
-            capture_output=True,
-            timeout=timeout_ms / 1000.0,
-            env={**os.environ},
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for line_no, input_obj, parse_error in _iter_jsonl(source):
+                pending.append((line_no, pool.submit(_run_batch_item, prepared, input_obj, parse_error, workers, memo)))
+                # Bounded look-ahead: at most 2 x jobs items in flight or buffered.
+                while len(pending) >= 2 * jobs or (pending and pending[0][1].done()):
+                    head_line, head = pending.popleft()
+                    emit(head_line, head.result())
+            while pending:
+                head_line, head = pending.popleft()
+                emit(head_line, head.result())
+    finally:
+        if owned:
+            workers.close()
+        if source is not sys.stdin.buffer:
+            source.close()
+        if sink is not sys.stdout.buffer:
+            sink.close()
+        else:
+            sink.flush()
+
+    counts = {"success": 0, "error": 0, "timeout": 0}
+    for item in items:
+        counts[item["status"]] += 1
+    status = "success" if counts["success"] == len(items) else "error"
+    report = {
+        "event": "skill_run_report",
+        "mode": "batch",
+        "skill": _report_skill(repo_root, prepared.ref),
+        "status": status,
+        "durationMs": int((time.monotonic() - started) * 1000),
+        "jobs": jobs,
+        "summary": {
+            "total": len(items),
+            "succeeded": counts["success"],
+            "failed": counts["error"],
+            "timedOut": counts["timeout"],
+            "cacheHits": sum(1 for item in items if item.get("cache") == "hit"),
+        },
+        "latencyMs": _latency_summary(durations),
+        "peakBytes": max((item.get("peakBytes", 0) for item in items), default=0),
+        "items": items,
+    }
+    measured = [item["resources"] for item in items if "resources" in item]
+    if measured:
+        report["resources"] = {
+            key: (max if key == "maxRssBytes" else sum)(r[key] for r in measured) for key in measured[0]
+        }
+    if prepared.mode != "oneshot":
+        report["runtimeMode"] = prepared.mode
+    sys.stderr.write(_canonical_json(report))
+    return 0 if status == "success" else 1
+
+
+PIPELINE_INPUT = "$input"
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    id: str
+    skill: PreparedSkill
+    source: Any
+    deps: tuple[str, ...]
+
+
+def _schema_types(schema: dict[str, Any]) -> set[str] | None:
+    declared = schema.get("type")
+    if declared is None:
+        return None
+    return {declared} if isinstance(declared, str) else set(declared)
+
+
+def _schema_compat(producer: Any, consumer: Any, path: str = "$") -> list[str]:
+    """Conservative structural check that every producer value is acceptable to the consumer.
+
+    Covers type, required, properties, additionalProperties: false and enum/const.
+    Composition keywords ($ref, anyOf, ...) are not analysed here; such values are
+    still validated at run time.
+    """
+    if not isinstance(consumer, dict) or not consumer:
+        return []
+    if not isinstance(producer, dict):
+        producer = {}
+    problems: list[str] = []
+    consumer_types = _schema_types(consumer)
+    producer_types = _schema_types(producer)
+    if consumer_types is not None:
+        if producer_types is None:
+            problems.append(f"{path}: producer type is unconstrained, consumer requires {sorted(consumer_types)}")
+        else:
+            extra = sorted(
+                t for t in producer_types if t not in consumer_types and not (t == "integer" and "number" in consumer_types)
+            )
+            if extra:
+                problems.append(f"{path}: producer may emit {extra}, consumer accepts {sorted(consumer_types)}")
+    if "enum" in consumer or "const" in consumer:
+        allowed = consumer["enum"] if "enum" in consumer else [consumer["const"]]
+        produced = producer["enum"] if "enum" in producer else [producer["const"]] if "const" in producer else None
+        if produced is None or any(value not in allowed for value in produced):
+            problems.append(f"{path}: consumer only accepts {allowed}")
+
+    producer_required = set(producer.get("required", []))
+    for name in consumer.get("required", []):
+        if name not in producer_required:
+            problems.append(f"{path}: consumer requires '{name}', which the producer does not guarantee")
+    consumer_props = consumer.get("properties", {})
+    producer_props = producer.get("properties", {})
+    for name in sorted(set(consumer_props) & set(producer_props)):
+        problems.extend(_schema_compat(producer_props[name], consumer_props[name], f"{path}.{name}"))
+    if consumer.get("additionalProperties") is False:
+        unknown = sorted(set(producer_props) - set(consumer_props))
+        if unknown:
+            problems.append(f"{path}: producer emits {unknown}, which the consumer rejects")
+        if producer.get("additionalProperties") is not False:
+            problems.append(f"{path}: producer allows extra properties, consumer forbids them")
+    return problems
+
+
+def _stage_sources(source: Any) -> list[str]:
+    if isinstance(source, str):
+        return [source]
+    if isinstance(source, dict):
+        return [str(value) for value in source.values()]
+    raise SkillctlError(f"Invalid stage input (expected a stage id, {PIPELINE_INPUT} or a mapping): {source!r}")
+
+
+def _load_pipeline(repo_root: Path, args: argparse.Namespace) -> tuple[str, dict[str, PipelineStage], list[str], str]:
+    """Build and check the stage DAG; returns (pipeline id, stages, topological order, output stage)."""
+    if len(args.targets) == 1 and args.targets[0].endswith((".yaml", ".yml")):
+        path = Path(args.targets[0])
+        manifest = _load_yaml(path if path.is_absolute() else Path.cwd() / path)
+        if manifest.get("kind") != "SkillPipeline":
+            raise SkillctlError(f"Expected kind: SkillPipeline in {path}")
+        raw_stages = manifest.get("stages")
+        if not isinstance(raw_stages, dict) or not raw_stages:
+            raise SkillctlError(f"Pipeline has no stages: {path}")
+        pipeline_id = str(manifest.get("id", path.stem))
+        output = manifest.get("output")
+    else:
+        # Ad-hoc linear chain: skillctl pipe a b c
+        raw_stages = {}
+        previous = PIPELINE_INPUT
+        for index, target in enumerate(args.targets, start=1):
+            stage_id = f"{index}:{target}"
+            raw_stages[stage_id] = {"skill": target, "input": previous}
+            previous = stage_id
+        pipeline_id = " | ".join(args.targets)
+        output = previous
+
+    prepared: dict[str, PreparedSkill] = {}
+    stages: dict[str, PipelineStage] = {}
+    for stage_id, spec in raw_stages.items():
+        if not isinstance(spec, dict) or not isinstance(spec.get("skill"), str):
+            raise SkillctlError(f"Stage '{stage_id}' must declare a skill")
+        skill = spec["skill"]
+        if skill not in prepared:
+            prepared[skill] = _prepare_skill(repo_root, skill, args.allow_template, args.timeout_ms)
+        source = spec.get("input", PIPELINE_INPUT)
+        deps = tuple(dict.fromkeys(dep for dep in _stage_sources(source) if dep != PIPELINE_INPUT))
+        stages[stage_id] = PipelineStage(id=stage_id, skill=prepared[skill], source=source, deps=deps)
+
+    for stage in stages.values():
+        for dep in stage.deps:
+            if dep not in stages:
+                raise SkillctlError(f"Stage '{stage.id}' reads from unknown stage '{dep}'")
+
+    # Kahn's algorithm: a deterministic topological order, or a cycle error.
+    indegree = {stage_id: len(stage.deps) for stage_id, stage in stages.items()}
+    ready = sorted(stage_id for stage_id, count in indegree.items() if count == 0)
+    order: list[str] = []
+    while ready:
+        current = ready.pop(0)
+        order.append(current)
+        for stage_id, stage in stages.items():
+            if current in stage.deps:
+                indegree[stage_id] -= 1
+                if indegree[stage_id] == 0:
+                    ready.append(stage_id)
+        ready.sort()
+    if len(order) != len(stages):
+        cyclic = sorted(set(stages) - set(order))
+        raise SkillctlError(f"Pipeline stages form a cycle: {', '.join(cyclic)}")
+
+    if output is None:
+        sinks = [stage_id for stage_id in order if not any(stage_id in s.deps for s in stages.values())]
+        if len(sinks) != 1:
+            raise SkillctlError(f"Pipeline has several final stages ({', '.join(sinks)}); set 'output'")
+        output = sinks[0]
+    if output not in stages:
+        raise SkillctlError(f"Pipeline output is not a stage: {output}")
+
+    problems: list[str] = []
+    for stage in stages.values():
+        source = stage.source
+        if source == PIPELINE_INPUT:
+            continue
+        if isinstance(source, str):
+            produced = stages[source].skill.output_schema
+        else:
+            produced = {
+                "type": "object",
+                "required": sorted(source),
+                "properties": {
+                    key: ({} if value == PIPELINE_INPUT else stages[str(value)].skill.output_schema)
+                    for key, value in source.items()
+                },
+                "additionalProperties": False,
+            }
+        for problem in _schema_compat(produced, stage.skill.input_schema):
+            problems.append(f"{stage.id}: {problem}")
+    if problems:
+        raise SkillctlError("Pipeline schema check failed:\n" + "\n".join(f"- {p}" for p in problems))
+    return pipeline_id, stages, order, str(output)
+
+
+def cmd_pipe(repo_root: Path, args: argparse.Namespace) -> int:
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    pipeline_id, stages, order, output_stage = _load_pipeline(repo_root, args)
+    if args.plan:
+        for stage_id in order:
+            stage = stages[stage_id]
+            after = ", ".join(stage.deps) if stage.deps else PIPELINE_INPUT
+            sys.stdout.write(f"{stage_id}\t{stage.skill.ref.id}@{stage.skill.ref.version}\t<- {after}\n")
+        return 0
+
+    raw_input = Path(args.input).read_bytes() if args.input else sys.stdin.buffer.read()
+    try:
+        pipeline_input = json.loads(raw_input.decode("utf-8"))
+    except Exception as e:
+        raise SkillctlError(f"Input is not valid UTF-8 JSON: {e}") from e
+    _require_deps()
+
+    memo = _open_memo(repo_root)
+    pools: dict[Path, WorkerPool | Zygote | None] = {}
+    owned_pools: list[WorkerPool | Zygote] = []
+    jobs = max(1, args.jobs)
+    for stage in stages.values():
+        if stage.skill.ref.path not in pools:
+            pool, owned = _worker_pool(stage.skill, jobs)
+            pools[stage.skill.ref.path] = pool
+            if owned:
+                owned_pools.append(pool)
+
+    results: dict[str, SkillResult] = {}
+    timings: dict[str, tuple[int, int]] = {}
+    started = time.monotonic()
+
+    def resolve(source: Any) -> Any:
+        if isinstance(source, dict):
+            return {key: resolve(value) for key, value in source.items()}
+        return pipeline_input if source == PIPELINE_INPUT else results[source].output
+
+    def run_stage(stage: PipelineStage, stage_input: Any) -> SkillResult:
+        try:
+            VALIDATORS.validate(stage_input, stage.skill.input_schema)
+        except jsonschema.exceptions.ValidationError as e:
+            return SkillResult(status="error", error=f"Input failed schema validation: {e.message}")
+        return _execute_memoized(stage.skill, stage_input, pools.get(stage.skill.ref.path), memo)
+
+    remaining = {stage_id: set(stages[stage_id].deps) for stage_id in order}
+    skipped: set[str] = set()
+    running: dict[Future[SkillResult], str] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            while remaining or running:
+                for stage_id in [s for s in order if s in remaining and not remaining[s]]:
+                    del remaining[stage_id]
+                    stage = stages[stage_id]
+                    if any(dep in skipped or results[dep].status != "success" for dep in stage.deps):
+                        skipped.add(stage_id)
+                        continue
+                    offset = int((time.monotonic() - started) * 1000)
+                    timings[stage_id] = (offset, 0)
+                    running[pool.submit(run_stage, stage, resolve(stage.source))] = stage_id
+                if skipped:
+                    for stage_id in list(remaining):
+                        if remaining[stage_id] & skipped:
+                            remaining[stage_id] -= skipped
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage_id = running.pop(future)
+                    results[stage_id] = future.result()
+                    offset, _ = timings[stage_id]
+                    timings[stage_id] = (offset, results[stage_id].duration_ms)
+                    for deps in remaining.values():
+                        deps.discard(stage_id)
+    finally:
+        for workers in owned_pools:
+            workers.close()
+
+    # Any failed (and therefore skipped) stage fails the pipeline, even off the output path.
+    final = results.get(output_stage)
+    complete = len(results) == len(stages) and all(r.status == "success" for r in results.values())
+    status = "success" if final is not None and complete else "error"
+    if status == "success":
+        _emit_output(final.output, args.output, False)
+
+    stage_reports = []
+    for stage_id in order:
+        stage = stages[stage_id]
+        entry: dict[str, Any] = {"id": stage_id, "skill": _report_skill(repo_root, stage.skill.ref)}
+        result = results.get(stage_id)
+        if result is None:
+            entry["status"] = "skipped"
+        else:
+            _write_skill_stderr(result.stderr)
+            entry["status"] = "timeout" if result.timed_out else result.status
+            entry["startMs"], entry["durationMs"] = timings[stage_id]
+            if result.cache is not None:
+                entry["cache"] = result.cache
+            if result.resources:
+                entry["resources"] = result.resources
+            if result.error:
+                entry["error"] = result.error
+        stage_reports.append(entry)
+    report = {
+        "event": "skill_pipeline_report",
+        "pipeline": pipeline_id,
+        "status": status,
+        "durationMs": int((time.monotonic() - started) * 1000),
+        "output": output_stage,
+        "stages": stage_reports,
+    }
+    sys.stderr.write(_canonical_json(report))
+    return 0 if status == "success" else 1
+
+
+STATS_METRICS = ("durationMs", "cpuMs", "maxRssBytes", "blockIn", "blockOut")
+STATS_STATE_VERSION = 1
+
+
+class Histogram:
+    """Fixed-bucket log-linear histogram (HDR-style) of non-negative integers.
+
+    Values below 128 get their own bucket; above that each power of two is split
+    into 64 buckets, so percentiles are within 1/64 (~1.6%) of the true value.
+    Values are clamped at 2**40, which bounds the bucket count (2240) and hence
+    memory no matter how many values are recorded. Histograms merge by adding
+    counts, so states from several hosts combine exactly.
+    """
+
+    SUB_BITS = 7
+    MAX_VALUE = (1 << 40) - 1
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.total = 0
+        self.max: int | None = None
+
+    @classmethod
+    def index(cls, value: int) -> int:
+        if value < 1 << cls.SUB_BITS:
+            return value
+        shift = value.bit_length() - cls.SUB_BITS
+        half = 1 << (cls.SUB_BITS - 1)
+        return (1 << cls.SUB_BITS) + (shift - 1) * half + ((value >> shift) - half)
+
+    @classmethod
+    def upper_bound(cls, index: int) -> int:
+        if index < 1 << cls.SUB_BITS:
+            return index
+        half = 1 << (cls.SUB_BITS - 1)
+        shift, offset = divmod(index - (1 << cls.SUB_BITS), half)
+        return ((half + offset + 1) << (shift + 1)) - 1
+
+    def record(self, value: int) -> None:
+        value = max(0, min(int(value), self.MAX_VALUE))
+        index = self.index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: Histogram) -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, q: float) -> int | None:
+        """Nearest-rank percentile, reported as the bucket's highest value (capped at the max seen)."""
+        if not self.total:
+            return None
+        rank = max(1, math.ceil(q / 100.0 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.upper_bound(index), self.max if self.max is not None else self.MAX_VALUE)
+        return self.max
+
+    def summary(self) -> dict[str, int | None]:
+        return {"p50": self.percentile(50), "p95": self.percentile(95), "p99": self.percentile(99), "max": self.max}
+
+    def to_json(self) -> dict[str, Any]:
+        return {"counts": {str(index): count for index, count in sorted(self.counts.items())}, "max": self.max}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Histogram:
+        histogram = cls()
+        for index, count in data.get("counts", {}).items():
+            histogram.counts[int(index)] = int(count)
+            histogram.total += int(count)
+        histogram.max = data.get("max")
+        return histogram
+
+
+class SkillStats:
+    """Constant-size run telemetry for one skill id and version."""
+
+    COUNTERS = ("runs", "succeeded", "failed", "timedOut", "cacheHits")
+
+    def __init__(self) -> None:
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.histograms = {metric: Histogram() for metric in STATS_METRICS}
+
+    def record(self, sample: dict[str, Any]) -> None:
+        status = sample.get("status", "error")
+        self.counters["runs"] += 1
+        self.counters["succeeded" if status == "success" else "timedOut" if status == "timeout" else "failed"] += 1
+        if sample.get("cache") == "hit":
+            self.counters["cacheHits"] += 1
+        if isinstance(sample.get("durationMs"), int):
+            self.histograms["durationMs"].record(sample["durationMs"])
+        resources = sample.get("resources") or {}
+        if resources:
+            self.histograms["cpuMs"].record(resources.get("cpuUserMs", 0) + resources.get("cpuSysMs", 0))
+            for metric in ("maxRssBytes", "blockIn", "blockOut"):
+                self.histograms[metric].record(resources.get(metric, 0))
+
+    def merge(self, other: SkillStats) -> None:
+        for key in self.COUNTERS:
+            self.counters[key] += other.counters[key]
+        for metric in STATS_METRICS:
+            self.histograms[metric].merge(other.histograms[metric])
+
+    def summary(self) -> dict[str, Any]:
+        runs = self.counters["runs"]
+        return {
+            **self.counters,
+            "errorRate": round(self.counters["failed"] / runs, 4) if runs else None,
+            "timeoutRate": round(self.counters["timedOut"] / runs, 4) if runs else None,
+            **{metric: histogram.summary() for metric, histogram in self.histograms.items()},
+        }
+
+    def to_json(self) -> dict[str, Any]:
+        return {**self.counters, "histograms": {m: h.to_json() for m, h in self.histograms.items()}}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> SkillStats:
+        stats = cls()
+        for key in cls.COUNTERS:
+            stats.counters[key] = int(data.get(key, 0))
+        for metric, histogram in data.get("histograms", {}).items():
+            if metric in stats.histograms:
+                stats.histograms[metric] = Histogram.from_json(histogram)
+        return stats
+
+
+def _report_samples(report: dict[str, Any]) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    """Yield (skill, sample) pairs from a single, batch or pipeline report."""
+    if report.get("event") == "skill_pipeline_report":
+        for stage in report.get("stages", []):
+            if stage.get("status") != "skipped":
+                yield stage.get("skill", {}), stage
+    elif report.get("event") == "skill_run_report":
+        if report.get("mode") == "batch":
+            for item in report.get("items", []):
+                yield report.get("skill", {}), item
+        else:
+            yield report.get("skill", {}), report
+
+
+def cmd_stats(repo_root: Path, args: argparse.Namespace) -> int:
+    """Aggregate run reports (and saved stats states) into per-skill histograms."""
+    groups: dict[str, SkillStats] = {}
+    sources = args.logs or ["-"]
+    for source in sources:
+        stream = sys.stdin.buffer if source == "-" else open(source, "rb")
+        try:
+            for raw in stream:
+                # Logs interleave skill stderr with reports; only report lines count.
+                if b'"event":"skill_' not in raw:
+                    continue
+                try:
+                    report = json.loads(raw.decode("utf-8"))
+                except Exception:
+                    continue
+                if not isinstance(report, dict):
+                    continue
+                if report.get("event") == "skill_stats_state":
+                    if report.get("version") != STATS_STATE_VERSION:
+                        raise SkillctlError(f"Unsupported stats state version in {source}")
+                    for name, data in report.get("skills", {}).items():
+                        groups.setdefault(name, SkillStats()).merge(SkillStats.from_json(data))
+                    continue
+                for skill, sample in _report_samples(report):
+                    name = f"{skill.get('id', '?')}@{skill.get('version', '?')}"
+                    groups.setdefault(name, SkillStats()).record(sample)
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+    if args.state_out:
+        state = {
+            "event": "skill_stats_state",
+            "version": STATS_STATE_VERSION,
+            "skills": {name: stats.to_json() for name, stats in sorted(groups.items())},
+        }
+        _write_bytes_atomic(Path(args.state_out).resolve(), _canonical_json(state).encode("utf-8"))
+
+    summary = {name: stats.summary() for name, stats in sorted(groups.items())}
+    if args.json:
+        sys.stdout.write(_canonical_json(summary))
+        return 0
+
+    def fmt(value: int | None, scale: int = 1) -> str:
+        return "-" if value is None else str(value // scale)
+
+    def pct(rate: float | None) -> str:
+        return "-" if rate is None else f"{rate * 100:.1f}%"
+
+    sys.stdout.write("skill\truns\terrors\ttimeouts\tms p50/p95/p99\tcpu ms p50/p99\trss KiB p50/max\n")
+    for name, row in summary.items():
+        duration, cpu, rss = row["durationMs"], row["cpuMs"], row["maxRssBytes"]
+        sys.stdout.write(
+            f"{name}\t{row['runs']}\t{pct(row['errorRate'])}\t{pct(row['timeoutRate'])}\t"
+            f"{fmt(duration['p50'])}/{fmt(duration['p95'])}/{fmt(duration['p99'])}\t"
+            f"{fmt(cpu['p50'])}/{fmt(cpu['p99'])}\t"
+            f"{fmt(rss['p50'], 1024)}/{fmt(rss['max'], 1024)}\n"
         )
-        stdout = proc.stdout
-        stderr = proc.stderr
-        exit_code = proc.returncode
-        if proc.returncode != 0:
-            raise SkillctlError(f"Skill exited with code {proc.returncode}")
+    return 0
+
+
+TEST_CACHE_VERSION = 1
+
 
+@dataclass(frozen=True)
+class FixtureCase:
+    name: str
+    input_path: Path
+    expected_path: Path
+
+
+def _fixture_cases(skill_dir: Path) -> list[FixtureCase]:
+    """fixtures/input.json and fixtures/<case>.input.json, each with its output.expected.json."""
+    fixtures = skill_dir / "fixtures"
+    cases = []
+    if (fixtures / "input.json").is_file():
+        cases.append(FixtureCase("input", fixtures / "input.json", fixtures / "output.expected.json"))
+    for path in sorted(fixtures.glob("*.input.json")):
+        name = path.name[: -len(".input.json")]
+        cases.append(FixtureCase(name, path, fixtures / f"{name}.output.expected.json"))
+    return cases
+
+
+def _run_fixture(prepared: PreparedSkill, case: FixtureCase, workers: WorkerPool | Zygote | None) -> dict[str, Any]:
+    """Run one fixture with `run` semantics; status is pass, fail (wrong output) or error."""
+    outcome: dict[str, Any] = {"status": "error"}
+    try:
+        input_obj = json.loads(case.input_path.read_bytes().decode("utf-8"))
+        expected = _canonical_json(json.loads(case.expected_path.read_bytes().decode("utf-8")))
+    except (OSError, ValueError) as e:
+        outcome["message"] = f"Unreadable fixture: {e}"
+        return outcome
+    try:
+        VALIDATORS.validate(input_obj, prepared.input_schema)
+    except jsonschema.exceptions.ValidationError as e:
+        outcome["message"] = f"Input failed schema validation: {e.message}"
+        return outcome
+    result = _execute_skill(prepared, input_obj, workers)
+    outcome["durationMs"] = result.duration_ms
+    outcome["stderr"] = result.stderr.decode("utf-8", errors="replace")
+    if result.status != "success":
+        outcome["message"] = result.error or "Skill failed"
+        outcome["timedOut"] = result.timed_out
+        return outcome
+    actual = _canonical_json(result.output)
+    if actual == expected:
+        outcome["status"] = "pass"
+        return outcome
+    import difflib
+
+    diff = difflib.unified_diff(
+        json.dumps(json.loads(expected), indent=2, sort_keys=True).splitlines(),
+        json.dumps(result.output, indent=2, sort_keys=True).splitlines(),
+        str(case.expected_path.name),
+        "actual",
+        lineterm="",
+    )
+    outcome["status"] = "fail"
+    outcome["message"] = f"Output differs from {case.expected_path.name}"
+    outcome["diff"] = "\n".join(diff)
+    return outcome
+
+
+def _junit_report(cases: list[dict[str, Any]], duration_ms: int) -> bytes:
+    import xml.etree.ElementTree as ET
+
+    root = ET.Element("testsuites", name="skillctl", time=f"{duration_ms / 1000:.3f}")
+    suites: dict[str, Any] = {}
+    for case in cases:
+        suite = suites.get(case["skill"])
+        if suite is None:
+            suite = suites[case["skill"]] = ET.SubElement(
+                root, "testsuite", name=case["skill"], tests="0", failures="0", errors="0"
+            )
+        suite.set("tests", str(int(suite.get("tests")) + 1))
+        testcase = ET.SubElement(
+            suite,
+            "testcase",
+            classname=case["skill"],
+            name=case["fixture"],
+            time=f"{case.get('durationMs', 0) / 1000:.3f}",
+        )
+        if case["status"] != "pass":
+            kind = "failure" if case["status"] == "fail" else "error"
+            suite.set(f"{kind}s", str(int(suite.get(f"{kind}s")) + 1))
+            element = ET.SubElement(testcase, kind, message=case.get("message", ""))
+            element.text = case.get("diff")
+        if case.get("stderr"):
+            ET.SubElement(testcase, "system-err").text = case["stderr"]
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True) + b"\n"
+
+
+def cmd_test(repo_root: Path, args: argparse.Namespace) -> int:
+    """Run every fixture of the target skills concurrently and check outputs against expectations."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    if args.all:
+        targets = [str(path.relative_to(repo_root)) for path in _load_registry(repo_root).skill_dirs()]
+    elif args.targets:
+        targets = args.targets
+    else:
+        raise SkillctlError("Name skills to test or pass --all")
+    _require_deps()
+    jobs = max(1, args.jobs)
+    started = time.monotonic()
+
+    # Passing results of deterministic skills are reused while skillctl, the
+    # manifest, the skill tree (impl, schemas) and the fixture files are unchanged.
+    cache_path = _cache_dir(repo_root) / "test.json" if _PERSIST_CACHES else None
+    cached: dict[str, Any] = {}
+    if cache_path is not None:
         try:
-            output_obj = json.loads(stdout.decode("utf-8"))
-        except Exception as e:
-            raise SkillctlError(f"Skill stdout is not valid JSON: {e}") from e
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            if isinstance(data, dict) and data.get("version") == TEST_CACHE_VERSION:
+                cached = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+    base = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+    cases: list[dict[str, Any]] = []
+    planned: list[tuple[dict[str, Any], PreparedSkill, FixtureCase]] = []
+    pools: dict[Path, WorkerPool | Zygote | None] = {}
+    owned_pools: list[WorkerPool | Zygote] = []
+    for target in targets:
+        try:
+            prepared = _prepare_skill(repo_root, target, args.allow_template, args.timeout_ms)
+        except SkillctlError as e:
+            cases.append({"skill": target, "fixture": "(prepare)", "status": "error", "message": str(e)})
+            continue
+        fixtures = _fixture_cases(prepared.ref.path)
+        if not fixtures:
+            cases.append(
+                {"skill": prepared.ref.id, "fixture": "(fixtures)", "status": "error", "message": "No fixtures"}
+            )
+            continue
+        tree = None
+        if _is_memoizable(prepared.manifest):
+            tree = _tree_hash(prepared.ref.path) + _canonical_json(prepared.manifest)
+        for fixture in fixtures:
+            case: dict[str, Any] = {"skill": prepared.ref.id, "version": prepared.ref.version, "fixture": fixture.name}
+            if tree is not None and cache_path is not None:
+                digest = hashlib.sha256(f"{TEST_CACHE_VERSION}\0{base}\0{tree}".encode("utf-8"))
+                for path in (fixture.input_path, fixture.expected_path):
+                    digest.update(hashlib.sha256(path.read_bytes()).digest() if path.is_file() else b"<missing>")
+                case["key"] = digest.hexdigest()
+                if case["key"] in cached:
+                    case.update(status="pass", cached=True)
+                    cases.append(case)
+                    continue
+            if prepared.ref.path not in pools:
+                pool, owned = _worker_pool(prepared, jobs)
+                pools[prepared.ref.path] = pool
+                if owned:
+                    owned_pools.append(pool)
+            cases.append(case)
+            planned.append((case, prepared, fixture))
 
-        jsonschema.validate(instance=output_obj, schema=output_schema)
-        status = "success"
-        normalized = _canonical_json(output_obj).encode("utf-8")
-        if args.output:
-            Path(args.output).write_bytes(normalized)
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                (case, executor.submit(_run_fixture, prepared, fixture, pools[prepared.ref.path]))
+                for case, prepared, fixture in planned
+            ]
+            for case, future in futures:
+                case.update(future.result())
+    finally:
+        for pool in owned_pools:
+            pool.close()
+
+    if cache_path is not None and planned:
+        rerun = {(case["skill"], case["fixture"]) for case, _, _ in planned}
+        entries = {
+            key: entry
+            for key, entry in cached.items()
+            if isinstance(entry, dict) and (entry.get("skill"), entry.get("fixture")) not in rerun
+        }
+        for case, _, _ in planned:
+            if case["status"] == "pass" and "key" in case:
+                entries[case["key"]] = {"skill": case["skill"], "fixture": case["fixture"]}
+        _write_json_atomic(cache_path, {"version": TEST_CACHE_VERSION, "entries": entries})
+
+    duration_ms = int((time.monotonic() - started) * 1000)
+    counts = {"pass": 0, "fail": 0, "error": 0}
+    for case in cases:
+        case.pop("key", None)
+        counts[case["status"]] += 1
+        label = "PASS" if case["status"] == "pass" else case["status"].upper()
+        timing = "cached" if case.get("cached") else f"{case.get('durationMs', 0)}ms"
+        sys.stdout.write(f"{label}\t{case['skill']}\t{case['fixture']}\t{timing}\n")
+
+    if args.report:
+        report_path = Path(args.report).resolve()
+        junit = args.format == "junit" or (args.format is None and report_path.suffix == ".xml")
+        if junit:
+            payload = _junit_report(cases, duration_ms)
         else:
-            sys.stdout.buffer.write(normalized)
+            payload = _canonical_json(
+                {
+                    "event": "skill_test_report",
+                    "durationMs": duration_ms,
+                    "jobs": jobs,
+                    "summary": {
+                        "total": len(cases),
+                        "passed": counts["pass"],
+                        "failed": counts["fail"],
+                        "errors": counts["error"],
+                        "cached": sum(1 for case in cases if case.get("cached")),
+                    },
+                    "cases": cases,
+                }
+            ).encode("utf-8")
+        _write_bytes_atomic(report_path, payload)
+
+    failures = [case for case in cases if case["status"] != "pass"]
+    if failures:
+        _eprint("Tests failed:")
+        for case in failures:
+            _eprint(f"- {case['skill']} [{case['fixture']}]: {case.get('message', '')}")
+            if case.get("diff"):
+                _eprint(case["diff"])
+        return 1
+    return 0
+
+
+SERVED_COMMANDS = ("list", "describe", "validate", "run")
+SOCKET_ENV = "SKILLCTL_SOCKET"
+# Requests carry the whole skill input, so lines may be long.
+SERVE_LINE_LIMIT = 64 * 1024 * 1024
+
+
+class _RequestIO(threading.local):
+    stdin: Any = None
+    stdout: Any = None
+    stderr: Any = None
+
+
+_REQUEST_IO = _RequestIO()
+
+
+class _RoutedStream:
+    """Stands in for sys.stdin/stdout/stderr under `serve`: each request thread gets its own buffers."""
+
+    def __init__(self, name: str, fallback: Any) -> None:
+        self._name = name
+        self._fallback = fallback
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(getattr(_REQUEST_IO, self._name) or self._fallback, attr)
+
+
+def _text_buffer(data: bytes = b"") -> io.TextIOWrapper:
+    return io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", write_through=True)
+
+
+def _serve_request(repo_root: Path, request: dict[str, Any]) -> dict[str, Any]:
+    """Run one forwarded command exactly as main() would, capturing its stdio."""
+    _REQUEST_IO.stdin = _text_buffer(base64.b64decode(request.get("stdin", "")))
+    _REQUEST_IO.stdout = _text_buffer()
+    _REQUEST_IO.stderr = _text_buffer()
+    try:
+        args = argparse.Namespace(**request["args"])
+        if args.command not in SERVED_COMMANDS:
+            raise SkillctlError(f"Command not served: {args.command}")
+        if Path(args.repo_root or "").resolve() != repo_root:
+            raise SkillctlError(f"This server serves {repo_root}, not {args.repo_root}")
+        if getattr(args, "no_cache", False):
+            # Cache persistence is process-wide in the server; the client runs --no-cache locally.
+            raise SkillctlError("--no-cache is not served; run without --socket")
+        if args.command == "validate":
+            # Forking a pool from a threaded server is unsafe; in-process validators are warm anyway.
+            args.jobs = 1
+        func = {"list": cmd_list, "describe": cmd_describe, "validate": cmd_validate, "run": cmd_run}[args.command]
+        try:
+            code = int(func(repo_root, args))
+        except SkillctlError as e:
+            _eprint(str(e))
+            code = 1
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        finally:
+            VALIDATORS.save()
     except Exception as e:
-        error_message = str(e)
+        _eprint(f"skillctl serve: {e}")
+        code = 1
+    response = {
+        "exitCode": code,
+        "stdout": base64.b64encode(_REQUEST_IO.stdout.buffer.getvalue()).decode("ascii"),
+        "stderr": base64.b64encode(_REQUEST_IO.stderr.buffer.getvalue()).decode("ascii"),
+    }
+    _REQUEST_IO.stdin = _REQUEST_IO.stdout = _REQUEST_IO.stderr = None
+    return response
+
+
+def cmd_serve(repo_root: Path, args: argparse.Namespace) -> int:
+    import asyncio
+    import signal
+    from concurrent.futures import ThreadPoolExecutor
+
+    global _SHARED_WORKERS, _SHARED_WORKERS_SIZE, _SHARED_REGISTRY
+    repo_root = repo_root.resolve()
+    socket_path = Path(args.listen).resolve()
+    per_skill = max(1, args.per_skill)
+    _SHARED_WORKERS, _SHARED_WORKERS_SIZE = {}, per_skill
+    _SHARED_REGISTRY = SkillRegistry(repo_root)
+    sys.stdin = _RoutedStream("stdin", sys.stdin)  # type: ignore[assignment]
+    sys.stdout = _RoutedStream("stdout", sys.stdout)  # type: ignore[assignment]
+    sys.stderr = _RoutedStream("stderr", sys.stderr)  # type: ignore[assignment]
+    executor = ThreadPoolExecutor(max_workers=max(1, args.jobs))
+    skill_limits: dict[str, asyncio.Semaphore] = {}
+
+    async def dispatch(request: dict[str, Any]) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        limit = None
+        request_args = request.get("args") or {}
+        if request_args.get("command") == "run":
+            target = str(request_args.get("target"))
+            try:
+                key = str(await loop.run_in_executor(executor, _resolve_skill_dir, repo_root, target))
+            except SkillctlError:
+                key = target
+            limit = skill_limits.setdefault(key, asyncio.Semaphore(per_skill))
+        if limit is None:
+            return await loop.run_in_executor(executor, _serve_request, repo_root, request)
+        async with limit:
+            return await loop.run_in_executor(executor, _serve_request, repo_root, request)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request is not an object")
+                    response = await dispatch(request)
+                except ValueError as e:
+                    message = f"skillctl serve: invalid request: {e}\n".encode("utf-8")
+                    response = {"exitCode": 2, "stdout": "", "stderr": base64.b64encode(message).decode("ascii")}
+                writer.write(_canonical_json(response).encode("utf-8"))
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            # Dropped connection, or a request line over SERVE_LINE_LIMIT.
+            pass
+        finally:
+            writer.close()
+
+    async def serve() -> None:
+        if socket_path.exists():
+            socket_path.unlink()
+        # bind() creates the socket under the umask: never let it exist world-accessible.
+        umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(handle, path=str(socket_path), limit=SERVE_LINE_LIMIT)
+        finally:
+            os.umask(umask)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        _eprint(f"skillctl serve: listening on {socket_path}")
+        async with server:
+            await stop.wait()
+
+    try:
+        asyncio.run(serve())
     finally:
-        duration_ms = int((time.monotonic() - started) * 1000)
-        if stderr:
-            sys.stderr.buffer.write(stderr)
-            if not stderr.endswith(b"\n"):
-                sys.stderr.buffer.write(b"\n")
-
-        report = {
-            "event": "skill_run_report",
-            "skill": {
-                "id": skill_ref.id,
-                "version": skill_ref.version,
-                "path": str(skill_ref.path.relative_to(repo_root)),
-            },
-            "status": status,
-            "durationMs": duration_ms,
-            "exitCode": exit_code,
-        }
-        if error_message:
-            report["error"] = error_message
-        sys.stderr.write(_canonical_json(report))
+        executor.shutdown(wait=True)
+        for _, pool in (_SHARED_WORKERS or {}).values():
+            pool.close()
+        _SHARED_WORKERS = None
+        _SHARED_REGISTRY = None
+        if socket_path.exists():
+            socket_path.unlink()
+    return 0
 
-    return 0 if status == "success" else 1
+
+def _forward_to_server(socket_path: str, args: argparse.Namespace) -> int:
+    """Thin client: run the command on a `skillctl serve` instance and replay its output."""
+    import socket
+
+    payload = {key: value for key, value in vars(args).items() if key != "func"}
+    # The server resolves paths against its own cwd.
+    for key in ("input", "output"):
+        if payload.get(key):
+            payload[key] = str(Path(payload[key]).resolve())
+    request: dict[str, Any] = {"args": payload}
+    if args.command == "run" and not args.input:
+        request["stdin"] = base64.b64encode(sys.stdin.buffer.read()).decode("ascii")
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(socket_path)
+            conn.sendall(_canonical_json(request).encode("utf-8"))
+            conn.shutdown(socket.SHUT_WR)
+            raw = b"".join(iter(lambda: conn.recv(1 << 16), b""))
+        response = json.loads(raw)
+    except (OSError, ValueError) as e:
+        raise SkillctlError(f"skillctl server not reachable at {socket_path}: {e}") from e
+    sys.stdout.buffer.write(base64.b64decode(response.get("stdout", "")))
+    sys.stderr.buffer.write(base64.b64decode(response.get("stderr", "")))
+    return int(response.get("exitCode", 1))
 
 
 def _yaml_quote(value: str) -> str:
@@ -555,6 +2940,9 @@ def _render_spec_md(*, title: str, spec_id: str, skill_id: str, slug: str) -> st
 
 
 def cmd_scaffold(repo_root: Path, args: argparse.Namespace) -> int:
+    import shutil
+    import uuid
+
     skill_id = args.skill_id
     slug = args.slug
     _validate_skill_id(skill_id)
@@ -620,6 +3008,16 @@ def build_parser() -> argparse.ArgumentParser:
         help="Override repository root (default: auto-detect).",
         default=None,
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write .skillctl-cache/ (registry and validator caches).",
+    )
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get(SOCKET_ENV),
+        help=f"Send list/describe/validate/run to a `skillctl serve` socket (env: {SOCKET_ENV}).",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     p_list = subparsers.add_parser("list")
@@ -635,6 +3033,12 @@ def build_parser() -> argparse.ArgumentParser:
     p_validate = subparsers.add_parser("validate")
     p_validate.add_argument("targets", nargs="*")
     p_validate.add_argument("--all", action="store_true")
+    p_validate.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Validate uncached skills in this many processes (default: CPU count).",
+    )
     p_validate.add_argument("--allow-template", action="store_true", help="Allow targeting skills under skills/_*.")
     p_validate.set_defaults(func=cmd_validate)
 
@@ -643,9 +3047,73 @@ def build_parser() -> argparse.ArgumentParser:
     p_run.add_argument("--input", help="Path to JSON input file (default: stdin).")
     p_run.add_argument("--output", help="Write output JSON to a file (default: stdout).")
     p_run.add_argument("--timeout-ms", type=int, default=None)
+    p_run.add_argument(
+        "--max-output-bytes",
+        type=int,
+        default=None,
+        help="Fail the run if stdout exceeds this many bytes (default: runtime.maxOutputBytes or 16 MiB).",
+    )
+    p_run.add_argument("--tee", action="store_true", help="With --output, also write the output to stdout.")
     p_run.add_argument("--allow-template", action="store_true", help="Allow targeting skills under skills/_*.")
     p_run.set_defaults(func=cmd_run)
 
+    p_batch = subparsers.add_parser("run-batch")
+    p_batch.add_argument("target")
+    p_batch.add_argument("--input", required=True, help="JSONL file, one input object per line ('-' for stdin).")
+    p_batch.add_argument(
+        "--output",
+        help="Write output JSONL to a file (default: stdout). Line i holds the output for input i, or null.",
+    )
+    p_batch.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Concurrent skill processes.")
+    p_batch.add_argument("--timeout-ms", type=int, default=None, help="Per-item timeout (default: runtime.timeoutMs).")
+    p_batch.add_argument(
+        "--max-output-bytes",
+        type=int,
+        default=None,
+        help="Per-item stdout limit (default: runtime.maxOutputBytes or 16 MiB).",
+    )
+    p_batch.add_argument("--allow-template", action="store_true", help="Allow targeting skills under skills/_*.")
+    p_batch.set_defaults(func=cmd_run_batch)
+
+    p_test = subparsers.add_parser("test")
+    p_test.add_argument("targets", nargs="*")
+    p_test.add_argument("--all", action="store_true", help="Test every registered skill.")
+    p_test.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Fixtures run concurrently.")
+    p_test.add_argument("--timeout-ms", type=int, default=None, help="Per-fixture timeout (default: runtime.timeoutMs).")
+    p_test.add_argument("--report", help="Write one report for all fixtures (JUnit XML for *.xml, otherwise JSON).")
+    p_test.add_argument("--format", choices=("json", "junit"), default=None, help="Report format override.")
+    p_test.add_argument("--allow-template", action="store_true", help="Allow targeting skills under skills/_*.")
+    p_test.set_defaults(func=cmd_test)
+
+    p_pipe = subparsers.add_parser("pipe")
+    p_pipe.add_argument(
+        "targets",
+        nargs="+",
+        help="A pipeline manifest (*.yaml, kind: SkillPipeline) or skill ids to chain left to right.",
+    )
+    p_pipe.add_argument("--input", help="Path to JSON input file (default: stdin).")
+    p_pipe.add_argument("--output", help="Write the output stage's JSON to a file (default: stdout).")
+    p_pipe.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Stages run concurrently.")
+    p_pipe.add_argument("--timeout-ms", type=int, default=None, help="Per-stage timeout (default: each runtime.timeoutMs).")
+    p_pipe.add_argument("--plan", action="store_true", help="Check the DAG and schemas, print the stage order and exit.")
+    p_pipe.add_argument("--allow-template", action="store_true", help="Allow targeting skills under skills/_*.")
+    p_pipe.set_defaults(func=cmd_pipe)
+
+    p_serve = subparsers.add_parser("serve")
+    p_serve.add_argument("--socket", dest="listen", required=True, help="Unix socket path to listen on.")
+    p_serve.add_argument("--jobs", type=int, default=max(4, 2 * (os.cpu_count() or 1)), help="Requests executed at once.")
+    p_serve.add_argument("--per-skill", type=int, default=4, help="Concurrent runs (and warm workers) per skill.")
+    p_serve.set_defaults(func=cmd_serve)
+
+    p_stats = subparsers.add_parser("stats")
+    p_stats.add_argument("logs", nargs="*", help="stderr logs containing run reports (default: stdin).")
+    p_stats.add_argument("--json", action="store_true", help="Emit per-skill summaries as JSON.")
+    p_stats.add_argument(
+        "--state-out",
+        help="Also save the mergeable histogram state; pass such files back as inputs to combine hosts.",
+    )
+    p_stats.set_defaults(func=cmd_stats)
+
     p_scaffold = subparsers.add_parser("scaffold")
     p_scaffold.add_argument("skill_id", help="New skill id (example: fs.hash_tree).")
     p_scaffold.add_argument("slug", help="New skill slug under skills/ (example: fs-hash-tree).")
@@ -662,11 +3130,24 @@ def main(argv: list[str]) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
     repo_root = Path(args.repo_root) if args.repo_root else _find_repo_root(Path.cwd())
+    if args.socket and args.command in SERVED_COMMANDS and not args.no_cache:
+        args.repo_root = str(repo_root.resolve())
+        try:
+            return _forward_to_server(args.socket, args)
+        except SkillctlError as e:
+            _eprint(str(e))
+            return 1
+    global _PERSIST_CACHES
+    _PERSIST_CACHES = not args.no_cache
+    if _PERSIST_CACHES:
+        VALIDATORS.attach(_cache_dir(repo_root) / "validators.json")
     try:
         return int(args.func(repo_root, args))
     except SkillctlError as e:
         _eprint(str(e))
         return 1
+    finally:
+        VALIDATORS.save()
 
 
 if __name__ == "__main__":
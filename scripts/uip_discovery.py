@@ -0,0 +1,273 @@
+"""Pruned single-walk discovery of UIP artifacts backed by a persistent index."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+INDEX_VERSION = 1
+INDEX_ENV = "UIP_DISCOVERY_INDEX"
+SYNC_ROOTS_ENV = "UIP_SYNC_ROOTS"
+DEFAULT_INDEX_PATH = ROOT / ".uip-cache" / "discovery-index.json"
+
+# Directories never descended into during discovery.
+PRUNED_DIRS = {
+    ".git",
+    ".hg",
+    ".svn",
+    ".uip-cache",
+    "node_modules",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".tox",
+    ".nox",
+    "venv",
+}
+PRUNED_PREFIXES = (".venv",)
+CANDIDATE_SUFFIXES = (".json", ".yaml", ".yml")
+
+KNOWN_DIRS = {
+    "ui-artifacts": "auto",
+    "ui-contracts/examples": "event",
+    "synchronizations/examples": "event",
+    "skills/ui-intent-emit/examples": "intent",
+    "concepts/ui-intent-protocol/handlers/reference": "intent",
+}
+DEFAULT_SYNC_ROOTS = (
+    "synchronizations",
+    "synchronizations/templates",
+    "synchronizations/examples",
+)
+
+
+def _is_pruned(name: str) -> bool:
+    return name in PRUNED_DIRS or name.startswith(PRUNED_PREFIXES)
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def normalize_root(root: Path, value: str) -> str:
+    candidate = Path(value)
+    if candidate.is_absolute():
+        try:
+            candidate = candidate.resolve().relative_to(root.resolve())
+        except ValueError as exc:
+            raise ValueError(f"Sync root must live inside the repository: {value}") from exc
+    rel = candidate.as_posix().strip("/")
+    if rel in {"", "."}:
+        return ""
+    if ".." in Path(rel).parts:
+        raise ValueError(f"Sync root must not contain '..': {value}")
+    return rel
+
+
+def resolve_sync_roots(root: Path, roots: Optional[Iterable[str]] = None) -> tuple[str, ...]:
+    if roots is None:
+        raw = os.environ.get(SYNC_ROOTS_ENV, "")
+        roots = [item for item in raw.split(os.pathsep) if item.strip()] or DEFAULT_SYNC_ROOTS
+    return tuple(sorted({normalize_root(root, item.strip()) for item in roots}))
+
+
+def classify(rel_dir: str, name: str, sync_roots: Iterable[str]) -> Optional[str]:
+    if name.endswith(".json"):
+        kind = KNOWN_DIRS.get(rel_dir)
+        if kind is not None and kind != "auto":
+            return kind
+        if name.endswith(".intent.json"):
+            return "intent"
+        if name.endswith(".event.json"):
+            return "event"
+        return None
+    if name.endswith(".sync.yaml"):
+        return "sync"
+    if name.endswith((".yaml", ".yml")) and rel_dir in sync_roots:
+        return "sync"
+    return None
+
+
+class DiscoveryIndex:
+    """Directory and artifact stats from the last walk, plus cached per-file facts.
+
+    Unchanged directories are revisited with a single ``stat`` call; only
+    directories whose mtime moved are listed again, and only artifacts whose
+    (mtime, size) signature moved lose their cached facts.
+    """
+
+    def __init__(
+        self,
+        root: Path = ROOT,
+        index_path: Optional[Path] = None,
+        sync_roots: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.root = root
+        if index_path is None:
+            override = os.environ.get(INDEX_ENV)
+            index_path = Path(override) if override else DEFAULT_INDEX_PATH
+        self.index_path = index_path
+        self.sync_roots = resolve_sync_roots(root, sync_roots)
+        self._dirs: dict[str, dict[str, Any]] = {}
+        self._files: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self.changed: set[str] = set()
+        self.removed: set[str] = set()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        if data.get("root") != str(self.root):
+            return
+        dirs = data.get("dirs")
+        files = data.get("files")
+        if isinstance(dirs, dict) and isinstance(files, dict):
+            self._dirs = dirs
+            self._files = files
+
+    def _scan_dir(self, abs_dir: Path, mtime_ns: int) -> dict[str, Any]:
+        subdirs: list[str] = []
+        candidates: list[str] = []
+        try:
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _is_pruned(entry.name):
+                                subdirs.append(entry.name)
+                        elif entry.name.endswith(CANDIDATE_SUFFIXES) and entry.is_file():
+                            candidates.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return {"mtime_ns": mtime_ns, "subdirs": sorted(subdirs), "files": sorted(candidates)}
+
+    def refresh(self) -> "DiscoveryIndex":
+        old_dirs = self._dirs
+        old_files = self._files
+        dirs: dict[str, dict[str, Any]] = {}
+        files: dict[str, dict[str, Any]] = {}
+        changed: set[str] = set()
+
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            abs_dir = self.root / rel_dir if rel_dir else self.root
+            try:
+                mtime_ns = os.stat(abs_dir).st_mtime_ns
+            except OSError:
+                continue
+            entry = old_dirs.get(rel_dir)
+            if entry is None or entry.get("mtime_ns") != mtime_ns:
+                entry = self._scan_dir(abs_dir, mtime_ns)
+                self._dirty = True
+            dirs[rel_dir] = entry
+            stack.extend(_join(rel_dir, name) for name in reversed(entry["subdirs"]))
+
+            for name in entry["files"]:
+                kind = classify(rel_dir, name, self.sync_roots)
+                if kind is None:
+                    continue
+                rel = _join(rel_dir, name)
+                try:
+                    st = os.stat(self.root / rel)
+                except OSError:
+                    continue
+                signature = [st.st_mtime_ns, st.st_size]
+                previous = old_files.get(rel)
+                if previous is not None and previous.get("sig") == signature and previous.get("kind") == kind:
+                    files[rel] = previous
+                    continue
+                files[rel] = {"kind": kind, "sig": signature, "facts": {}}
+                changed.add(rel)
+
+        removed = set(old_files) - set(files)
+        if changed or removed or dirs.keys() != old_dirs.keys():
+            self._dirty = True
+        self._dirs = dirs
+        self._files = files
+        self.changed = changed
+        self.removed = removed
+        return self
+
+    def artifacts(self, kinds: Optional[Iterable[str]] = None) -> list[tuple[str, str]]:
+        wanted = set(kinds) if kinds is not None else None
+        return [
+            (rel, entry["kind"])
+            for rel, entry in sorted(self._files.items())
+            if wanted is None or entry["kind"] in wanted
+        ]
+
+    def path(self, rel: str) -> Path:
+        return self.root / rel
+
+    def facts(self, rel: str, namespace: str, extract: Callable[[Path], Any]) -> Any:
+        entry = self._files[rel]
+        cached = entry.setdefault("facts", {})
+        if namespace in cached:
+            return cached[namespace]
+        value = extract(self.path(rel))
+        cached[namespace] = value
+        self._dirty = True
+        return value
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {
+            "version": INDEX_VERSION,
+            "root": str(self.root),
+            "dirs": self._dirs,
+            "files": self._files,
+        }
+        tmp_name: Optional[str] = None
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=".discovery-index.", suffix=".tmp", dir=str(self.index_path.parent)
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp_name, self.index_path)
+        except OSError:
+            # The index is an accelerator only; a read-only checkout still discovers.
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            return
+        self._dirty = False
+
+
+def load_index(sync_roots: Optional[Iterable[str]] = None) -> DiscoveryIndex:
+    return DiscoveryIndex(sync_roots=sync_roots).refresh()
+
+
+def _parses_as_json(path: Path) -> bool:
+    try:
+        json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        return False
+    return True
+
+
+def first_invalid_json(index: DiscoveryIndex) -> Optional[Path]:
+    """First intent/event artifact that does not parse as JSON, in discovery order.
+
+    Validity is an index fact, so unchanged artifacts are parsed once per
+    (mtime, size) whichever script asks.
+    """
+    for rel, _ in index.artifacts(("intent", "event")):
+        if not index.facts(rel, "json.valid", _parses_as_json):
+            return index.path(rel)
+    return None
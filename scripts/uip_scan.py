@@ -0,0 +1,476 @@
+"""Single-pass multi-token scanning shared by the UIP boundary checks."""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import os
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+JS_SUFFIXES = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+PY_SUFFIXES = (".py",)
+SOURCE_SUFFIXES = JS_SUFFIXES + PY_SUFFIXES
+PRUNED_DIRS = {".git", "node_modules", "__pycache__", ".uip-cache", "dist", "build"}
+
+# raw: the file text as-is; text: comments removed; code: comments removed and
+# string bodies blanked (quotes kept); import: module specifiers only.
+CONTEXTS = ("raw", "text", "code", "import")
+
+
+@dataclass(frozen=True)
+class TokenRule:
+    category: str
+    rule: str
+    tokens: tuple[str, ...]
+    suggestion: str
+    roles: frozenset[str]
+    required: bool = False
+    context: str = "raw"
+    regex: bool = False
+
+
+@dataclass(frozen=True)
+class Hit:
+    rule: TokenRule
+    token: str
+    line: int
+    column: int
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    hits: tuple[Hit, ...]
+    missing: tuple[TokenRule, ...]
+
+
+@dataclass(frozen=True)
+class MaskedSource:
+    code: str
+    text: str
+    imports: tuple[tuple[int, str], ...]
+
+
+def language_for(path: Path) -> Optional[str]:
+    if path.name.endswith(JS_SUFFIXES):
+        return "js"
+    if path.name.endswith(PY_SUFFIXES):
+        return "python"
+    return None
+
+
+def _blank(text: str) -> str:
+    if "\n" not in text:
+        return " " * len(text)
+    return "\n".join(" " * len(part) for part in text.split("\n"))
+
+
+_JS_NEXT = re.compile(r"//|/\*|[\"'`{}/]")
+_JS_STRING = {
+    '"': re.compile(r'"(?:[^"\\\n]|\\[\s\S])*"'),
+    "'": re.compile(r"'(?:[^'\\\n]|\\[\s\S])*'"),
+}
+_JS_TEMPLATE_NEXT = re.compile(r"\\[\s\S]|`|\$\{")
+_JS_REGEX = re.compile(r"/((?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+)/[A-Za-z]*")
+_JS_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%~^")
+_JS_REGEX_KEYWORDS = re.compile(r"\b(?:return|typeof|case|do|else|in|of|new|delete|void|throw|yield|await)$")
+_JS_IMPORT_TAIL = re.compile(r"(?:\bfrom|\bimport|\b(?:require|import)\s*\(|\bjest\.mock\s*\()\s*$")
+
+
+def _mask_js(text: str) -> MaskedSource:
+    out: list[str] = []
+    kept: list[str] = []
+    imports: list[tuple[int, str]] = []
+    template_depths: list[int] = []
+    pos = 0
+    length = len(text)
+
+    def scan_template(start: int) -> int:
+        # start points just past an opening backtick or a closing "}" of ${...}.
+        cursor = start
+        while True:
+            match = _JS_TEMPLATE_NEXT.search(text, cursor)
+            if match is None:
+                out.append(_blank(text[start:]))
+                kept.append(text[start:])
+                return length
+            token = match.group()
+            if token == "`":
+                out.append(_blank(text[start:match.start()]) + "`")
+                kept.append(text[start:match.end()])
+                return match.end()
+            if token == "${":
+                out.append(_blank(text[start:match.start()]) + "${")
+                kept.append(text[start:match.end()])
+                template_depths.append(0)
+                return match.end()
+            cursor = match.end()
+
+    while pos < length:
+        match = _JS_NEXT.search(text, pos)
+        if match is None:
+            out.append(text[pos:])
+            kept.append(text[pos:])
+            break
+        start = match.start()
+        out.append(text[pos:start])
+        kept.append(text[pos:start])
+        token = match.group()
+        if token in ("//", "/*"):
+            if token == "//":
+                end = text.find("\n", start)
+                end = length if end == -1 else end
+            else:
+                end = text.find("*/", start + 2)
+                end = length if end == -1 else end + 2
+            out.append(_blank(text[start:end]))
+            kept.append(out[-1])
+            pos = end
+        elif token in _JS_STRING:
+            literal = _JS_STRING[token].match(text, start)
+            if literal is None:
+                # Unterminated on its line (JSX text such as "it's"): treat as code.
+                out.append(token)
+                kept.append(token)
+                pos = start + 1
+                continue
+            end = literal.end()
+            if _JS_IMPORT_TAIL.search(text, max(0, start - 96), start):
+                imports.append((start + 1, text[start + 1:end - 1]))
+            out.append(token + _blank(text[start + 1:end - 1]) + token)
+            kept.append(text[start:end])
+            pos = end
+        elif token == "`":
+            out.append("`")
+            kept.append("`")
+            pos = scan_template(start + 1)
+        elif token == "{":
+            if template_depths:
+                template_depths[-1] += 1
+            out.append("{")
+            kept.append("{")
+            pos = start + 1
+        elif token == "}":
+            out.append("}")
+            kept.append("}")
+            pos = start + 1
+            if template_depths:
+                if template_depths[-1] == 0:
+                    template_depths.pop()
+                    pos = scan_template(pos)
+                else:
+                    template_depths[-1] -= 1
+        else:
+            before = text[max(0, start - 96):start].rstrip()
+            is_regex = not before or before[-1] in _JS_REGEX_PRECEDERS or _JS_REGEX_KEYWORDS.search(before)
+            literal = _JS_REGEX.match(text, start) if is_regex else None
+            if literal is None:
+                out.append("/")
+                kept.append("/")
+                pos = start + 1
+            else:
+                out.append("/" + _blank(literal.group(1)) + text[literal.end(1):literal.end()])
+                kept.append(text[start:literal.end()])
+                pos = literal.end()
+    return MaskedSource("".join(out), "".join(kept), tuple(imports))
+
+
+_PY_NEXT = re.compile(r"#|(?<![\w])[rRbBuUfF]{1,2}(?:'''|\"\"\"|'|\")|'''|\"\"\"|'|\"")
+_PY_STRING_BODY = {
+    "'''": re.compile(r"(?:[^\\]|\\[\s\S])*?'''"),
+    '"""': re.compile(r'(?:[^\\]|\\[\s\S])*?"""'),
+    "'": re.compile(r"(?:[^'\\\n]|\\[\s\S])*'"),
+    '"': re.compile(r'(?:[^"\\\n]|\\[\s\S])*"'),
+}
+_PY_IMPORT = re.compile(r"^[ \t]*(?:from[ \t]+(\.*[\w.]*)[ \t]+import\b|import[ \t]+([^\n;#]+))", re.M)
+_PY_IMPORT_CALL_TAIL = re.compile(r"\b(?:import_module|__import__)\s*\(\s*$")
+
+
+def _python_spec(module: str) -> str:
+    # Dotted modules become package paths ("concepts.billing" -> "concepts/billing/")
+    # so the same directory rules apply to Python and JS specifiers. One leading
+    # dot is the current package ("./"), each further dot one level up ("../").
+    stripped = module.lstrip(".")
+    dots = len(module) - len(stripped)
+    prefix = "./" if dots == 1 else "../" * (dots - 1)
+    if not stripped:
+        return prefix
+    return prefix + stripped.replace(".", "/") + "/"
+
+
+def _mask_python(text: str) -> MaskedSource:
+    out: list[str] = []
+    kept: list[str] = []
+    imports: list[tuple[int, str]] = []
+    pos = 0
+    length = len(text)
+    while pos < length:
+        match = _PY_NEXT.search(text, pos)
+        if match is None:
+            out.append(text[pos:])
+            kept.append(text[pos:])
+            break
+        start = match.start()
+        out.append(text[pos:start])
+        kept.append(text[pos:start])
+        token = match.group()
+        if token == "#":
+            end = text.find("\n", start)
+            end = length if end == -1 else end
+            out.append(_blank(text[start:end]))
+            kept.append(out[-1])
+            pos = end
+            continue
+        quote = token.lstrip("rRbBuUfF")
+        body = _PY_STRING_BODY[quote].match(text, match.end())
+        if body is not None:
+            end = body.end()
+            close = len(quote)
+        elif len(quote) == 1:
+            # Unterminated single-line string: stop at the end of the line.
+            end = text.find("\n", match.end())
+            end = length if end == -1 else end
+            close = 0
+        else:
+            end = length
+            close = 0
+        inner = text[match.end():end - close]
+        if len(quote) == 1 and _PY_IMPORT_CALL_TAIL.search(text, max(0, start - 96), start):
+            imports.append((match.end(), _python_spec(inner)))
+        out.append(token + _blank(inner) + text[end - close:end])
+        kept.append(text[start:end])
+        pos = end
+    code = "".join(out)
+    for statement in _PY_IMPORT.finditer(code):
+        if statement.group(1) is not None:
+            imports.append((statement.start(1), _python_spec(statement.group(1))))
+            continue
+        offset = statement.start(2)
+        for part in statement.group(2).split(","):
+            words = part.replace("(", " ").replace(")", " ").split()
+            if words:
+                imports.append((offset + part.index(words[0]), _python_spec(words[0])))
+            offset += len(part) + 1
+    return MaskedSource(code, "".join(kept), tuple(sorted(imports)))
+
+
+def mask_source(text: str, language: Optional[str]) -> Optional[MaskedSource]:
+    if language == "js":
+        return _mask_js(text)
+    if language == "python":
+        return _mask_python(text)
+    return None
+
+
+class _LineIndex:
+    def __init__(self, text: str) -> None:
+        self._starts = [0] + [match.end() for match in re.finditer("\n", text)]
+
+    def locate(self, offset: int) -> tuple[int, int]:
+        line = bisect.bisect_right(self._starts, offset)
+        return line, offset - self._starts[line - 1] + 1
+
+
+_ZERO_WIDTH = {_sre_parse.AT}
+_MAX_CLASS_RANGE = 128
+
+
+def _first_chars_of(items: Any) -> Optional[set[str]]:
+    """Characters a parsed regex can start with, or None when unbounded or unknown."""
+    for op, arg in items:
+        if op in _ZERO_WIDTH:
+            continue
+        if op is _sre_parse.LITERAL:
+            return {chr(arg)}
+        if op is _sre_parse.IN:
+            chars: set[str] = set()
+            for kind, value in arg:
+                if kind is _sre_parse.LITERAL:
+                    chars.add(chr(value))
+                elif kind is _sre_parse.RANGE and value[1] - value[0] < _MAX_CLASS_RANGE:
+                    chars.update(chr(code) for code in range(value[0], value[1] + 1))
+                else:
+                    return None
+            return chars
+        if op is _sre_parse.BRANCH:
+            union: set[str] = set()
+            for branch in arg[1]:
+                first = _first_chars_of(branch)
+                if first is None:
+                    return None
+                union |= first
+            return union
+        if op is _sre_parse.SUBPATTERN:
+            return _first_chars_of(arg[-1])
+        if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT) and arg[0] >= 1:
+            return _first_chars_of(arg[2])
+        return None
+    return None
+
+
+def _first_chars(token: str, regex: bool) -> Optional[set[str]]:
+    if not regex:
+        return {token[0]} if token else None
+    try:
+        parsed = _sre_parse.parse(token)
+    except re.error:
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    return _first_chars_of(parsed)
+
+
+def _iter_matches(pattern: re.Pattern[str], text: str) -> Iterator[tuple[re.Match[str], int, int]]:
+    line = 1
+    line_start = 0
+    cursor = 0
+    for match in pattern.finditer(text):
+        start = match.start()
+        newlines = text.count("\n", cursor, start)
+        if newlines:
+            line += newlines
+            line_start = text.rfind("\n", cursor, start) + 1
+        cursor = start
+        yield match, line, start - line_start + 1
+
+
+class MultiTokenScanner:
+    """Finds every rule token in one regex pass per file and context.
+
+    All tokens of a context are compiled into a single alternation (literal
+    tokens longest first, so a token never shadows a longer one sharing its
+    prefix). Forbidden rules report each occurrence with its line; required
+    rules are satisfied when any of their tokens occurs. ``text``, ``code``
+    and ``import`` rules run over a lexed view of JS/TS/Python sources so
+    that comments (and, for ``code``, string literals) never match; other
+    files fall back to the raw text.
+    """
+
+    def __init__(self, rules: Iterable[TokenRule]) -> None:
+        self.rules = tuple(rules)
+        self._groups: dict[str, list[TokenRule]] = {}
+        self._patterns: dict[str, re.Pattern[str]] = {}
+        alternatives: dict[str, dict[tuple[bool, str], str]] = {}
+        for rule in self.rules:
+            if rule.context not in CONTEXTS:
+                raise ValueError(f"Unknown scan context '{rule.context}' for rule {rule.rule}")
+            by_source = alternatives.setdefault(rule.context, {})
+            for token in rule.tokens:
+                key = (rule.regex, token)
+                if key not in by_source:
+                    by_source[key] = f"t{len(self._groups)}"
+                    self._groups[by_source[key]] = []
+                self._groups[by_source[key]].append(rule)
+        for context, by_source in alternatives.items():
+            ordered = sorted(by_source, key=lambda key: (key[0], -len(key[1]), key[1]))
+            pattern = "|".join(
+                f"(?P<{by_source[key]}>{key[1] if key[0] else re.escape(key[1])})" for key in ordered
+            )
+            starts = [_first_chars(token, regex) for regex, token in ordered]
+            if all(starts):
+                # re only skips ahead on a leading literal or character class, so a
+                # bare alternation (or one behind \b / ^) is tried at every offset;
+                # the lookahead makes it jump to candidate characters instead.
+                first = "".join(sorted(re.escape(char) for char in set().union(*starts)))
+                pattern = f"(?=[{first}])(?:{pattern})"
+            self._patterns[context] = re.compile(pattern)
+
+    def scan_text(self, text: str, roles: Iterable[str], language: Optional[str] = None) -> ScanResult:
+        active = frozenset(roles)
+        hits: list[Hit] = []
+        seen_required: set[TokenRule] = set()
+
+        def record(match: re.Match[str], line: int, column: int) -> None:
+            for rule in self._groups[match.lastgroup or ""]:
+                if not rule.roles & active:
+                    continue
+                if rule.required:
+                    seen_required.add(rule)
+                else:
+                    hits.append(Hit(rule, match.group(0), line, column))
+
+        masked = None
+        if set(self._patterns) - {"raw"}:
+            masked = mask_source(text, language)
+        for context, pattern in self._patterns.items():
+            if context == "import" and masked is not None:
+                lines = _LineIndex(text)
+                for offset, spec in masked.imports:
+                    for match in pattern.finditer(spec):
+                        line, column = lines.locate(offset + match.start())
+                        record(match, line, column)
+                continue
+            view = text
+            if masked is not None and context != "raw":
+                view = masked.code if context == "code" else masked.text
+            for match, line, column in _iter_matches(pattern, view):
+                record(match, line, column)
+
+        hits.sort(key=lambda hit: (hit.line, hit.column))
+        missing = tuple(
+            rule
+            for rule in self.rules
+            if rule.required and rule.roles & active and rule not in seen_required
+        )
+        return ScanResult(tuple(hits), missing)
+
+    def scan_file(self, path: Path, roles: Iterable[str]) -> ScanResult:
+        text = path.read_text(encoding="utf-8", errors="replace")
+        return self.scan_text(text, roles, language_for(path))
+
+
+def iter_source_files(
+    root: Path,
+    suffixes: tuple[str, ...] = SOURCE_SUFFIXES,
+    pruned: Optional[set[str]] = None,
+) -> Iterator[Path]:
+    if root.is_file():
+        if root.name.endswith(suffixes):
+            yield root
+        return
+    skip = PRUNED_DIRS if pruned is None else pruned
+    for current, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name not in skip)
+        for name in sorted(filenames):
+            if name.endswith(suffixes):
+                yield Path(current) / name
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Print pattern matches (path:line:col:match) using the UIP source lexer."
+    )
+    parser.add_argument("--pattern", required=True, help="Python regular expression to search for.")
+    parser.add_argument("--context", choices=CONTEXTS, default="code")
+    parser.add_argument("--first", action="store_true", help="Stop after the first match.")
+    parser.add_argument("files", nargs="*", help="Files to scan (default: newline-separated list on stdin).")
+    args = parser.parse_args(argv)
+
+    rule = TokenRule("", "match", (args.pattern,), "", frozenset({"any"}), context=args.context, regex=True)
+    scanner = MultiTokenScanner([rule])
+    files = args.files or [line.strip() for line in sys.stdin if line.strip()]
+    found = False
+    for name in files:
+        try:
+            result = scanner.scan_file(Path(name), {"any"})
+        except OSError as exc:
+            print(f"{name}: {exc}", file=sys.stderr)
+            return 2
+        for hit in result.hits:
+            print(f"{name}:{hit.line}:{hit.column}:{hit.token}")
+            found = True
+            if args.first:
+                return 0
+    return 0 if found else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
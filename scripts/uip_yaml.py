@@ -63,19 +63,26 @@ def _parse_scalar(value: str) -> Any:
         return value
 
 
+def _is_list_item(text: str) -> bool:
+    # A bare "-" (trailing space stripped) opens a nested block item. It is the
+    # only way to write a list of mappings here (no "- key: value" items), as
+    # sync participants and renderer entries require.
+    return text == "-" or text.startswith("- ")
+
+
 def _parse_block(lines: list[Tuple[int, str]], index: int, indent: int) -> Tuple[Any, int]:
     if index >= len(lines):
         return {}, index
 
     _, text = lines[index]
-    if text.startswith("- "):
+    if _is_list_item(text):
         items: list[Any] = []
         i = index
         while i < len(lines):
             i_indent, i_text = lines[i]
-            if i_indent != indent or not i_text.startswith("- "):
+            if i_indent != indent or not _is_list_item(i_text):
                 break
-            rest = i_text[2:].strip()
+            rest = i_text[1:].strip()
             i += 1
             if rest == "":
                 if i >= len(lines) or lines[i][0] <= indent:
@@ -92,7 +99,7 @@ def _parse_block(lines: list[Tuple[int, str]], index: int, indent: int) -> Tuple
     i = index
     while i < len(lines):
         i_indent, i_text = lines[i]
-        if i_indent != indent or i_text.startswith("- "):
+        if i_indent != indent or _is_list_item(i_text):
             break
         if ":" not in i_text:
             raise YamlError(f"Invalid mapping entry (missing ':'): {i_text}")
@@ -0,0 +1,54 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+runner="$repo_root/scripts/run-reasoning-pipeline.py"
+work_dir="$(mktemp -d)"
+trap 'rm -rf "$work_dir"' EXIT
+
+cat >"$work_dir/context.json" <<'JSON'
+{
+  "user_request": "Add a pattern",
+  "approved_spec_ids": ["999bd713-5142-49b2-92d9-f22b1ceea0f4"],
+  "active_concept_manifest": "concepts/ui-pattern-registry/manifest.yaml",
+  "concept_registry": ["ui-pattern-registry", "public-visibility"],
+  "task_context": {"paths": ["concepts/ui-pattern-registry/patterns/"]}
+}
+JSON
+
+python3 "$runner" --input "$work_dir/context.json" --cache "$work_dir/cache.json" \
+  >"$work_dir/out.jsonl" 2>"$work_dir/report.json"
+[[ "$(wc -l <"$work_dir/out.jsonl")" -eq 3 ]]
+grep -q '"event":"reasoning_pipeline_report"' "$work_dir/report.json"
+python3 - "$work_dir/out.jsonl" "$repo_root/runs/2025-12-26/reasoning.jsonl" <<'PY'
+import json
+import sys
+
+ours = [json.loads(line) for line in open(sys.argv[1], encoding="utf-8")]
+recorded = [json.loads(line) for line in open(sys.argv[2], encoding="utf-8")]
+for got, want in zip(ours, recorded):
+    assert list(got) == list(want), (list(got), list(want))
+    for key in ("event_type", "skill_name", "order", "spec_id", "concept_id", "violations", "abort_reason"):
+        assert got[key] == want[key], (key, got[key], want[key])
+    assert set(want["guarantees"]) <= set(got["guarantees"])
+PY
+
+# Second run is served from the step cache.
+python3 "$runner" --input "$work_dir/context.json" --cache "$work_dir/cache.json" 2>"$work_dir/report.json" >/dev/null
+[[ "$(grep -o '"cache":"hit"' "$work_dir/report.json" | wc -l)" -eq 3 ]]
+
+# A cross-concept path aborts at the third step.
+sed 's#"concepts/ui-pattern-registry/patterns/"#"concepts/public-visibility/README.md"#' \
+  "$work_dir/context.json" >"$work_dir/cross.json"
+if python3 "$runner" --input "$work_dir/cross.json" --no-cache >"$work_dir/out.jsonl" 2>/dev/null; then
+  echo "expected cross-concept context to abort" >&2
+  exit 1
+fi
+tail -n 1 "$work_dir/out.jsonl" | grep -q '"abort_reason":"Cross-concept symbols, paths, or logic are detected in the context."'
+
+# Pipeline stops at the first abort_reason.
+echo '{"approved_spec_ids": []}' | python3 "$runner" --no-cache >"$work_dir/out.jsonl" 2>/dev/null || true
+[[ "$(wc -l <"$work_dir/out.jsonl")" -eq 1 ]]
+grep -q '"abort_reason":"No approved spec ID is provided."' "$work_dir/out.jsonl"
+
+echo "reasoning pipeline OK"
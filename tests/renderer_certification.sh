@@ -0,0 +1,119 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+work_dir="$(mktemp -d)"
+trap 'rm -rf "$work_dir"' EXIT
+
+# The checker resolves every path from its own checkout, so run copies in a scratch tree.
+mkdir -p "$work_dir/scripts" "$work_dir/ui-contracts" "$work_dir/skills/ui-intent-emit/impl" \
+  "$work_dir/renderers/web/lib" "$work_dir/fixtures"
+cp "$repo_root"/scripts/{check-renderer-certification.py,uip_scan.py,uip_yaml.py} "$work_dir/scripts/"
+certify() { python3 "$work_dir/scripts/check-renderer-certification.py" "$@"; }
+
+cat >"$work_dir/ui-contracts/renderers.yaml" <<'YAML'
+renderers:
+  -
+    id: web
+    entrypoint: renderers/web/entry.tsx
+    adapter: renderers/web/adapter.tsx
+    sources:
+      - renderers/web/lib
+    intentFixture: fixtures/intent.json
+    invalidIntentFixture: fixtures/invalid.json
+    eventFixture: fixtures/event.json
+YAML
+cat >"$work_dir/skills/ui-intent-emit/impl/run.py" <<'PY'
+def validate_intent(intent):
+    if not isinstance(intent, dict) or intent.get("schemaVersion") != "1.0.0":
+        return [{"path": "schemaVersion", "message": "schemaVersion must be 1.0.0"}]
+    return []
+PY
+echo '{"schemaVersion": "1.0.0"}' >"$work_dir/fixtures/intent.json"
+echo '{"intent": {"schemaVersion": "0.1.0"}}' >"$work_dir/fixtures/invalid.json"
+echo '{"intentId": "i", "uiSessionId": "s", "idempotencyKey": "k", "schemaVersion": "1.0.0", "payload": {}}' \
+  >"$work_dir/fixtures/event.json"
+
+# Entrypoint without the required validator call; tokens in comments and strings do not count.
+cat >"$work_dir/renderers/web/entry.tsx" <<'TS'
+import { render } from "./adapter";
+import plan from "../../agents/plan";
+// Date.now() in a comment is fine
+export const t = Date.now();
+render(plan, "assertValidUiIntent");
+TS
+cat >"$work_dir/renderers/web/adapter.tsx" <<'TS'
+import { tailwindTokens } from "./tokens";
+const s = "Math.random";
+export const B = () => <button className="x" />;
+TS
+cat >"$work_dir/renderers/web/lib/util.ts" <<'TS'
+import c from "concepts/billing";
+export const id = crypto.randomUUID();
+TS
+echo 'Math.random' >"$work_dir/renderers/web/lib/notes.md"
+
+if certify 2>"$work_dir/err"; then
+  echo "expected renderer certification to fail" >&2
+  exit 1
+fi
+cat >"$work_dir/expected" <<'TXT'
+UIP-BOUNDARY-VIOLATION | file: renderers/web/adapter.tsx:3 | rule: renderer.styling | suggestion: Avoid inline className strings; use token references.
+UIP-BOUNDARY-VIOLATION | file: renderers/web/entry.tsx | rule: renderer.input.validation | suggestion: Call assertValidUiIntent or validateUiIntent before rendering.
+UIP-BOUNDARY-VIOLATION | file: renderers/web/entry.tsx:2 | rule: renderer.imports | suggestion: Remove domain/agent/skill imports from renderer code.
+UIP-BOUNDARY-VIOLATION | file: renderers/web/entry.tsx:4 | rule: renderer.determinism | suggestion: Remove nondeterministic call (Date.now).
+UIP-BOUNDARY-VIOLATION | file: renderers/web/lib/util.ts:1 | rule: renderer.imports | suggestion: Remove domain/agent/skill imports from renderer code.
+UIP-BOUNDARY-VIOLATION | file: renderers/web/lib/util.ts:2 | rule: renderer.determinism | suggestion: Remove nondeterministic call (crypto.randomUUID).
+TXT
+diff -u "$work_dir/expected" "$work_dir/err"
+
+# A clean renderer passes: the required tokens are present and nothing else is flagged.
+cat >"$work_dir/renderers/web/entry.tsx" <<'TS'
+import { render } from "./adapter";
+export function mount(intent) {
+  assertValidUiIntent(intent);
+  return render(intent);
+}
+TS
+printf 'import { tailwindTokens } from "./tokens";\nexport const B = () => <button css={tailwindTokens.primary} />;\n' \
+  >"$work_dir/renderers/web/adapter.tsx"
+printf 'export const id = (n) => `item-${n}`;\n' >"$work_dir/renderers/web/lib/util.ts"
+certify
+
+# Cache: a second renderer sharing the fixtures, certified by a two-process pool.
+mkdir -p "$work_dir/renderers/native"
+cp "$work_dir/renderers/web/entry.tsx" "$work_dir/renderers/native/entry.tsx"
+cp "$work_dir/renderers/web/adapter.tsx" "$work_dir/renderers/native/adapter.tsx"
+cat >>"$work_dir/ui-contracts/renderers.yaml" <<'YAML'
+  -
+    id: native
+    entrypoint: renderers/native/entry.tsx
+    adapter: renderers/native/adapter.tsx
+    intentFixture: fixtures/intent.json
+    invalidIntentFixture: fixtures/invalid.json
+    eventFixture: fixtures/event.json
+YAML
+stats() {
+  certify --jobs 2 --stats "$@" 2>"$work_dir/err" || true
+  grep '^renderer certification:' "$work_dir/err"
+}
+rm -rf "$work_dir/.uip-cache"
+[[ "$(stats)" == "renderer certification: 2 renderers, 2 certified, 0 from cache" ]]
+[[ -f "$work_dir/.uip-cache/renderer-certification.json" ]]
+[[ "$(stats)" == "renderer certification: 2 renderers, 0 certified, 2 from cache" ]]
+[[ "$(stats --no-cache)" == "renderer certification: 2 renderers, 2 certified, 0 from cache" ]]
+
+# Editing one renderer's adapter re-certifies only that renderer, and a cached failure is still reported.
+printf 'export const B = () => <b className="x" />;
+' >>"$work_dir/renderers/native/adapter.tsx"
+[[ "$(stats)" == "renderer certification: 2 renderers, 1 certified, 1 from cache" ]]
+grep -q '^UIP-BOUNDARY-VIOLATION | file: renderers/native/adapter.tsx:3 | rule: renderer.styling' "$work_dir/err"
+[[ "$(stats)" == "renderer certification: 2 renderers, 0 certified, 2 from cache" ]]
+grep -q '^UIP-BOUNDARY-VIOLATION | file: renderers/native/adapter.tsx:3 | rule: renderer.styling' "$work_dir/err"
+
+# Editing a shared fixture re-certifies every renderer that uses it.
+echo '{"intent": {"schemaVersion": "1.0.0"}}' >"$work_dir/fixtures/invalid.json"
+[[ "$(stats)" == "renderer certification: 2 renderers, 2 certified, 0 from cache" ]]
+[[ "$(grep -c 'rule: renderer.input.invalid' "$work_dir/err")" == 2 ]]
+
+echo "renderer certification OK"
@@ -0,0 +1,44 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+indexer="$repo_root/scripts/index-run-records.py"
+work_dir="$(mktemp -d)"
+trap 'rm -rf "$work_dir"' EXIT
+
+mkdir -p "$work_dir/runs/2026-01-01"
+cp "$repo_root"/runs/2025-12-26/*.jsonl "$work_dir/runs/2026-01-01/"
+idx() { python3 "$indexer" --root "$work_dir" "$@"; }
+
+out="$(idx index)"; grep -q '^Indexed 3 new records from 3 of 3 files (3 skipped' <<<"$out"
+out="$(idx index)"; grep -q '^Indexed 0 new records from 0 of 3 files' <<<"$out"
+out="$(idx runs --touched schemas/pattern.schema.json)"
+[[ "$(tail -n +2 <<<"$out" | wc -l)" -eq 2 ]]
+
+# Appended lines are picked up; a line without its newline waits for the next pass.
+record='{"run_id":"run-new","timestamp":"2026-01-02T10:00:00Z","concept_id":"c","skill_id":"s","spec_id":"x",'
+record+='"files_touched":["a.py"],"commands_executed":["make"],"outcome":"fail","fix_loop_count":2,'
+record+='"synchronizations_used":["sync-a"]}'
+printf '%s\n{"run_id":"run-' "$record" >>"$work_dir/runs/2026-01-01/run-new.jsonl"
+out="$(idx index)"; grep -q '^Indexed 1 new records' <<<"$out"
+out="$(idx --no-refresh runs --synchronization sync-a --json)"; grep -q '"fix_loop_count":2' <<<"$out"
+printf 'late","timestamp":"2026-01-03"}\n' >>"$work_dir/runs/2026-01-01/run-new.jsonl"
+out="$(idx runs --since 2026-01-03)"
+[[ "$(tail -n +2 <<<"$out" | cut -f1)" == "run-late" ]]
+out="$(idx fix-loops --by skill)"; grep -q $'^s\t1\t1\t2\t' <<<"$out"
+
+# Rewritten and removed files are re-indexed.
+echo "$record" >"$work_dir/runs/2026-01-01/run-new.jsonl"
+rm "$work_dir/runs/2026-01-01/run-2025-12-26-public-visibility.jsonl"
+out="$(idx index)"; grep -q '1 re-read, 1 removed); 3 runs in index' <<<"$out"
+out="$(idx sql "SELECT COUNT(*) AS n FROM commands_executed WHERE command = 'make'")"
+[[ "$(tail -n 1 <<<"$out")" == "1" ]]
+# A closed pipe on the reader side is not an error.
+out="$(idx runs 2>&1 | head -n 1)"
+[[ "$out" == run_id* ]]
+if idx sql 'DELETE FROM runs' 2>/dev/null; then
+  echo "sql must be read-only" >&2
+  exit 1
+fi
+
+echo "run records index OK"
@@ -17,3 +17,354 @@ trap 'rm -f "$stdout_file"' EXIT
   >"$stdout_file" 2>/dev/null
 
 diff -u "$repo_root/skills/_template/fixtures/output.expected.json" "$stdout_file"
+
+# Registry index: a scaffolded skill is listed and resolvable by id, and a
+# warm index returns the same listing as a cold one.
+scratch="$(mktemp -d)"
+trap 'rm -f "$stdout_file"; rm -rf "$scratch"' EXIT
+mkdir -p "$scratch/skills"
+touch "$scratch/AGENTS.md"
+cp -R "$repo_root/skills/_schema" "$repo_root/skills/_template" "$scratch/skills/"
+"$repo_root/scripts/skillctl" --repo-root "$scratch" scaffold demo.echo demo-echo --spec-id smoke 2>/dev/null
+
+cold="$("$repo_root/scripts/skillctl" --repo-root "$scratch" list --json)"
+warm="$("$repo_root/scripts/skillctl" --repo-root "$scratch" list --json)"
+[[ "$cold" == "$warm" ]]
+[[ "$cold" == *'"id":"demo.echo"'* ]]
+[[ -f "$scratch/.skillctl-cache/registry.json" ]]
+
+"$repo_root/scripts/skillctl" --repo-root "$scratch" run demo.echo \
+  --input "$scratch/skills/demo-echo/fixtures/input.json" >"$stdout_file" 2>/dev/null
+diff -u "$scratch/skills/demo-echo/fixtures/output.expected.json" "$stdout_file"
+
+# run-batch: outputs stream in input order, one line per input.
+printf '{"n":1}\n{"n":2}\n{"n":3}\n' >"$scratch/inputs.jsonl"
+"$repo_root/scripts/skillctl" --repo-root "$scratch" run-batch demo.echo \
+  --input "$scratch/inputs.jsonl" --jobs 2 >"$stdout_file" 2>"$scratch/batch-stderr.log"
+diff -u "$scratch/inputs.jsonl" "$stdout_file"
+
+# stats: the batch report aggregates into one per-skill row of three runs.
+"$repo_root/scripts/skillctl" stats "$scratch/batch-stderr.log" | grep -q "^demo.echo@0.1.0	3	0.0%	0.0%	"
+# The batch report and stats use the same percentile set.
+python3 - "$scratch/batch-stderr.log" <<'PY'
+import json
+import sys
+
+reports = [json.loads(line) for line in open(sys.argv[1], encoding="utf-8") if line.startswith("{")]
+batch = [r for r in reports if r.get("mode") == "batch"]
+assert batch and sorted(batch[-1]["latencyMs"]) == ["max", "p50", "p95", "p99"], batch
+PY
+[[ "$("$repo_root/scripts/skillctl" stats --json "$scratch/batch-stderr.log")" == *'"p95"'* ]]
+
+# pipe: an ad-hoc chain passes outputs through in memory.
+printf '{"n":1}\n' >"$scratch/pipe-input.json"
+"$repo_root/scripts/skillctl" --repo-root "$scratch" pipe demo.echo demo.echo \
+  --input "$scratch/pipe-input.json" >"$stdout_file" 2>/dev/null
+diff -u "$scratch/pipe-input.json" "$stdout_file"
+
+# serve: the thin client prints what a local invocation prints.
+"$repo_root/scripts/skillctl" --repo-root "$scratch" serve --socket "$scratch/skillctl.sock" 2>/dev/null &
+server_pid=$!
+# A failed check must not leave the server holding the socket (and our stdout) open.
+trap 'kill "$server_pid" 2>/dev/null; rm -f "$stdout_file"; rm -rf "$scratch"' EXIT
+for _ in $(seq 50); do
+  [[ -S "$scratch/skillctl.sock" ]] && break
+  sleep 0.1
+done
+served="$("$repo_root/scripts/skillctl" --repo-root "$scratch" --socket "$scratch/skillctl.sock" list --json)"
+[[ "$(stat -c %a "$scratch/skillctl.sock")" == 600 ]]
+# The server's warm registry is revalidated by stat: skills added or removed meanwhile are seen.
+"$repo_root/scripts/skillctl" --repo-root "$scratch" scaffold demo.later demo-later --spec-id smoke 2>/dev/null
+[[ "$("$repo_root/scripts/skillctl" --repo-root "$scratch" --socket "$scratch/skillctl.sock" list --json)" == *'"id":"demo.later"'* ]]
+rm -rf "$scratch/skills/demo-later"
+[[ "$("$repo_root/scripts/skillctl" --repo-root "$scratch" --socket "$scratch/skillctl.sock" list --json)" == "$cold" ]]
+# --no-cache runs locally instead of being forwarded; a forwarded no_cache is rejected.
+[[ "$("$repo_root/scripts/skillctl" --repo-root "$scratch" --socket "$scratch/missing.sock" --no-cache list --json)" == "$cold" ]]
+python3 - "$scratch/skillctl.sock" "$scratch" <<'PY'
+import base64
+import json
+import socket
+import sys
+
+request = {"args": {"command": "list", "repo_root": sys.argv[2], "no_cache": True, "json": True}}
+with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+    conn.connect(sys.argv[1])
+    conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+    conn.shutdown(socket.SHUT_WR)
+    response = json.loads(b"".join(iter(lambda: conn.recv(1 << 16), b"")))
+assert response["exitCode"] == 1, response
+assert b"--no-cache is not served" in base64.b64decode(response["stderr"]), response
+PY
+"$repo_root/scripts/skillctl" --repo-root "$scratch" --socket "$scratch/skillctl.sock" run demo.echo \
+  <"$scratch/pipe-input.json" >"$stdout_file" 2>/dev/null
+kill "$server_pid"
+wait "$server_pid"
+trap 'rm -f "$stdout_file"; rm -rf "$scratch"' EXIT
+[[ "$served" == "$cold" ]]
+diff -u "$scratch/pipe-input.json" "$stdout_file"
+
+# zygote: a python skill forked from a pre-imported interpreter behaves like a oneshot run.
+"$repo_root/scripts/skillctl" --repo-root "$scratch" scaffold demo.fork demo-fork --spec-id smoke 2>/dev/null
+printf 'import json, sys\njson.dump(json.load(sys.stdin), sys.stdout)\n' >"$scratch/skills/demo-fork/impl/run.py"
+"$repo_root/.venv-skillctl/bin/python" - "$scratch/skills/demo-fork/skill.yaml" <<'PY'
+import sys
+path = sys.argv[1]
+text = open(path, encoding="utf-8").read()
+text = text.replace("  type: command\n  command:\n    - sh\n    - impl/run.sh\n", "  type: python\n  command:\n    - python3\n    - impl/run.py\n")
+text = text.replace("  timeoutMs: 60000\n", "  timeoutMs: 60000\n  mode: zygote\n  zygote:\n    preload:\n      - json\n", 1)
+open(path, "w", encoding="utf-8").write(text)
+PY
+grep -q "^  mode: zygote$" "$scratch/skills/demo-fork/skill.yaml"
+"$repo_root/scripts/skillctl" --repo-root "$scratch" validate demo.fork >/dev/null
+"$repo_root/scripts/skillctl" --repo-root "$scratch" run-batch demo.fork \
+  --input "$scratch/inputs.jsonl" --jobs 2 >"$stdout_file" 2>/dev/null
+diff -u "$scratch/inputs.jsonl" "$stdout_file"
+
+# test: fixtures pass, and a second run is served from the test cache.
+"$repo_root/scripts/skillctl" --repo-root "$scratch" test demo.echo demo.fork --jobs 2 \
+  --report "$scratch/test-report.xml" >/dev/null 2>&1
+grep -q '<testsuite name="demo.fork" tests="1" failures="0" errors="0"' "$scratch/test-report.xml"
+"$repo_root/scripts/skillctl" --repo-root "$scratch" test demo.echo | grep -q "^PASS	demo.echo	input	cached$"
+
+# memo: deterministic skills are served from the output memo until the skill
+# tree or manifest changes; the store evicts least recently used entries.
+memo_run() {
+  printf '{"n":%s}\n' "$1" | SKILLCTL_MEMO_MAX_BYTES="${memo_budget:-}" \
+    "$repo_root/scripts/skillctl" --repo-root "$scratch" run demo.echo 2>&1 >/dev/null |
+    grep -o '"cache":"[a-z]*"'
+}
+rm -rf "$scratch/.skillctl-cache/memo"
+[[ "$(memo_run 1)" == '"cache":"miss"' ]]
+[[ "$(memo_run 1)" == '"cache":"hit"' ]]
+printf '\n# edited\n' >>"$scratch/skills/demo-echo/impl/run.sh"
+[[ "$(memo_run 1)" == '"cache":"miss"' ]]
+[[ "$(memo_run 1)" == '"cache":"hit"' ]]
+sed -i 's/^description: .*/description: Echo, edited./' "$scratch/skills/demo-echo/skill.yaml"
+[[ "$(memo_run 1)" == '"cache":"miss"' ]]
+[[ "$(memo_run 1)" == '"cache":"hit"' ]]
+
+# Entries are 7 bytes; a 20-byte budget holds two. Touching n=1 makes n=2 the LRU victim.
+rm -rf "$scratch/.skillctl-cache/memo"
+memo_budget=20
+[[ "$(memo_run 1)" == '"cache":"miss"' ]]
+[[ "$(memo_run 2)" == '"cache":"miss"' ]]
+[[ "$(memo_run 1)" == '"cache":"hit"' ]]
+[[ "$(memo_run 3)" == '"cache":"miss"' ]]
+[[ "$(memo_run 1)" == '"cache":"hit"' ]]
+[[ "$(memo_run 3)" == '"cache":"hit"' ]]
+[[ "$(memo_run 2)" == '"cache":"miss"' ]]
+unset memo_budget
+
+# Rewriting an existing key replaces its size in the running total instead of adding to it.
+"$repo_root/.venv-skillctl/bin/python" - "$repo_root/scripts/skillctl.py" "$scratch/memo-unit" <<'PY'
+import importlib.util
+import sys
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location("skillctl", sys.argv[1])
+skillctl = sys.modules["skillctl"] = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(skillctl)
+
+root = Path(sys.argv[2])
+memo = skillctl.OutputMemo(root, 1000)
+memo.put("aa" * 32, {"n": 1})
+for n in range(10, 20):
+    memo.put("bb" * 32, {"n": n})
+on_disk = sum(path.stat().st_size for path in root.rglob("*.json"))
+assert memo._total == on_disk == 7 + 8, (memo._total, on_disk)
+assert memo.get("bb" * 32) == {"n": 19}
+PY
+
+# run --output --tee: the file and stdout carry the same canonical output.
+printf '{"b":[1,{"z":2,"a":"\\u00e9"}],"a":{}}\n' >"$scratch/tee-input.json"
+"$repo_root/scripts/skillctl" --repo-root "$scratch" run demo.echo --input "$scratch/tee-input.json" \
+  --output "$scratch/tee-output.json" --tee >"$stdout_file" 2>/dev/null
+diff -u "$scratch/tee-output.json" "$stdout_file"
+[[ "$(cat "$stdout_file")" == '{"a":{},"b":[1,{"a":"\u00e9","z":2}]}' ]]
+
+# maxOutputBytes: a skill that never stops printing is killed at the cap, well
+# before its timeout, and the run fails without writing any output.
+"$repo_root/scripts/skillctl" --repo-root "$scratch" scaffold demo.flood demo-flood --spec-id smoke 2>/dev/null
+printf 'cat >/dev/null\nprintf "["\nwhile :; do printf "1,"; done\n' >"$scratch/skills/demo-flood/impl/run.sh"
+sed -i 's/^  timeoutMs: 60000$/  timeoutMs: 60000\n  maxOutputBytes: 65536/' "$scratch/skills/demo-flood/skill.yaml"
+"$repo_root/scripts/skillctl" --repo-root "$scratch" validate demo.flood >/dev/null
+flood() {
+  timeout 30 "$repo_root/scripts/skillctl" --repo-root "$scratch" run demo.flood "$@" \
+    --input "$scratch/pipe-input.json" >"$stdout_file" 2>"$scratch/flood-stderr.log"
+}
+if flood --output "$scratch/flood-output.json"; then
+  echo "expected demo.flood to exceed maxOutputBytes" >&2
+  exit 1
+fi
+grep -q '"error":"Skill stdout exceeded maxOutputBytes (65536)"' "$scratch/flood-stderr.log"
+grep -q '"status":"error"' "$scratch/flood-stderr.log"
+[[ ! -s "$stdout_file" && ! -e "$scratch/flood-output.json" ]]
+if flood --max-output-bytes 1000; then
+  echo "expected demo.flood to exceed --max-output-bytes" >&2
+  exit 1
+fi
+grep -q '"error":"Skill stdout exceeded maxOutputBytes (1000)"' "$scratch/flood-stderr.log"
+
+# validate --jobs: results land in the validate cache, are served from it on
+# the next run, and a changed I/O schema or manifest invalidates its entry.
+validate_all() { "$repo_root/scripts/skillctl" --repo-root "$scratch" validate --all --jobs 2 2>&1; }
+rm -f "$scratch/.skillctl-cache/validate.json"
+validate_all
+"$repo_root/.venv-skillctl/bin/python" - "$scratch/.skillctl-cache/validate.json" <<'PY'
+import json
+import sys
+
+path = sys.argv[1]
+data = json.load(open(path, encoding="utf-8"))
+targets = sorted(entry["target"] for entry in data["entries"].values())
+assert targets == ["skills/demo-echo", "skills/demo-flood", "skills/demo-fork"], targets
+assert all(entry["failure"] is None for entry in data["entries"].values())
+# Plant a marker: only a run that reads the cache can report it.
+for entry in data["entries"].values():
+    if entry["target"] == "skills/demo-echo":
+        entry["failure"] = "skills/demo-echo: served from cache"
+json.dump(data, open(path, "w", encoding="utf-8"))
+PY
+[[ "$(validate_all)" == *"- skills/demo-echo: served from cache"* ]]
+printf '{"type": 7}\n' >"$scratch/skills/demo-echo/schemas/input.schema.json"
+[[ "$(validate_all)" == *"- skills/demo-echo: Invalid JSON Schema at schemas/input.schema.json"* ]]
+cp "$scratch/skills/demo-fork/schemas/input.schema.json" "$scratch/skills/demo-echo/schemas/input.schema.json"
+validate_all
+sed -i 's/^version: 0.1.0$/version: one/' "$scratch/skills/demo-flood/skill.yaml"
+[[ "$(validate_all)" == *"- skills/demo-flood: "* ]]
+
+# registry: a manifest without an id is not indexed as "None"; list skips it
+# with a warning and validate --all still reports it.
+cp -R "$scratch/skills/demo-echo" "$scratch/skills/demo-noid"
+sed -i '/^id: /d' "$scratch/skills/demo-noid/skill.yaml"
+listed="$("$repo_root/scripts/skillctl" --repo-root "$scratch" list --json 2>"$scratch/list-stderr.log")"
+[[ "$listed" != *'"None"'* && "$listed" != *demo-noid* ]]
+grep -q "^Skipping skills/demo-noid: skill.yaml is missing id$" "$scratch/list-stderr.log"
+if "$repo_root/scripts/skillctl" --repo-root "$scratch" run None --input "$scratch/pipe-input.json" 2>/dev/null; then
+  echo "expected no skill to resolve as id None" >&2
+  exit 1
+fi
+[[ "$(validate_all)" == *"- skills/demo-noid: "* ]]
+
+# worker: an NDJSON worker answers the ping health check, is recycled after
+# maxRequests, and is killed (then replaced) on a timeout or a protocol error.
+"$repo_root/scripts/skillctl" --repo-root "$scratch" scaffold demo.worker demo-worker --spec-id smoke 2>/dev/null
+cat >"$scratch/skills/demo-worker/impl/worker.py" <<'PY'
+import json
+import os
+import sys
+import time
+
+for line in sys.stdin:
+    request = json.loads(line)
+    if request.get("ping"):
+        reply = {"id": request["id"], "pong": os.environ.get("SMOKE_WORKER_NO_PONG") is None}
+    else:
+        item = request["input"]
+        time.sleep(item.get("sleep", 0))
+        if item.get("garble"):
+            sys.stdout.write("not json\n")
+            sys.stdout.flush()
+            continue
+        reply = {"id": request["id"], "output": {"n": item.get("n"), "pid": os.getpid()}}
+    sys.stdout.write(json.dumps(reply) + "\n")
+    sys.stdout.flush()
+PY
+"$repo_root/.venv-skillctl/bin/python" - "$scratch/skills/demo-worker/skill.yaml" <<'PY'
+import sys
+path = sys.argv[1]
+text = open(path, encoding="utf-8").read()
+text = text.replace("  type: command\n  command:\n    - sh\n    - impl/run.sh\n", "  type: python\n  command:\n    - python3\n    - impl/worker.py\n")
+text = text.replace("  timeoutMs: 60000\n", "  timeoutMs: 1000\n  mode: worker\n  worker:\n    maxRequests: 2\n    startupTimeoutMs: 5000\n", 1)
+open(path, "w", encoding="utf-8").write(text)
+PY
+"$repo_root/scripts/skillctl" --repo-root "$scratch" validate demo.worker >/dev/null
+printf '{"n":1}\n{"n":2}\n{"n":3}\n{"sleep":3}\n{"n":5}\n{"garble":true}\n{"n":7}\n' >"$scratch/worker-inputs.jsonl"
+"$repo_root/scripts/skillctl" --repo-root "$scratch" --no-cache run-batch demo.worker \
+  --input "$scratch/worker-inputs.jsonl" --jobs 1 >"$stdout_file" 2>"$scratch/worker-stderr.log" && exit 1
+"$repo_root/.venv-skillctl/bin/python" - "$stdout_file" "$scratch/worker-stderr.log" <<'PY'
+import json
+import sys
+
+outputs = [json.loads(line) for line in open(sys.argv[1], encoding="utf-8")]
+report = json.loads(open(sys.argv[2], encoding="utf-8").read().splitlines()[-1])
+assert report["runtimeMode"] == "worker", report
+items = report["items"]
+assert [item["status"] for item in items] == ["success", "success", "success", "timeout", "success", "error", "success"], items
+assert "timed out after 1000 ms" in items[3]["error"], items[3]
+assert "not valid JSON" in items[5]["error"], items[5]
+pids = [output["pid"] if output else None for output in outputs]
+assert [output["n"] if output else None for output in outputs] == [1, 2, 3, None, 5, None, 7], outputs
+# maxRequests: 2 recycles after two requests; a killed worker is never reused.
+assert pids[0] == pids[1] != pids[2], pids
+assert pids[4] not in (pids[0], pids[2]), pids
+assert pids[6] not in (pids[0], pids[2], pids[4]), pids
+PY
+"$repo_root/scripts/skillctl" --repo-root "$scratch" --no-cache run demo.worker \
+  --input "$scratch/pipe-input.json" >/dev/null 2>"$scratch/worker-stderr.log"
+grep -q '"runtimeMode":"worker"' "$scratch/worker-stderr.log"
+if SMOKE_WORKER_NO_PONG=1 "$repo_root/scripts/skillctl" --repo-root "$scratch" --no-cache run demo.worker \
+  --input "$scratch/pipe-input.json" >/dev/null 2>"$scratch/worker-stderr.log"; then
+  echo "expected a worker without pong to fail its health check" >&2
+  exit 1
+fi
+grep -q '"error":"Skill worker failed its health check"' "$scratch/worker-stderr.log"
+
+# validators.json: schemas that passed the meta-schema check are remembered per
+# jsonschema version and content hash; --no-cache neither reads nor writes it.
+"$repo_root/scripts/skillctl" --repo-root "$scratch" scaffold demo.schema demo-schema --spec-id smoke 2>/dev/null
+validators="$scratch/.skillctl-cache/validators.json"
+schema_run() {
+  "$repo_root/scripts/skillctl" --repo-root "$scratch" "$@" run demo.schema \
+    --input "$scratch/pipe-input.json" >/dev/null 2>"$scratch/schema-stderr.log"
+}
+rm -f "$validators"
+schema_run
+"$repo_root/.venv-skillctl/bin/python" - "$validators" "$scratch/skills/demo-schema/schemas/input.schema.json" <<'PY'
+import hashlib
+import json
+import sys
+from importlib.metadata import version
+
+data = json.load(open(sys.argv[1], encoding="utf-8"))
+schema = json.load(open(sys.argv[2], encoding="utf-8"))
+key = hashlib.sha256((json.dumps(schema, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")).hexdigest()
+assert data["jsonschema"] == version("jsonschema"), data
+assert key in data["checked"], data
+PY
+
+# Swap in a schema the meta-schema rejects ("minimum" must be a number) but that
+# still validates an object, and mark its hash as checked: a reused entry skips
+# check_schema, so only a run that reads validators.json accepts it.
+printf '{"type": "object", "minimum": "x"}\n' >"$scratch/skills/demo-schema/schemas/input.schema.json"
+plant() {
+  "$repo_root/.venv-skillctl/bin/python" - "$validators" "$1" <<'PY'
+import hashlib
+import json
+import sys
+
+path, library = sys.argv[1], sys.argv[2]
+data = json.load(open(path, encoding="utf-8"))
+schema = {"type": "object", "minimum": "x"}
+data["checked"].append(hashlib.sha256((json.dumps(schema, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")).hexdigest())
+if library != "-":
+    data["jsonschema"] = library
+json.dump(data, open(path, "w", encoding="utf-8"))
+PY
+}
+schema_run && exit 1
+grep -q "is not of type 'number'" "$scratch/schema-stderr.log"
+plant -
+schema_run
+cp "$validators" "$scratch/validators.before"
+schema_run --no-cache && exit 1
+grep -q "is not of type 'number'" "$scratch/schema-stderr.log"
+cmp -s "$validators" "$scratch/validators.before"
+# Entries recorded under another jsonschema version are ignored.
+plant 0.0.0-other
+schema_run && exit 1
+# Changed schema content is a different key and is checked again.
+plant -
+printf '{"type": "object", "minimum": "y"}\n' >"$scratch/skills/demo-schema/schemas/input.schema.json"
+schema_run && exit 1
+grep -q "is not of type 'number'" "$scratch/schema-stderr.log"
@@ -0,0 +1,46 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Startup budget for read-only skillctl commands, measured with
+# `python -X importtime` (sum of top-level imports, best of 3 runs).
+# Override the budget with SKILLCTL_IMPORT_BUDGET_MS on slow machines.
+
+repo_root="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+
+if [[ ! -x "$repo_root/.venv-skillctl/bin/python" ]]; then
+  "$repo_root/scripts/setup-skillctl-venv.sh" >/dev/null
+fi
+
+python_bin="$repo_root/.venv-skillctl/bin/python"
+budget_ms="${SKILLCTL_IMPORT_BUDGET_MS:-80}"
+trace_file="$(mktemp)"
+trap 'rm -f "$trace_file"' EXIT
+
+check() {
+  local best_us=""
+  for _ in 1 2 3; do
+    "$python_bin" -X importtime "$repo_root/scripts/skillctl.py" "$@" 2>"$trace_file" >/dev/null
+
+    # Heavy modules only the validating/executing commands may import.
+    if grep -Eq '\| +(jsonschema|multiprocessing|concurrent\.futures)$' "$trace_file"; then
+      echo "skillctl $*: imports jsonschema/multiprocessing/concurrent.futures on a read-only path" >&2
+      exit 1
+    fi
+
+    local total_us
+    total_us="$(awk -F'|' '/^import time:/ && $3 ~ /^ [^ ]/ { sum += $2 } END { print sum + 0 }' "$trace_file")"
+    if [[ -z "$best_us" || "$total_us" -lt "$best_us" ]]; then
+      best_us="$total_us"
+    fi
+  done
+
+  if (( best_us > budget_ms * 1000 )); then
+    echo "skillctl $*: imports took $((best_us / 1000)) ms (budget ${budget_ms} ms)" >&2
+    exit 1
+  fi
+  echo "skillctl $*: $((best_us / 1000)) ms of imports (budget ${budget_ms} ms)"
+}
+
+check list
+check list --json
+check describe --allow-template "$repo_root/skills/_template"
@@ -0,0 +1,153 @@
+"""Unit tests for the UIP source lexer and scanner (scripts/uip_scan.py).
+
+Run with: python3 -m unittest discover -s tests -p 'test_*.py'
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from uip_scan import MultiTokenScanner, TokenRule, mask_source  # noqa: E402
+
+
+def specs(text: str, language: str) -> list[str]:
+    return [spec for _, spec in mask_source(text, language).imports]
+
+
+def rule(token: str, context: str, regex: bool = False) -> TokenRule:
+    return TokenRule("TEST", token, (token,), "", frozenset({"any"}), context=context, regex=regex)
+
+
+class JsMaskingTest(unittest.TestCase):
+    def test_views_preserve_offsets(self) -> None:
+        text = 'const a = "<div>"; // <div\n/* <form\n */ const re = /<div/g;\n`x ${"<input"} y`\n'
+        masked = mask_source(text, "js")
+        self.assertEqual(len(masked.code), len(text))
+        self.assertEqual(len(masked.text), len(text))
+        newlines = [i for i, c in enumerate(text) if c == "\n"]
+        self.assertEqual([i for i, c in enumerate(masked.code) if c == "\n"], newlines)
+
+    def test_comments_removed_from_text_and_code(self) -> None:
+        masked = mask_source("x(); // <div here\n/* <form\n   more */ y();\n", "js")
+        for view in (masked.text, masked.code):
+            self.assertNotIn("<div", view)
+            self.assertNotIn("<form", view)
+            self.assertIn("y();", view)
+
+    def test_strings_blanked_in_code_only(self) -> None:
+        masked = mask_source("const c = 'bg-red-500'; el.className=\"x\";\n", "js")
+        self.assertNotIn("bg-red-500", masked.code)
+        self.assertIn("bg-red-500", masked.text)
+        self.assertIn('className="', masked.code)
+
+    def test_comment_markers_inside_strings_are_not_comments(self) -> None:
+        masked = mask_source('const url = "http://x/*y"; const z = <div/>;\n', "js")
+        self.assertIn("<div", masked.code)
+
+    def test_template_literals_and_interpolation(self) -> None:
+        masked = mask_source("const t = `<div ${ {a: `<form`}.a } <input`; <select/>\n", "js")
+        self.assertNotIn("<div", masked.code)
+        self.assertNotIn("<form", masked.code)
+        self.assertNotIn("<input", masked.code)
+        self.assertIn("{a:", masked.code)
+        self.assertIn("<select", masked.code)
+
+    def test_regex_literal_versus_division(self) -> None:
+        masked = mask_source("const r = /<div>/g; const q = a / b / c; return /<form/.test(s);\n", "js")
+        self.assertNotIn("<div", masked.code)
+        self.assertNotIn("<form", masked.code)
+        self.assertIn("a / b / c", masked.code)
+
+    def test_jsx_apostrophe_is_not_a_string(self) -> None:
+        masked = mask_source("const x = <p>it's <div/></p>;\n", "js")
+        self.assertIn("<div", masked.code)
+
+    def test_import_specifiers(self) -> None:
+        text = (
+            'import React from "react";\n'
+            "import './side-effect';\n"
+            'export { a } from "ui-adapters/a";\n'
+            'const b = require("renderer/b");\n'
+            'const c = await import("ui-patterns/c");\n'
+            'jest.mock("renderers/d");\n'
+            'const s = "ui-adapters/not-an-import";\n'
+            '// import x from "ui-adapters/commented";\n'
+        )
+        self.assertEqual(
+            specs(text, "js"),
+            ["react", "./side-effect", "ui-adapters/a", "renderer/b", "ui-patterns/c", "renderers/d"],
+        )
+
+
+class PythonMaskingTest(unittest.TestCase):
+    def test_comments_and_strings(self) -> None:
+        text = 'x = "<div>"  # <form\ny = r\'<input\'\nz = """\n<select\n"""\nw = f"{a}<button"\n'
+        masked = mask_source(text, "python")
+        self.assertEqual(len(masked.code), len(text))
+        for token in ("<div", "<form", "<input", "<select", "<button"):
+            self.assertNotIn(token, masked.code)
+        self.assertNotIn("<form", masked.text)
+        self.assertIn("<select", masked.text)
+
+    def test_hash_inside_string_is_not_a_comment(self) -> None:
+        masked = mask_source('x = "#fff"; className = 1\n', "python")
+        self.assertIn("className", masked.code)
+
+    def test_absolute_imports(self) -> None:
+        text = "import os.path as p, json\nfrom concepts.billing import api\nimport (a)\n"
+        self.assertEqual(specs(text, "python"), ["os/path/", "json/", "concepts/billing/", "a/"])
+
+    def test_relative_imports(self) -> None:
+        text = "from . import a\nfrom .b import c\nfrom ..skills import x\nfrom ...renderer.v import y\n"
+        self.assertEqual(specs(text, "python"), ["./", "./b/", "../skills/", "../../renderer/v/"])
+
+    def test_parenthesized_import_list(self) -> None:
+        text = "from ui_adapters.button import (\n    Button,\n    Link,\n)\n"
+        self.assertEqual(specs(text, "python"), ["ui_adapters/button/"])
+
+    def test_dynamic_imports(self) -> None:
+        text = 'm = importlib.import_module("renderer.core")\nn = __import__("react")\n'
+        self.assertEqual(specs(text, "python"), ["renderer/core/", "react/"])
+
+    def test_imports_in_strings_and_comments_are_ignored(self) -> None:
+        text = '# from renderer import x\ndoc = """\nimport renderer\n"""\n'
+        self.assertEqual(specs(text, "python"), [])
+
+
+class ScannerTest(unittest.TestCase):
+    def test_contexts_and_positions(self) -> None:
+        scanner = MultiTokenScanner(
+            [
+                rule("<div", "code"),
+                rule("tailwind", "text"),
+                rule("<form", "raw"),
+                rule(r"^\.\./skills/", "import", True),
+            ]
+        )
+        text = "// tailwind <form\nconst a = <div/>;\nconst b = 'tailwind';\n"
+        hits = [(hit.rule.rule, hit.line, hit.column) for hit in scanner.scan_text(text, {"any"}, "js").hits]
+        self.assertEqual(hits, [("<form", 1, 13), ("<div", 2, 11), ("tailwind", 3, 12)])
+
+        py_hits = scanner.scan_text("from ..skills import x\n", {"any"}, "python").hits
+        self.assertEqual([(hit.rule.rule, hit.line) for hit in py_hits], [(r"^\.\./skills/", 1)])
+
+    def test_roles_filter_rules(self) -> None:
+        scoped = TokenRule("TEST", "div", ("<div",), "", frozenset({"skill"}), context="code")
+        scanner = MultiTokenScanner([scoped])
+        self.assertEqual(scanner.scan_text("<div", {"agent"}, "js").hits, ())
+        self.assertEqual(len(scanner.scan_text("<div", {"skill"}, "js").hits), 1)
+
+    def test_longer_literal_token_wins(self) -> None:
+        scanner = MultiTokenScanner([rule("<in", "code"), rule("<input", "code")])
+        hits = scanner.scan_text("<input", {"any"}, "js").hits
+        self.assertEqual([hit.rule.rule for hit in hits], ["<input"])
+
+    def test_non_source_files_use_raw_text(self) -> None:
+        scanner = MultiTokenScanner([rule("<div", "code")])
+        self.assertEqual(len(scanner.scan_text("<!-- <div -->", {"any"}, None).hits), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
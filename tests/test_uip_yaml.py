@@ -0,0 +1,58 @@
+"""Unit tests for the minimal YAML reader (scripts/uip_yaml.py).
+
+Run with: python3 -m unittest discover -s tests -p 'test_*.py'
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from uip_yaml import YamlError, load_yaml  # noqa: E402
+
+
+def parse(text: str):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "doc.yaml"
+        path.write_text(text, encoding="utf-8")
+        return load_yaml(path)
+
+
+class BlockListTest(unittest.TestCase):
+    def test_scalar_items(self) -> None:
+        self.assertEqual(parse("match:\n  - form.submitted\n  - 3\n"), {"match": ["form.submitted", 3]})
+
+    def test_bare_dash_opens_a_mapping_item(self) -> None:
+        text = "participants:\n  -\n    concept: billing\n    handler: charge\n  -\n    concept: audit\n    handler: log\n"
+        self.assertEqual(
+            parse(text),
+            {
+                "participants": [
+                    {"concept": "billing", "handler": "charge"},
+                    {"concept": "audit", "handler": "log"},
+                ]
+            },
+        )
+
+    def test_bare_dash_with_trailing_space_and_comment(self) -> None:
+        self.assertEqual(parse("items:\n  -   # first\n    id: a\n"), {"items": [{"id": "a"}]})
+
+    def test_bare_dash_without_body_is_null(self) -> None:
+        self.assertEqual(parse("items:\n  -\n  - x\n"), {"items": [None, "x"]})
+
+    def test_nested_lists_under_a_bare_dash(self) -> None:
+        text = "renderers:\n  -\n    id: web\n    sources:\n      - a\n      - b\n"
+        self.assertEqual(parse(text), {"renderers": [{"id": "web", "sources": ["a", "b"]}]})
+
+    def test_dash_prefixed_scalars_are_not_list_items(self) -> None:
+        self.assertEqual(parse("flag: -x\nrange: 1-2\n"), {"flag": "-x", "range": "1-2"})
+
+    def test_inline_mapping_items_are_rejected(self) -> None:
+        with self.assertRaises(YamlError):
+            parse("items:\n  - id: a\n    name: b\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+scanner="$repo_root/scripts/check-uip-boundaries.py"
+work_dir="$(mktemp -d)"
+trap 'rm -rf "$work_dir"' EXIT
+
+scan() {
+  # Prints the violation count and the --stats line; the scan itself fails on violations.
+  python3 "$scanner" --root "$work_dir" --cache "$work_dir/cache.json" --stats "$@" 2>"$work_dir/err" || true
+  echo "$(grep -c '^UIP-BOUNDARY-VIOLATION' "$work_dir/err" || true) $(grep '^boundary scan:' "$work_dir/err")"
+}
+git_() { git -C "$work_dir" -c user.name=test -c user.email=test@example.com "$@"; }
+
+mkdir -p "$work_dir/skills/demo" "$work_dir/agents"
+printf 'export const a = "<div>";\nconst el = <div className="x" />;\n' >"$work_dir/skills/demo/view.tsx"
+printf 'import x from "ui-adapters/button";\n' >"$work_dir/agents/plan.ts"
+printf 'export const ok = 1;\n' >"$work_dir/skills/demo/clean.ts"
+git_ init -q
+git_ add -A
+git_ commit -qm base
+
+# First scan lexes everything; the second reuses every result without lexing.
+[[ "$(scan)" == "3 boundary scan: 3 files, 3 lexed, 0 from cache" ]]
+[[ "$(scan)" == "3 boundary scan: 3 files, 0 lexed, 3 from cache" ]]
+
+# Branch switch A -> B -> A: only content never seen before is lexed.
+git_ checkout -qb other
+printf 'export const ok = 2;\n' >"$work_dir/skills/demo/clean.ts"
+git_ commit -qam other
+[[ "$(scan)" == "3 boundary scan: 3 files, 1 lexed, 2 from cache" ]]
+git_ checkout -q -
+[[ "$(scan)" == "3 boundary scan: 3 files, 0 lexed, 3 from cache" ]]
+
+# Same bytes under other roles (agents/ also gets the adapter-import rule) are lexed again.
+cp "$work_dir/skills/demo/view.tsx" "$work_dir/agents/view.tsx"
+[[ "$(scan)" == "5 boundary scan: 4 files, 1 lexed, 3 from cache" ]]
+
+# --changed scans only what scripts/changed-files.sh reports (here: the untracked copy).
+[[ "$(scan --changed)" == "2 boundary scan: 1 files, 0 lexed, 1 from cache" ]]
+printf 'const b = <button />;\n' >>"$work_dir/skills/demo/clean.ts"
+[[ "$(scan --changed)" == "3 boundary scan: 2 files, 1 lexed, 1 from cache" ]]
+
+# Markup tokens are matched in code only: markup built in string literals (e.g. an
+# innerHTML assignment) and in comments is deliberately not flagged. Tailwind
+# patterns still match inside strings.
+mkdir -p "$work_dir/skills/pin"
+cat >"$work_dir/skills/pin/view.ts" <<'TS'
+el.innerHTML = "<div class='card'>";
+// <button> in a comment
+const cls = "bg-red-500";
+const f = <form />;
+TS
+python3 "$scanner" --root "$work_dir" --no-cache 2>"$work_dir/err" || true
+grep '^UIP-BOUNDARY-VIOLATION | file: skills/pin/' "$work_dir/err" >"$work_dir/pin"
+cat >"$work_dir/expected" <<'TXT'
+UIP-BOUNDARY-VIOLATION | file: skills/pin/view.ts:3 | rule: UIP violation: UI markup or styling detected outside adapter layer (Tailwind class patterns) | suggestion: Move UI markup/styling into ui-adapters/ or renderer/ allowlisted paths.
+UIP-BOUNDARY-VIOLATION | file: skills/pin/view.ts:4 | rule: UIP violation: UI markup or styling detected outside adapter layer (HTML/JSX <form) | suggestion: Move UI markup/styling into ui-adapters/ or renderer/ allowlisted paths.
+TXT
+diff -u "$work_dir/expected" "$work_dir/pin"
+
+# Like the rg scans it replaced, a full scan in a git worktree skips .gitignore'd files.
+mkdir -p "$work_dir/skills/generated"
+printf 'const g = <div />;\n' >"$work_dir/skills/generated/out.tsx"
+python3 "$scanner" --root "$work_dir" --no-cache 2>"$work_dir/err" || true
+grep -q 'skills/generated/out.tsx:1' "$work_dir/err"
+echo 'skills/generated/' >"$work_dir/.gitignore"
+python3 "$scanner" --root "$work_dir" --no-cache 2>"$work_dir/err" || true
+if grep -q 'skills/generated/' "$work_dir/err"; then
+  echo "expected .gitignore'd files to be skipped" >&2
+  exit 1
+fi
+grep -q 'skills/pin/view.ts:4' "$work_dir/err"
+
+echo "uip boundaries OK"
@@ -0,0 +1,85 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+work_dir="$(mktemp -d)"
+trap 'rm -rf "$work_dir"' EXIT
+
+# The discovery index is rooted at the scripts' checkout, so run copies in a scratch tree.
+mkdir -p "$work_dir/scripts" "$work_dir/ui-artifacts" "$work_dir/synchronizations"
+cp "$repo_root"/scripts/{check-uip-event-syncs.py,uip_discovery.py,uip_yaml.py} "$work_dir/scripts/"
+export UIP_DISCOVERY_INDEX="$work_dir/index.json"
+check() { python3 "$work_dir/scripts/check-uip-event-syncs.py" "$@"; }
+
+event() { printf '{"type": "%s", "payload": {}}\n' "$2" >"$work_dir/ui-artifacts/$1.event.json"; }
+sync() {
+  local name="$1"
+  shift
+  {
+    printf 'trigger:\n  source: ui_event\n  field: type\n  match:\n'
+    printf '    - %s\n' "$@"
+    printf 'participants:\n  -\n    concept: demo\n    handler: handle\n'
+    printf 'mapping:\n  target:\n    fields:\n      payload: event.payload\n'
+    printf 'constraints:\n  idempotent: true\n  authScope: demo\n'
+  } >"$work_dir/synchronizations/$name.yaml"
+}
+
+event a table.rowSelected
+event b action.clicked
+event c form.submitted
+event e form.submitted
+echo '{"intent": "demo"}' >"$work_dir/ui-artifacts/d.intent.json"
+sync s1 form.submitted
+sync s2 form.submitted modal.confirmed
+sync s3 modal.confirmed modal.cancelled
+
+# Default mode stops at the first uncovered type in discovery order (a.event.json), not alphabetically.
+if check 2>"$work_dir/err"; then
+  echo "expected uncovered event types to fail" >&2
+  exit 1
+fi
+grep -q "ui-artifacts/a.event.json | rule: UIP violation: UIEvent type 'table.rowSelected' has no synchronization" \
+  "$work_dir/err"
+
+check --report --json >"$work_dir/report.json" && exit 1
+python3 - "$work_dir/report.json" <<'PY'
+import json
+import sys
+
+report = json.load(open(sys.argv[1], encoding="utf-8"))
+types, summary = report["types"], report["summary"]
+assert types["form.submitted"]["status"] == "over-covered", types["form.submitted"]
+assert types["form.submitted"]["events"] == 2
+assert types["form.submitted"]["syncs"] == ["synchronizations/s1.yaml", "synchronizations/s2.yaml"]
+# Matched by several manifests but never observed: unobserved, not over-covered.
+assert types["modal.confirmed"]["status"] == "unobserved", types["modal.confirmed"]
+assert types["modal.cancelled"]["status"] == "unobserved"
+assert summary["uncovered"] == ["table.rowSelected", "action.clicked"], summary["uncovered"]
+assert summary["overCovered"] == ["form.submitted"]
+assert summary["unusedSyncs"] == ["synchronizations/s3.yaml"]
+assert summary["events"] == 4 and summary["syncs"] == 3
+PY
+
+check --report --json --max-syncs-per-type 2 >"$work_dir/report.json" || true
+grep -q '"overCovered": \[\]' "$work_dir/report.json"
+
+check --report >"$work_dir/report.txt" || true
+grep -Eq '^- form\.submitted +events=2 +over-covered +synchronizations/s1\.yaml, synchronizations/s2\.yaml$' \
+  "$work_dir/report.txt"
+grep -q '^- synchronizations/s3.yaml: events=0 match=modal.cancelled,modal.confirmed  \[matches no observed UIEvent\]$' \
+  "$work_dir/report.txt"
+
+# Once every observed type is routed, both modes pass.
+sync s4 table.rowSelected action.clicked
+check
+check --report >/dev/null
+
+# Invalid intent JSON still fails the check (as discover-uip-artifacts.py does).
+echo '{"intent": ' >"$work_dir/ui-artifacts/d.intent.json"
+if check 2>"$work_dir/err"; then
+  echo "expected invalid intent JSON to fail" >&2
+  exit 1
+fi
+grep -q 'ui-artifacts/d.intent.json | rule: valid-json' "$work_dir/err"
+
+echo "uip event syncs OK"
@@ -0,0 +1,96 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+work_dir="$(mktemp -d)"
+trap 'rm -rf "$work_dir"' EXIT
+
+# The discovery index is rooted at the scripts' checkout, so run copies in a scratch tree.
+mkdir -p "$work_dir/scripts" "$work_dir/ui-artifacts"
+cp "$repo_root"/scripts/{check-uip-shadow.py,uip_discovery.py,uip_yaml.py} "$work_dir/scripts/"
+export UIP_DISCOVERY_INDEX="$work_dir/index.json"
+shadow() { python3 "$work_dir/scripts/check-uip-shadow.py" "$@"; }
+artifacts="$work_dir/ui-artifacts"
+
+cat >"$artifacts/a.intent.json" <<'JSON'
+{
+  "schemaVersion": "0.1.0",
+  "id": "intent-a",
+  "type": "form.create",
+  "purpose": {"summary": "Collect  details"},
+  "payload": {}
+}
+JSON
+printf '{"schemaVersion":"0.1.0","id":"e1","ts":"2026-01-01T00:00:00Z","intentId":"intent-a","type":"form.submitted","uiSessionId":"s","idempotencyKey":"k","payload":{}}' \
+  >"$artifacts/b.event.json"
+# Unknown type: not mechanically fixable, left for a human.
+printf '{"schemaVersion": "0.2.0", "id": "i2", "type": "bogus", "purpose": {"summary": "x"}, "payload": {}, "components": {}}\n' \
+  >"$artifacts/c.intent.json"
+cp "$artifacts/a.intent.json" "$work_dir/a.before"
+cp "$artifacts/b.event.json" "$work_dir/b.before"
+
+# --migrate only prints a diff touching the changed lines; nothing is written.
+shadow --migrate >"$work_dir/diff" 2>"$work_dir/err"
+grep -q '2 artifact(s) can be migrated automatically; 1 need manual edits.' "$work_dir/err"
+cmp -s "$artifacts/a.intent.json" "$work_dir/a.before"
+python3 - "$work_dir/diff" <<'PY'
+import sys
+
+lines = open(sys.argv[1], encoding="utf-8").read().splitlines()
+removed = [line for line in lines if line.startswith("-") and not line.startswith("---")]
+added = [line for line in lines if line.startswith("+") and not line.startswith("+++")]
+assert removed == [
+    '-  "schemaVersion": "0.1.0",',
+    '-  "payload": {}',
+    '-{"schemaVersion":"0.1.0","id":"e1","ts":"2026-01-01T00:00:00Z","intentId":"intent-a","type":"form.submitted",'
+    '"uiSessionId":"s","idempotencyKey":"k","payload":{}}',
+], removed
+assert added == [
+    '+  "schemaVersion": "0.2.0",',
+    '+  "payload": {},',
+    '+  "components": {}',
+    '+{"schemaVersion":"0.2.0","id":"e1","ts":"2026-01-01T00:00:00Z","intentId":"intent-a","type":"form.submitted",'
+    '"uiSessionId":"s","idempotencyKey":"k","payload":{}}',
+], added
+assert "\\ No newline at end of file" in lines
+PY
+
+# --apply rewrites in place through a temp file: layout and mode kept, no temp files left behind.
+chmod 640 "$artifacts/a.intent.json"
+shadow --migrate --apply >"$work_dir/out"
+grep -q '^Migrated 2 artifact(s) to UIP-0.2; 1 need manual edits.$' "$work_dir/out"
+grep -q '^- ui-artifacts/c.intent.json: type must be a supported intent type$' "$work_dir/out"
+grep -q '"purpose": {"summary": "Collect  details"},' "$artifacts/a.intent.json"
+[[ "$(stat -c %a "$artifacts/a.intent.json")" == 640 ]]
+[[ -z "$(find "$artifacts" -name '*.tmp')" ]]
+shadow --migrate >"$work_dir/diff" 2>"$work_dir/err"
+grep -q '0 artifact(s) can be migrated automatically; 1 need manual edits.' "$work_dir/err"
+[[ ! -s "$work_dir/diff" ]]
+
+# A file removed between planning and apply is reported on its own; the other writes still land.
+cp "$work_dir/a.before" "$artifacts/a.intent.json"
+cp "$work_dir/b.before" "$artifacts/b.event.json"
+python3 - "$work_dir/scripts/check-uip-shadow.py" "$artifacts" <<'PY'
+import importlib.util
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(sys.argv[1]).parent))
+spec = importlib.util.spec_from_file_location("check_uip_shadow", sys.argv[1])
+shadow = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(shadow)
+
+artifacts = Path(sys.argv[2])
+current = shadow.load_current_profile()
+outcomes = [
+    shadow.evaluate(artifacts / name, kind, current, True)
+    for name, kind in (("a.intent.json", "intent"), ("b.event.json", "event"))
+]
+(artifacts / "a.intent.json").unlink()
+errors = [shadow.apply_rewrite(outcome) for outcome in outcomes]
+assert errors[0] is not None and errors[0].startswith("unreadable:"), errors
+assert errors[1] is None, errors
+assert '"schemaVersion":"0.2.0"' in (artifacts / "b.event.json").read_text(encoding="utf-8")
+PY
+
+echo "uip shadow migrate OK"
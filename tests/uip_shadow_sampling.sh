@@ -0,0 +1,50 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+repo_root="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+work_dir="$(mktemp -d)"
+trap 'rm -rf "$work_dir"' EXIT
+
+# The discovery index is rooted at the scripts' checkout, so run copies in a scratch tree.
+mkdir -p "$work_dir/scripts" "$work_dir/ui-artifacts"
+cp "$repo_root"/scripts/{check-uip-shadow.py,uip_discovery.py,uip_yaml.py} "$work_dir/scripts/"
+export UIP_DISCOVERY_INDEX="$work_dir/index.json"
+shadow() { python3 "$work_dir/scripts/check-uip-shadow.py" "$@"; }
+
+# 20 events, 6 of them still on the current schema version (and so failing UIP-0.2).
+for i in $(seq 1 20); do
+  version="0.2.0"
+  (( i % 10 < 3 )) && version="1.0.0"
+  printf '{"schemaVersion":"%s","id":"e%s","ts":"2026-01-01T00:00:00Z","intentId":"i","type":"form.submitted","uiSessionId":"s","idempotencyKey":"k%s","payload":{}}\n' \
+    "$version" "$i" "$i" >"$work_dir/ui-artifacts/e$i.event.json"
+done
+grep -q '^6 artifact(s) would fail under UIP-0.2.$' <<<"$(shadow)"
+
+# A fixed seed gives identical output across runs, whatever the concurrency.
+for mode in "--sample 7" "--fraction 0.4"; do
+  first="$(shadow $mode --seed 3)"
+  [[ "$first" == "$(shadow $mode --seed 3 --jobs 1)" ]]
+  [[ "$first" == "$(shadow $mode --seed 3 --jobs 8)" ]]
+  [[ "$first" != "$(shadow $mode --seed 4)" ]]
+done
+
+# Sampling the whole corpus is a census: the rate is exact and the
+# finite-population correction collapses the interval onto it.
+census="$(shadow --sample 20)"
+grep -q '^- would fail under UIP-0.2: 6/20 sampled, 30.0% (95% CI 30.0%-30.0%), ~6 of 20$' <<<"$census"
+grep -q '^- event.schemaVersion: 6/20 sampled, 30.0% (95% CI 30.0%-30.0%), ~6 of 20$' <<<"$census"
+
+# Bernoulli samples: every interval, for each seed, contains the full-run rate of 30%.
+for seed in 1 2 3 4 5 6 7 8; do
+  shadow --fraction 0.5 --seed "$seed" --confidence 0.99 | python3 -c '
+import re
+import sys
+
+lines = [line for line in sys.stdin if line.startswith("- would fail")]
+assert len(lines) == 1, lines
+low, high = (float(v) for v in re.search(r"CI (\d+\.\d)%-(\d+\.\d)%", lines[0]).groups())
+assert low <= 30.0 <= high, lines[0]
+'
+done
+
+echo "uip shadow sampling OK"